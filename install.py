@@ -49,6 +49,7 @@ def create_config_file():
             "screen_height": 800,
             "fullscreen": False,
             "vsync": True,
+            "render_scale": 1.0,
             "sound_volume": 0.7,
             "music_volume": 0.5
         },
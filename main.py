@@ -4,26 +4,64 @@ El Códice Mnemónico - Juego Principal
 Un juego de aventura narrativa con puzzles cognitivos
 """
 
-import arcade
+import argparse
 import sys
 import os
 
+# Las repeticiones corren sin ventana: arcade debe saberlo antes de importarse
+if "--replay" in sys.argv:
+    os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+import arcade
+
 # Agregar el directorio src al path para imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from game.game_window import GameWindow
-from utils.config import Config
+from utils.config import get_config, get_config_service
+from utils.logger import setup_logging
+
+def parse_args():
+    """Leer los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="El Códice Mnemónico")
+    parser.add_argument(
+        "--set", action="append", default=[], metavar="NOMBRE=VALOR",
+        help="Sobrescribir una opción de configuración (por ejemplo --set MUSIC_VOLUME=0.5)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="Semilla de la sesión (por defecto, una aleatoria)"
+    )
+    parser.add_argument(
+        "--replay", metavar="ARCHIVO",
+        help="Repetir una sesión grabada en data/replays sin ventana y a máxima velocidad"
+    )
+    return parser.parse_args()
 
 def main():
     """Función principal del juego"""
-    # Configurar la ventana del juego
-    config = Config()
+    args = parse_args()
+    
+    # Configuración: valores por defecto, data/user_config.json, entorno y línea de comandos
+    get_config_service().apply_overrides(args.set)
+    config = get_config()
+    
+    # Registro asíncrono en logs/ (el hilo del juego solo encola)
+    setup_logging(config)
+    
+    if args.replay:
+        from game.replay import run_replay
+        summary = run_replay(args.replay)
+        for key, value in summary.items():
+            print(f"{key}: {value}")
+        return
     
     # Crear y ejecutar la ventana principal
     window = GameWindow(
         config.SCREEN_WIDTH,
         config.SCREEN_HEIGHT,
-        config.SCREEN_TITLE
+        config.SCREEN_TITLE,
+        seed=args.seed
     )
     
     # Configurar el fondo
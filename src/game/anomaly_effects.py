@@ -0,0 +1,114 @@
+"""
+Efectos visuales de las anomalías sobre el puzzle
+"""
+
+import arcade
+import numpy as np
+from PIL import Image
+from typing import Any, Optional, Tuple
+from utils.config import Config
+from utils.game_clock import game_time
+
+class AnomalyEffectsRenderer:
+    """Rasteriza cada efecto una vez por activación y lo dibuja con una sola llamada"""
+
+    MASK_SCALE = 4  # La máscara se genera a 1/4 de resolución y se estira (bordes suaves)
+    FADE_IN = 0.6  # segundos
+    FADE_OUT = 1.5  # segundos antes de expirar
+    DISTRACTION_FADE = 0.2  # segundos al aparecer y desaparecer cada distracción
+
+    def __init__(self, config: Config):
+        self.config = config
+        self._mask_key: Optional[Tuple] = None
+        self._mask_texture: Optional[arcade.Texture] = None
+        self._mask_sprite: Optional[arcade.Sprite] = None
+        self._mask_sprites = arcade.SpriteList()
+        self._distraction: Optional[Any] = None
+        self._distraction_text: Optional[arcade.Text] = None
+
+    def draw(self, anomaly_manager, visibility: float = 1.0):
+        """Dibujar los efectos de las anomalías activas (visibility > 1 encoge las zonas ocultas)"""
+        active_anomalies = anomaly_manager.get_active_anomalies()
+        olvido = active_anomalies.get("el_olvido")
+        if olvido:
+            self._draw_olvido(olvido, visibility)
+        
+        ruido = active_anomalies.get("el_ruido")
+        if ruido:
+            self._draw_ruido(ruido)
+
+    def _draw_olvido(self, anomaly: Any, visibility: float):
+        """Oscurecer las áreas de El Olvido con una máscara precalculada"""
+        width, height = self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT
+        key = (id(anomaly), anomaly.activations, width, height, visibility)
+        if key != self._mask_key:
+            self._build_mask(anomaly.get_obscured_areas(), width, height, visibility, key)
+
+        self._mask_sprite.alpha = int(255 * self.fade_factor(anomaly))
+        self._mask_sprites.draw()
+
+    def _build_mask(self, areas, width: int, height: int, visibility: float, key: Tuple):
+        """Rasterizar los círculos oscurecidos en una textura RGBA"""
+        scale = self.MASK_SCALE
+        mask_width, mask_height = max(1, width // scale), max(1, height // scale)
+
+        # Centros de píxel en coordenadas de pantalla (la fila 0 de la imagen es la de arriba)
+        xs = (np.arange(mask_width) + 0.5) * scale
+        ys = height - (np.arange(mask_height) + 0.5) * scale
+        alpha = np.zeros((mask_height, mask_width), dtype=np.float32)
+
+        if areas:
+            centers_x = np.array([area['x'] for area in areas], dtype=np.float32)[:, None, None]
+            centers_y = np.array([area['y'] for area in areas], dtype=np.float32)[:, None, None]
+            radii = np.array([area['radius'] for area in areas], dtype=np.float32)[:, None, None] / visibility
+            opacity = np.clip([area['opacity'] for area in areas], 0.0, 1.0).astype(np.float32)[:, None, None]
+
+            distance = np.hypot(xs[None, None, :] - centers_x, ys[None, :, None] - centers_y) / radii
+            # Borde difuminado en el último 40% del radio
+            edge = np.clip((1.0 - distance) / 0.4, 0.0, 1.0)
+            alpha = (opacity * edge * edge * (3 - 2 * edge)).max(axis=0)
+
+        rgba = np.empty((mask_height, mask_width, 4), dtype=np.uint8)
+        rgba[..., :3] = self.config.COLORS['shadow']
+        rgba[..., 3] = (alpha * 255).astype(np.uint8)
+
+        # Soltar la máscara anterior: el atlas por defecto la libera al recolectarse la textura
+        # (no admite quitarla a mano)
+        self._mask_sprites.clear()
+
+        self._mask_texture = arcade.Texture(Image.fromarray(rgba, 'RGBA'), hash=f"olvido-mask:{key}")
+        self._mask_sprite = arcade.Sprite(self._mask_texture, center_x=width / 2, center_y=height / 2)
+        self._mask_sprite.width = width
+        self._mask_sprite.height = height
+        self._mask_sprites.append(self._mask_sprite)
+        self._mask_key = key
+
+    def _draw_ruido(self, anomaly: Any):
+        """Mostrar la distracción programada de El Ruido que toca ahora"""
+        event = anomaly.current_distraction()
+        if event is None:
+            return
+
+        # El texto se crea una vez por distracción, no en cada fotograma
+        if event is not self._distraction:
+            self._distraction = event
+            self._distraction_text = arcade.Text(
+                event.text, event.x, event.y, self.config.COLORS['error'],
+                font_size=self.config.FONT_SIZE_MEDIUM, bold=True,
+                anchor_x="center", anchor_y="center"
+            )
+
+        elapsed = anomaly.elapsed()
+        edge = min(elapsed - event.start, event.end - elapsed)
+        alpha = int(255 * min(1.0, max(0.0, edge / self.DISTRACTION_FADE)))
+        self._distraction_text.color = (*self.config.COLORS['error'], alpha)
+        self._distraction_text.draw()
+
+    def fade_factor(self, anomaly: Any) -> float:
+        """Opacidad del efecto según el tiempo desde la activación y hasta la expiración"""
+        elapsed = game_time() - anomaly.start_time
+        factor = min(1.0, max(0.0, elapsed / self.FADE_IN))
+        if anomaly.duration > 0:
+            remaining = anomaly.duration - elapsed
+            factor = min(factor, max(0.0, remaining / self.FADE_OUT))
+        return factor
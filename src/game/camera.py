@@ -0,0 +1,99 @@
+"""
+Cámara del Mapa Mental
+"""
+
+import arcade
+from typing import Optional, Tuple
+from game.render_target import get_render_target
+from utils.config import Config
+from utils.helpers import clamp
+
+class MapCamera:
+    """Cámara con desplazamiento, zoom y seguimiento del nodo actual"""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.x = config.SCREEN_WIDTH / 2
+        self.y = config.SCREEN_HEIGHT / 2
+        self.zoom = 1.0
+        self.target_zoom = 1.0
+        self.following = True
+        self.target_x = self.x
+        self.target_y = self.y
+        
+        # Posición del paso anterior, para interpolar entre pasos al dibujar
+        self.previous = (self.x, self.y, self.zoom)
+
+        # La cámara de arcade se crea al dibujar (requiere ventana)
+        self._camera: Optional[arcade.Camera2D] = None
+        self._target_generation = -1
+
+    def pan(self, dx: float, dy: float):
+        """Desplazar la cámara en pantalla (desactiva el seguimiento)"""
+        self.following = False
+        self.target_x += dx / self.target_zoom
+        self.target_y += dy / self.target_zoom
+
+    def zoom_by(self, factor: float):
+        """Multiplicar el zoom objetivo"""
+        self.target_zoom = clamp(
+            self.target_zoom * factor,
+            self.config.CAMERA_MIN_ZOOM,
+            self.config.CAMERA_MAX_ZOOM
+        )
+
+    def follow(self):
+        """Volver a seguir al nodo actual"""
+        self.following = True
+
+    def snap_to(self, x: float, y: float):
+        """Colocar la cámara inmediatamente en un punto"""
+        self.x = self.target_x = x
+        self.y = self.target_y = y
+        self.previous = (self.x, self.y, self.zoom)
+
+    def update(self, delta_time: float, focus_node=None):
+        """Acercar suavemente la cámara a su objetivo"""
+        self.previous = (self.x, self.y, self.zoom)
+        if self.following and focus_node is not None:
+            self.target_x = focus_node.x
+            self.target_y = focus_node.y
+
+        factor = min(1.0, delta_time * self.config.CAMERA_FOLLOW_SPEED)
+        self.x += (self.target_x - self.x) * factor
+        self.y += (self.target_y - self.y) * factor
+        self.zoom += (self.target_zoom - self.zoom) * factor
+
+    def visible_bounds(self, margin: float = 0.0) -> Tuple[float, float, float, float]:
+        """Obtener el rectángulo visible del mundo (izquierda, derecha, abajo, arriba)"""
+        half_width = self.config.SCREEN_WIDTH / (2 * self.zoom) + margin
+        half_height = self.config.SCREEN_HEIGHT / (2 * self.zoom) + margin
+        return (self.x - half_width, self.x + half_width,
+                self.y - half_height, self.y + half_height)
+
+    def is_low_detail(self) -> bool:
+        """Verificar si se debe usar el nivel de detalle reducido"""
+        return self.zoom < self.config.CAMERA_LOD_ZOOM
+
+    def screen_to_world(self, screen_x: float, screen_y: float) -> Tuple[float, float]:
+        """Convertir coordenadas de pantalla a coordenadas del mundo"""
+        world_x = self.x + (screen_x - self.config.SCREEN_WIDTH / 2) / self.zoom
+        world_y = self.y + (screen_y - self.config.SCREEN_HEIGHT / 2) / self.zoom
+        return world_x, world_y
+
+    def use(self, alpha: float = 1.0):
+        """Activar la cámara del mundo para dibujar (alpha interpola desde el paso anterior)"""
+        # Se rehace si cambió el framebuffer lógico (tamaño o escala de render)
+        target = get_render_target()
+        if self._camera is None or self._target_generation != target.generation:
+            self._camera = target.make_camera()
+            self._target_generation = target.generation
+        previous_x, previous_y, previous_zoom = self.previous
+        self._camera.position = (previous_x + (self.x - previous_x) * alpha,
+                                 previous_y + (self.y - previous_y) * alpha)
+        self._camera.zoom = previous_zoom + (self.zoom - previous_zoom) * alpha
+        self._camera.use()
+
+    def use_screen(self):
+        """Volver a la proyección de pantalla para la interfaz"""
+        get_render_target().use_screen()
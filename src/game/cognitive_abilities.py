@@ -2,9 +2,11 @@
 Sistema de Habilidades Cognitivas
 """
 
-import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from utils.effects_pipeline import Modifier
 from utils.config import Config
+from utils.game_clock import game_time
+from utils.content import get_content
 
 class CognitiveAbility:
     """Clase base para habilidades cognitivas"""
@@ -13,14 +15,14 @@ class CognitiveAbility:
         self.name = name
         self.description = description
         self.cooldown = cooldown
-        self.last_used = 0
+        self.last_used = float('-inf')  # El reloj de juego empieza en 0: disponible desde el inicio
         self.active = False
         self.duration = 0
         self.start_time = 0
     
     def can_use(self) -> bool:
         """Verificar si la habilidad puede ser usada"""
-        return time.time() - self.last_used >= self.cooldown
+        return game_time() - self.last_used >= self.cooldown
     
     def activate(self) -> bool:
         """Activar la habilidad"""
@@ -28,8 +30,8 @@ class CognitiveAbility:
             return False
         
         self.active = True
-        self.start_time = time.time()
-        self.last_used = time.time()
+        self.start_time = game_time()
+        self.last_used = game_time()
         return True
     
     def deactivate(self):
@@ -40,12 +42,16 @@ class CognitiveAbility:
         """Verificar si la habilidad ha expirado"""
         if not self.active:
             return False
-        return time.time() - self.start_time >= self.duration
+        return game_time() - self.start_time >= self.duration
     
     def update(self, delta_time: float):
         """Actualizar el estado de la habilidad"""
         if self.active and self.is_expired():
             self.deactivate()
+    
+    def modifier(self) -> Optional[Modifier]:
+        """Modificador que aporta mientras está activa (None si no afecta a los puzzles)"""
+        return None
 
 class PalacioMental(CognitiveAbility):
     """Habilidad para almacenar información temporalmente"""
@@ -53,7 +59,7 @@ class PalacioMental(CognitiveAbility):
     def __init__(self, config: Config):
         super().__init__(
             "Palacio Mental",
-            "Almacena información temporalmente en la interfaz",
+            get_content().ability_descriptions["palacio_mental"],
             cooldown=10.0
         )
         self.config = config
@@ -86,12 +92,15 @@ class VisionPeriferica(CognitiveAbility):
     def __init__(self, config: Config):
         super().__init__(
             "Visión Periférica",
-            "Amplía brevemente el campo de visión en puzzles de búsqueda",
+            get_content().ability_descriptions["vision_periferica"],
             cooldown=15.0
         )
         self.config = config
         self.duration = config.VISION_PERIFERICA_DURATION
         self.vision_multiplier = 2.0
+    
+    def modifier(self) -> Optional[Modifier]:
+        return Modifier(visibility_radius=self.vision_multiplier)
 
 class Enfoque(CognitiveAbility):
     """Habilidad para ralentizar el tiempo"""
@@ -99,12 +108,15 @@ class Enfoque(CognitiveAbility):
     def __init__(self, config: Config):
         super().__init__(
             "Enfoque",
-            "Ralentiza el tiempo por unos segundos",
+            get_content().ability_descriptions["enfoque"],
             cooldown=20.0
         )
         self.config = config
         self.duration = config.ENFOQUE_DURATION
         self.time_slow_factor = 0.5
+    
+    def modifier(self) -> Optional[Modifier]:
+        return Modifier(time_scale=self.time_slow_factor)
 
 class CognitiveAbilityManager:
     """Gestor de habilidades cognitivas del jugador"""
@@ -120,6 +132,15 @@ class CognitiveAbilityManager:
         
         # Habilidades desbloqueadas
         self.unlocked_abilities = {"palacio_mental"}  # Empezar con una habilidad
+        
+        # Cambia cada vez que una habilidad se activa o expira
+        self.version = 0
+    
+    def refresh_descriptions(self):
+        """Actualizar las descripciones tras recargar el contenido"""
+        descriptions = get_content().ability_descriptions
+        for ability_name, ability in self.abilities.items():
+            ability.description = descriptions.get(ability_name, ability.description)
     
     def unlock_ability(self, ability_name: str) -> bool:
         """Desbloquear una nueva habilidad"""
@@ -132,7 +153,9 @@ class CognitiveAbilityManager:
         """Usar una habilidad"""
         if (ability_name in self.unlocked_abilities and 
             ability_name in self.abilities):
-            return self.abilities[ability_name].activate()
+            if self.abilities[ability_name].activate():
+                self.version += 1
+                return True
         return False
     
     def get_ability(self, ability_name: str) -> CognitiveAbility:
@@ -142,7 +165,10 @@ class CognitiveAbilityManager:
     def update_abilities(self, delta_time: float):
         """Actualizar todas las habilidades"""
         for ability in self.abilities.values():
+            was_active = ability.active
             ability.update(delta_time)
+            if was_active and not ability.active:
+                self.version += 1
     
     def get_active_abilities(self) -> Dict[str, CognitiveAbility]:
         """Obtener habilidades activas"""
@@ -0,0 +1,62 @@
+"""
+Bucle de simulación con paso fijo, independiente de la velocidad de dibujo
+"""
+
+from typing import Callable, Iterable, Optional
+from utils.game_clock import GameClock
+from utils.logger import get_logger
+
+logger = get_logger("game")
+
+class FixedTimestepLoop:
+    """Reparte el tiempo real de cada fotograma en pasos de lógica de duración fija"""
+
+    def __init__(self, tick_rate: float, max_ticks_per_frame: int, step: Callable[[float], None],
+                 clock: GameClock):
+        self.tick_time = 1.0 / tick_rate
+        self.max_ticks_per_frame = max(1, max_ticks_per_frame)
+        self.step = step
+        self.clock = clock
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.dropped_time = 0.0  # tiempo descartado por fotogramas demasiado lentos
+
+    @property
+    def alpha(self) -> float:
+        """Fracción del siguiente paso ya transcurrida (para interpolar al dibujar)"""
+        return self.accumulator / self.tick_time
+
+    def advance(self, frame_time: float) -> int:
+        """Ejecutar los pasos que caben en el tiempo acumulado; devuelve cuántos"""
+        self.accumulator += frame_time
+        ticks = 0
+        while self.accumulator >= self.tick_time and ticks < self.max_ticks_per_frame:
+            self.step(self.tick_time)
+            self.accumulator -= self.tick_time
+            ticks += 1
+
+        # Tras un fotograma muy lento el juego se ralentiza en vez de encadenar pasos sin fin
+        if self.accumulator >= self.tick_time:
+            excess = self.accumulator - self.accumulator % self.tick_time
+            self.dropped_time += excess
+            self.accumulator -= excess
+            logger.debug("Fotograma lento: se descartan %.3f s de lógica (%.3f s en total)",
+                         excess, self.dropped_time)
+
+        self.ticks += ticks
+        self.clock.alpha = self.alpha
+        return ticks
+
+    def run_headless(self, steps: Iterable[float],
+                     before_step: Optional[Callable[[int], None]] = None) -> int:
+        """Ejecutar seguidos los pasos dados (su duración), sin ventana ni espera; devuelve cuántos"""
+        ticks = 0
+        for delta_time in steps:
+            if before_step:
+                before_step(ticks)
+            self.step(delta_time)
+            ticks += 1
+        self.ticks += ticks
+        self.accumulator = 0.0
+        self.clock.alpha = 0.0
+        return ticks
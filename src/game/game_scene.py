@@ -2,23 +2,46 @@
 Escena Principal del Juego
 """
 
+import random
 import arcade
 from typing import Optional, List
 from game.memory_map import MemoryMap
 from game.puzzle_manager import PuzzleManager
 from game.cognitive_abilities import CognitiveAbilityManager
 from game.memory_anomalies import AnomalyManager
+from game.camera import MapCamera
+from game.anomaly_effects import AnomalyEffectsRenderer
+from game.panel_compositor import get_panel_compositor
+from game.particles import Emitter, ParticleSystem
+from game.story_text import DEFEAT, STORY, VICTORY, StoryMessage, StoryPresenter
+from game.ui_widgets import Border, Button, FocusList, Label, Panel, WidgetLayer, parchment_button_style
+from utils.lighting import Light, get_light_layer, torch_lights
+from utils.tweens import TweenSystem
+from game.level_pipeline import LevelPipeline
 from utils.config import Config
+from utils.content import get_content_loader
+from utils.game_clock import get_game_clock
+from utils.logger import get_logger
+
+logger = get_logger("game")
+audio_logger = get_logger("audio")
 
 class GameScene:
     """Escena principal del juego El Códice Mnemónico"""
     
+    # Vistas que no cambian solas (solo con la entrada del jugador)
+    STATIC_STATES = ("story_view", "pause", "level_complete", "construction")
+    
     def __init__(self, config: Config):
         self.config = config
         
         # Sistemas principales
+        self.content_loader = get_content_loader()
+        # La semilla sale del generador global, que GameWindow siembra con la de la sesión
+        self.level_pipeline = LevelPipeline(config, seed=random.getrandbits(32))
         self.memory_map = MemoryMap(config)
         self.puzzle_manager = PuzzleManager(config)
+        self.puzzle_registry = self.puzzle_manager.puzzle_factory.registry
         self.ability_manager = self.puzzle_manager.ability_manager
         self.anomaly_manager = self.puzzle_manager.anomaly_manager
         
@@ -27,12 +50,36 @@ class GameScene:
         self.current_node = None
         self.story_text = ""
         self.show_story = False
+        self.story = StoryPresenter(config)  # maquetado y revelado del mensaje de historia
         self.level_complete = False
-        self.selected_pause_button = 0  # 0: Reanudar, 1: Salir al mapa
+        self.level = 1
+        self.level_name = ""
         
         # UI
         self.ui_elements = {}
         self.selected_ability = None
+        # Pantallas con botones (se crean en setup_ui)
+        self.pause_buttons: Optional[FocusList] = None  # Reanudar, Salir al mapa
+        self.level_complete_buttons: Optional[FocusList] = None  # Continuar, Volver al menú
+        self.construction_buttons: Optional[FocusList] = None
+        
+        # Cámara del mapa
+        self.camera = MapCamera(config)
+        
+        # Efectos visuales de las anomalías
+        self.anomaly_effects = AnomalyEffectsRenderer(config)
+        
+        # Animaciones (avanzan todas juntas en on_update)
+        self.tweens = TweenSystem()
+        self.node_pulse = self.tweens.pulse(0.0, 1.0, 1.6)
+        self.anomaly_panel_fade = None
+        self._shown_anomalies = 0
+        
+        # Partículas: llamas de las antorchas de la vista actual y efectos puntuales
+        self.torch_particles = ParticleSystem(1024)
+        self.effect_particles = ParticleSystem(config.PARTICLE_CAPACITY)
+        self.torch_emitter: Optional[Emitter] = None
+        self._torch_state = None
         
         # Inicializar el juego
         self.initialize_game()
@@ -46,13 +93,22 @@ class GameScene:
         elif self.game_state == "story_view":
             self.handle_story_input(key, modifiers)
         elif self.game_state == "pause":
-            # La navegación de pausa ahora se maneja en GameWindow
-            pass
+            self.handle_pause_input(key, modifiers)
         elif self.game_state == "level_complete":
             self.handle_level_complete_input(key, modifiers)
         elif self.game_state == "construction":
             self.handle_construction_input(key, modifiers)
     
+    def on_mouse_press(self, x, y, button):
+        """Activar el botón bajo el cursor en las pantallas con botones"""
+        buttons = {
+            "pause": self.pause_buttons,
+            "level_complete": self.level_complete_buttons,
+            "construction": self.construction_buttons
+        }.get(self.game_state)
+        if buttons:
+            buttons.handle_click(x, y)
+    
     def on_update(self, delta_time):
         """Actualizar la lógica del juego"""
         if self.game_state == "puzzle_view" and self.puzzle_manager.current_puzzle:
@@ -67,7 +123,17 @@ class GameScene:
     def initialize_game(self):
         """Inicializar el juego"""
         # Generar mapa inicial
-        self.memory_map.generate_map(difficulty_level=1)
+        self.load_level(1)
+    
+    def load_level(self, level: int):
+        """Cargar un nivel (pre-generado si está listo)"""
+        prepared = self.level_pipeline.take(level)
+        self.level = level
+        self.level_name = prepared.name
+        self.memory_map = prepared.memory_map
+        self.anomaly_manager.anomaly_chance = prepared.anomaly_chance
+        self.level_complete = False
+        self._update_recommendations()
         
         # Configurar nodo inicial
         if self.memory_map.start_node_id is not None:
@@ -78,8 +144,14 @@ class GameScene:
             if available_nodes:
                 self.current_node = available_nodes[0]
         
+        if self.current_node:
+            self.camera.snap_to(self.current_node.x, self.current_node.y)
+        
         # Configurar UI
         self.setup_ui()
+        
+        # Generar el siguiente nivel mientras se juega este
+        self.level_pipeline.prefetch(level + 1)
     
     def setup_ui(self):
         """Configurar elementos de la interfaz"""
@@ -92,15 +164,98 @@ class GameScene:
             'completed_nodes': 0,
             'total_nodes': len(self.memory_map.nodes)
         }
+        
+        # Widgets de las pantallas de pausa, nivel completado y construcción
+        self._setup_pause_widgets()
+        self._setup_level_complete_widgets()
+        self._setup_construction_widgets()
     
-    def on_key_press(self, key, modifiers):
-        """Manejar teclas presionadas"""
-        if self.game_state == "map_view":
-            self.handle_map_input(key, modifiers)
-        elif self.game_state == "puzzle_view":
-            self.handle_puzzle_input(key, modifiers)
-        elif self.game_state == "story_view":
-            self.handle_story_input(key, modifiers)
+    def _setup_pause_widgets(self):
+        """Pergamino de pausa con sus dos botones (se conserva el foco)"""
+        colors = self.config.COLORS
+        panel_width = 400
+        panel_height = 300
+        panel_x = (self.config.SCREEN_WIDTH - panel_width) // 2
+        panel_y = (self.config.SCREEN_HEIGHT - panel_height) // 2
+        self.pause_rect = (panel_x, panel_y, panel_width, panel_height)
+        
+        center_x = self.config.SCREEN_WIDTH // 2
+        top = panel_y + panel_height
+        focus = self.pause_buttons.focus if self.pause_buttons else 0
+        self.pause_buttons = FocusList([
+            Button("REANUDAR", center_x, top - 150, 240, 40,
+                   parchment_button_style(colors, 'success', font_size=18, shadow=True), self.resume_puzzle),
+            Button("SALIR AL MAPA", center_x, top - 220, 240, 40,
+                   parchment_button_style(colors, 'error', font_size=18, shadow=True), self.exit_to_map)
+        ], wrap=False, focus=focus)
+        self.pause_layer = WidgetLayer([
+            Panel(center_x, panel_y + panel_height / 2, panel_width, panel_height,
+                  (*colors['primary'], 240), [
+                      Border(0, colors['secondary'], 6),
+                      Border(10, (*colors['accent'], 150), 4),
+                      Border(20, (*colors['torch'], 100), 2)
+                  ]),
+            Label("PAUSA", center_x, top - 77, colors['accent'], 36, bold=True,
+                  shadow=colors['shadow'], shadow_offset=(3, -3)),
+            *self.pause_buttons.buttons
+        ])
+    
+    def _setup_level_complete_widgets(self):
+        """Título, estadísticas y opciones del nivel completado"""
+        colors = self.config.COLORS
+        screen_width = self.config.SCREEN_WIDTH
+        screen_height = self.config.SCREEN_HEIGHT
+        center_x = screen_width // 2
+        
+        next_tier = self.level_pipeline.get_tier(self.level + 1)
+        next_label = (f"SÍ - Continuar al nivel {self.level + 1}: {next_tier.name}"
+                      if next_tier else "SÍ - Continuar al siguiente nivel")
+        self.level_complete_buttons = FocusList([
+            Button(next_label, center_x, screen_height // 2 - 10, 640, 44,
+                   parchment_button_style(colors, 'primary', 'accent', font_size=18), self.advance_to_next_level),
+            Button("NO - Volver al menú principal", center_x, screen_height // 2 - 70, 640, 44,
+                   parchment_button_style(colors, 'primary', 'accent', font_size=18), self.leave_to_menu)
+        ], wrap=False)
+        self.level_stats_label = Label("", center_x, screen_height - 200, colors['secondary'], 20)
+        self.level_complete_layer = WidgetLayer([
+            Panel(center_x, screen_height / 2, screen_width, screen_height, colors['background']),
+            Label("🎉 ¡NIVEL COMPLETADO! 🎉", center_x, screen_height - 100, colors['success'], 48, bold=True),
+            Label("¡Has restaurado todos los fragmentos del Códice Mnemónico!",
+                  center_x, screen_height - 150, colors['primary'], 24),
+            self.level_stats_label,
+            Label("¿Estás listo para el siguiente desafío?", center_x, screen_height // 2 + 50, colors['text'], 22),
+            *self.level_complete_buttons.buttons,
+            Label("Flechas y ENTER para elegir, o S para continuar y N para volver al menú",
+                  center_x, 50, colors['accent'], 16)
+        ])
+    
+    def _setup_construction_widgets(self):
+        """Aviso de nivel en construcción con el botón de vuelta al menú"""
+        colors = self.config.COLORS
+        screen_width = self.config.SCREEN_WIDTH
+        screen_height = self.config.SCREEN_HEIGHT
+        center_x = screen_width // 2
+        
+        self.construction_buttons = FocusList([
+            Button("VOLVER AL MENÚ PRINCIPAL", center_x, 110, 480, 50,
+                   parchment_button_style(colors, 'primary', 'accent'), self.leave_to_menu)
+        ])
+        lines = [
+            ("¡Gracias por completar todos los niveles!", screen_height - 150, colors['primary'], 24),
+            ("El siguiente nivel está siendo desarrollado", screen_height - 180, colors['text'], 20),
+            ("Próximamente:", screen_height // 2 + 50, colors['secondary'], 22),
+            ("• Puzzles más complejos", screen_height // 2 + 20, colors['text'], 18),
+            ("• Nuevas anomalías de memoria", screen_height // 2 - 10, colors['text'], 18),
+            ("• Habilidades cognitivas avanzadas", screen_height // 2 - 40, colors['text'], 18)
+        ]
+        self.construction_layer = WidgetLayer([
+            Panel(center_x, screen_height / 2, screen_width, screen_height, colors['background']),
+            Label(f"🚧 NIVEL {self.level + 1} EN CONSTRUCCIÓN 🚧", center_x, screen_height - 100,
+                  colors['warning'], 36, bold=True),
+            *(Label(text, center_x, y, color, size) for text, y, color, size in lines),
+            *self.construction_buttons.buttons,
+            Label("Presiona ESPACIO o ENTER para volver al menú principal", center_x, 50, colors['accent'], 16)
+        ])
     
     def handle_map_input(self, key, modifiers):
         """Manejar entrada en vista del mapa"""
@@ -115,6 +270,27 @@ class GameScene:
             self.move_to_previous_node()
         elif key == arcade.key.RIGHT:
             self.move_to_next_node()
+        elif key in (arcade.key.W, arcade.key.A, arcade.key.S, arcade.key.D):
+            # Desplazar la cámara
+            step = self.config.CAMERA_PAN_STEP
+            pan_directions = {
+                arcade.key.W: (0, step), arcade.key.S: (0, -step),
+                arcade.key.A: (-step, 0), arcade.key.D: (step, 0)
+            }
+            self.camera.pan(*pan_directions[key])
+        elif key in (arcade.key.PLUS, arcade.key.EQUAL, arcade.key.NUM_ADD):
+            self.camera.zoom_by(self.config.CAMERA_ZOOM_STEP)
+        elif key in (arcade.key.MINUS, arcade.key.NUM_SUBTRACT):
+            self.camera.zoom_by(1 / self.config.CAMERA_ZOOM_STEP)
+        elif key == arcade.key.C:
+            # Volver a seguir al nodo seleccionado
+            self.camera.follow()
+    
+    def on_mouse_scroll(self, x, y, scroll_x, scroll_y):
+        """Manejar la rueda del ratón (zoom en el mapa)"""
+        if self.game_state == "map_view" and scroll_y:
+            factor = self.config.CAMERA_ZOOM_STEP if scroll_y > 0 else 1 / self.config.CAMERA_ZOOM_STEP
+            self.camera.zoom_by(factor)
     
     def handle_puzzle_input(self, key, modifiers):
         """Manejar entrada en vista de puzzle"""
@@ -129,84 +305,81 @@ class GameScene:
                 hint = self.puzzle_manager.current_puzzle.get_hint()
                 self.show_hint(hint)
         else:
-            # Manejar entrada específica por tipo de puzzle
-            if self.puzzle_manager.current_puzzle:
-                puzzle_type = self.puzzle_manager.current_puzzle.__class__.__name__
-                
-                if puzzle_type == "SimonDicePuzzle":
-                    # Mapear teclas numéricas a símbolos para Simón Dice
-                    symbol_map = {
-                        arcade.key.KEY_1: '▲', arcade.key.KEY_2: '●', arcade.key.KEY_3: '■',
-                        arcade.key.KEY_4: '★', arcade.key.KEY_5: '◆', arcade.key.KEY_6: '▼'
-                    }
-                    if key in symbol_map:
-                        self.puzzle_manager.handle_puzzle_input(symbol_map[key])
-                
-                elif puzzle_type == "PatronSecuenciaPuzzle":
-                    # Manejar entrada numérica y BACKSPACE/ENTER para Patrón de Secuencia
-                    if key >= arcade.key.KEY_0 and key <= arcade.key.KEY_9:
-                        digit = str(key - arcade.key.KEY_0)
-                        self.puzzle_manager.handle_puzzle_input(digit)
-                    elif key == arcade.key.BACKSPACE:
-                        self.puzzle_manager.handle_puzzle_input("BACKSPACE")
-                    elif key == arcade.key.ENTER:
-                        self.puzzle_manager.handle_puzzle_input("ENTER")
-                
-                elif puzzle_type == "MemoriaEspacialPuzzle":
-                    # Manejar entrada numérica para Memoria Espacial (solo 1-4)
-                    if key >= arcade.key.KEY_1 and key <= arcade.key.KEY_4:
-                        digit = str(key - arcade.key.KEY_0)
-                        self.puzzle_manager.handle_puzzle_input(digit)
-                    elif key == arcade.key.BACKSPACE:
-                        self.puzzle_manager.handle_puzzle_input("BACKSPACE")
+            # Cada tipo de puzzle declara sus teclas en el registro
+            puzzle = self.puzzle_manager.current_puzzle
+            if puzzle:
+                plugin = self.puzzle_registry.for_puzzle(puzzle)
+                input_data = plugin.decode(key) if plugin else None
+                if input_data is not None:
+                    self.puzzle_manager.handle_puzzle_input(input_data)
     
     def handle_story_input(self, key, modifiers):
         """Manejar entrada en vista de historia"""
         if key == arcade.key.SPACE or key == arcade.key.ENTER:
+            if not self.story.finished:
+                # La primera pulsación muestra el resto del fragmento
+                self.story.reveal_all()
+                return
             # Reanudar música de fondo antes de volver al mapa
             self.resume_background_music()
             self.game_state = "map_view"
     
     def handle_level_complete_input(self, key, modifiers):
         """Manejar entrada en pantalla de nivel completado"""
+        if self.level_complete_buttons.handle_key(key):
+            return
         if key == arcade.key.S:
             # Continuar al siguiente nivel
-            self.show_construction_message()
+            self.advance_to_next_level()
         elif key == arcade.key.N:
             # Volver al menú principal
-            self.game_state = "menu"
+            self.leave_to_menu()
+    
+    def advance_to_next_level(self):
+        """Pasar al siguiente nivel de dificultad"""
+        if not self.level_pipeline.has_level(self.level + 1):
+            # No quedan niveles definidos
+            self.show_construction_message()
+            return
+        
+        self.load_level(self.level + 1)
+        self.game_state = "map_view"
     
     def show_construction_message(self):
         """Mostrar mensaje de construcción para el siguiente nivel"""
         self.game_state = "construction"
     
+    def leave_to_menu(self):
+        """Salir de las pantallas de fin de nivel al menú principal"""
+        # Al reanudar la partida guardada se vuelve al mapa, no a esta pantalla
+        self.game_state = "map_view"
+        self.return_to_main_menu()
+    
     def handle_construction_input(self, key, modifiers):
         """Manejar entrada en pantalla de construcción"""
-        if key == arcade.key.SPACE or key == arcade.key.ENTER:
-            self.game_state = "menu"
+        self.construction_buttons.handle_key(key)
     
     def start_puzzle(self, node):
         """Iniciar un puzzle en el nodo especificado"""
         if not node:
-            print("Error: No hay nodo seleccionado")
+            logger.warning("No hay nodo seleccionado")
             return
         
         # Si el nodo ya está completado, mostrar mensaje
         if node.completed:
-            self.story_text = f"El nodo {node.id} ya está completado. Selecciona otro nodo."
-            self.show_story = True
-            self.game_state = "story_view"
+            self.show_story_message(f"El nodo {node.id} ya está completado. Selecciona otro nodo.")
             return
         
         # Verificar si el nodo está disponible
         if not self._is_node_available(node):
             # Mostrar mensaje de nodo bloqueado
-            self.story_text = f"El nodo {node.id} está bloqueado. Completa otros nodos primero para desbloquearlo."
-            self.show_story = True
-            self.game_state = "story_view"
+            self.show_story_message(
+                f"El nodo {node.id} está bloqueado. Completa otros nodos primero para desbloquearlo."
+            )
             return
         
-        print(f"Iniciando puzzle en nodo {node.id}: {node.puzzle_type}")
+        logger.info("Iniciando puzzle en nodo %d: %s", node.id, node.puzzle_type,
+                    extra={"node": node.id, "puzzle_type": node.puzzle_type, "difficulty": node.difficulty})
         
         # Crear puzzle basado en el tipo del nodo
         puzzle_type = node.puzzle_type
@@ -220,14 +393,19 @@ class GameScene:
         puzzle = self.puzzle_manager.create_puzzle(puzzle_type, final_difficulty)
         
         if puzzle:
-            print(f"Puzzle creado exitosamente: {puzzle_type}")
+            logger.debug("Puzzle creado exitosamente: %s", puzzle_type)
             self.game_state = "puzzle_view"
             self.current_node = node
         else:
-            print(f"Error: No se pudo crear el puzzle {puzzle_type}")
-            self.story_text = f"Error al crear el puzzle {puzzle_type}. Inténtalo de nuevo."
-            self.show_story = True
-            self.game_state = "story_view"
+            logger.error("No se pudo crear el puzzle %s", puzzle_type)
+            self.show_story_message(f"Error al crear el puzzle {puzzle_type}. Inténtalo de nuevo.")
+    
+    def show_story_message(self, text: str, kind: str = STORY):
+        """Pasar a la vista de historia con un mensaje nuevo (el tipo decide el título)"""
+        self.story_text = text
+        self.show_story = True
+        self.story.show(StoryMessage(text, kind))
+        self.game_state = "story_view"
     
     def move_to_previous_node(self):
         """Mover al nodo anterior disponible"""
@@ -284,6 +462,36 @@ class GameScene:
         # Actualizar sistemas
         self.puzzle_manager.update(delta_time)
         
+        # La lógica de los puzzles corre aquí y no al dibujar (las repeticiones no dibujan)
+        if self.game_state == "puzzle_view" and self.puzzle_manager.current_puzzle:
+            self.puzzle_manager.current_puzzle.update(delta_time)
+        
+        # Avanzar animaciones; el panel de maldiciones aparece con un fundido
+        self.tweens.update(delta_time)
+        if self.game_state == "story_view":
+            self.story.update(delta_time)
+        active_count = len(self.anomaly_manager.get_active_anomalies())
+        if active_count and not self._shown_anomalies:
+            self.anomaly_panel_fade = self.tweens.fade(0.0, 1.0, 0.5)
+        if active_count > self._shown_anomalies:
+            self.emit_anomaly_effect()
+        self._shown_anomalies = active_count
+        
+        # Partículas
+        self._update_torch_emitter()
+        if self.torch_emitter:
+            self.torch_emitter.update(delta_time)
+        self.torch_particles.update(delta_time)
+        self.effect_particles.update(delta_time)
+        
+        # Acercar la cámara al nodo seleccionado
+        if self.game_state == "map_view":
+            self.camera.update(delta_time, self.current_node)
+        
+        # Recargar el contenido si cambió data/game_data.json
+        if self.content_loader.poll():
+            self.on_content_reloaded()
+        
         # Verificar si se completó un puzzle
         if (self.game_state == "puzzle_view" and 
             self.puzzle_manager.current_puzzle and 
@@ -301,6 +509,13 @@ class GameScene:
         self.ui_elements['map_info']['progress'] = self.memory_map.get_progress()
         self.ui_elements['map_info']['completed_nodes'] = len(self.memory_map.completed_nodes)
     
+    def on_content_reloaded(self):
+        """Aplicar el contenido recargado a lo que ya está en juego"""
+        self.ability_manager.refresh_descriptions()
+        tier = self.level_pipeline.get_tier(self.level)
+        if tier:
+            self.level_name = tier.name
+    
     def on_puzzle_completed(self):
         """Manejar completación de puzzle"""
         if not self.current_node:
@@ -308,11 +523,13 @@ class GameScene:
         
         # Completar el nodo
         self.memory_map.complete_node(self.current_node.id)
+        self._update_recommendations()
+        
+        # Chispas de celebración sobre el fragmento de historia
+        self.emit_completion_effect()
         
         # Mostrar fragmento de historia
-        self.story_text = self.current_node.story_fragment
-        self.show_story = True
-        self.game_state = "story_view"
+        self.show_story_message(self.current_node.story_fragment, VICTORY)
         
         # Reproducir música de victoria
         self.play_victory_music()
@@ -321,18 +538,58 @@ class GameScene:
         if self.memory_map.is_map_complete():
             self.on_map_completed()
     
+    def _torch_positions(self):
+        """Antorchas de la vista actual (las vistas con panel a pantalla completa no las muestran)"""
+        width, height = self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT
+        if self.game_state == "map_view":
+            return ((width - 100, height - 100), (width - 100, 100))
+        if self.game_state == "puzzle_view":
+            return ((120, height - 120), (width - 120, height - 120), (120, 120), (width - 120, 120))
+        return ()
+    
+    def _update_torch_emitter(self):
+        """Colocar el emisor de llamas en las antorchas de la vista actual"""
+        if self.game_state == self._torch_state:
+            return
+        self._torch_state = self.game_state
+        self.torch_particles.clear()
+        
+        positions = self._torch_positions()
+        self.torch_emitter = Emitter(
+            self.torch_particles, positions, self.config.TORCH_PARTICLE_RATE,
+            color=(*self.config.COLORS['torch'], 200), speed=(25, 60), direction=90, spread=50,
+            life=(0.5, 1.1), size=(6, 12), gravity=40, jitter=6
+        ) if positions else None
+    
+    def emit_completion_effect(self):
+        """Explosión de chispas al completar un nodo"""
+        x, y = self.config.SCREEN_WIDTH / 2, self.config.SCREEN_HEIGHT / 2
+        for color in (self.config.COLORS['accent'], self.config.COLORS['success']):
+            self.effect_particles.emit(
+                x, y, 300, color, speed=(80, 320), life=(0.8, 1.8), size=(4, 10), gravity=-160
+            )
+    
+    def emit_anomaly_effect(self):
+        """Nube de partículas junto al panel de maldiciones al activarse una anomalía"""
+        self.effect_particles.emit(
+            160, self.config.SCREEN_HEIGHT - 195, 200, (*self.config.COLORS['error'], 220),
+            speed=(10, 60), life=(0.8, 1.6), size=(6, 14), jitter=60
+        )
+    
     def on_puzzle_failed(self):
         """Manejar fallo de puzzle"""
         if not self.current_node:
             return
         
         # Mostrar mensaje de fallo
-        self.story_text = f"¡Tiempo agotado! El puzzle '{self.current_node.puzzle_type}' ha fallado. Inténtalo de nuevo."
-        self.show_story = True
-        self.game_state = "story_view"
+        self.show_story_message(
+            f"¡Tiempo agotado! El puzzle '{self.current_node.puzzle_type}' ha fallado. Inténtalo de nuevo.",
+            DEFEAT
+        )
         
         # Reproducir música de derrota
         self.play_defeat_music()
+        self._update_recommendations()
         
         # Limpiar el puzzle actual
         self.puzzle_manager.current_puzzle = None
@@ -342,6 +599,13 @@ class GameScene:
         self.level_complete = True
         self.game_state = "level_complete"
     
+    def is_static(self) -> bool:
+        """Si la vista actual puede reutilizar el último fotograma (sin partículas ni texto revelándose)"""
+        if self.game_state == "story_view" and not self.story.finished:
+            return False
+        return (self.game_state in self.STATIC_STATES and
+                self.torch_particles.count == 0 and self.effect_particles.count == 0)
+    
     def draw(self):
         """Dibujar la escena actual"""
         if self.game_state == "map_view":
@@ -356,6 +620,10 @@ class GameScene:
             self.draw_level_complete_view()
         elif self.game_state == "construction":
             self.draw_construction_view()
+        
+        # Partículas por encima de la vista
+        self.torch_particles.draw()
+        self.effect_particles.draw()
     
     def draw_map_view(self):
         """Dibujar vista del mapa mental con estilo de ruinas antiguas"""
@@ -365,12 +633,27 @@ class GameScene:
         # Dibujar efectos de iluminación
         self._draw_lighting_effects(all_corners=False)
         
+        # Solo se dibuja lo que la cámara ve
+        left, right, bottom, top = self.camera.visible_bounds(self.config.CAMERA_CULL_MARGIN)
+        visible_ids, visible_edges = self.memory_map.query_visible(left, right, bottom, top)
+        low_detail = self.camera.is_low_detail()
+        
+        self.camera.use(get_game_clock().alpha)
+        
+        # Resplandores de todos los nodos visibles en una sola llamada
+        if not low_detail:
+            get_light_layer("map_nodes").draw(
+                [self._node_glow(self.memory_map.nodes[node_id]) for node_id in sorted(visible_ids)]
+            )
+        
         # Dibujar nodos del mapa
-        for node in self.memory_map.nodes.values():
-            self.draw_memory_node(node)
+        for node_id in sorted(visible_ids):
+            self.draw_memory_node(self.memory_map.nodes[node_id], low_detail)
         
         # Dibujar conexiones
-        self.draw_connections()
+        self.draw_connections(visible_edges, low_detail)
+        
+        self.camera.use_screen()
         
         # Dibujar UI del mapa
         self.draw_map_ui()
@@ -423,19 +706,10 @@ class GameScene:
     
     def _draw_lighting_effects(self, all_corners=False):
         """Dibujar efectos de iluminación atmosférica"""
-        import arcade
-        
         # Luz central mística
         center_x = self.config.SCREEN_WIDTH // 2
         center_y = self.config.SCREEN_HEIGHT // 2
-        
-        # Resplandor central
-        for radius in [300, 200, 100]:
-            alpha = max(0, 50 - radius // 6)
-            arcade.draw_circle_filled(
-                center_x, center_y, radius,
-                (*self.config.COLORS['torch'], alpha)
-            )
+        torch_color = self.config.COLORS['torch']
         
         # Efectos de antorchas
         if all_corners:
@@ -453,21 +727,13 @@ class GameScene:
                 (self.config.SCREEN_WIDTH - 100, 100)  # Inferior derecha
             ]
         
-        for tx, ty in torch_positions:
-            # Llama de antorcha
-            arcade.draw_circle_filled(tx, ty, 15, self.config.COLORS['torch'])
-            # Resplandor de antorcha
-            for radius in [40, 25, 10]:
-                alpha = max(0, 30 - radius)
-                arcade.draw_circle_filled(
-                    tx, ty, radius,
-                    (*self.config.COLORS['torch'], alpha)
-                )
+        # Resplandor central y antorchas en una sola llamada
+        lights = [Light(center_x, center_y, 300, torch_color, 0.22)]
+        lights += torch_lights(torch_positions, 15, 60, torch_color)
+        get_light_layer("scene_all_corners" if all_corners else "scene_map").draw(lights)
     
-    def draw_memory_node(self, node):
-        """Dibujar un nodo del mapa mental con estilo de ruinas antiguas"""
-        import arcade
-        
+    def _node_style(self, node):
+        """Colores y tamaño de un nodo según su estado"""
         # Determinar colores y efectos basados en estado
         if node.completed:
             base_color = self.config.COLORS['success']
@@ -494,16 +760,28 @@ class GameScene:
             border_width = 3
             node_size = 30
         
-        # Dibujar efecto de resplandor
-        arcade.draw_circle_filled(
-            node.x, node.y, node_size + 15, glow_color
-        )
+        return base_color, glow_color, border_color, border_width, node_size
+    
+    def _node_glow(self, node) -> Light:
+        """Resplandor de un nodo (el del nodo seleccionado late)"""
+        _, glow_color, _, _, node_size = self._node_style(node)
+        radius = node_size * 2 + 10
+        if node == self.current_node:
+            radius += 8 * self.tweens.value(self.node_pulse)
+        return Light(node.x, node.y, radius, glow_color[:3], min(1.0, glow_color[3] / 120))
+    
+    def draw_memory_node(self, node, low_detail=False):
+        """Dibujar un nodo del mapa mental con estilo de ruinas antiguas"""
+        import arcade
         
-        # Dibujar sombra del nodo
-        arcade.draw_circle_filled(
-            node.x + 3, node.y - 3, node_size,
-            self.config.COLORS['shadow']
-        )
+        base_color, glow_color, border_color, border_width, node_size = self._node_style(node)
+        
+        if not low_detail:
+            # Dibujar sombra del nodo (el resplandor se dibuja antes, en lote)
+            arcade.draw_circle_filled(
+                node.x + 3, node.y - 3, node_size,
+                self.config.COLORS['shadow']
+            )
         
         # Dibujar nodo principal
         arcade.draw_circle_filled(
@@ -515,6 +793,10 @@ class GameScene:
             node.x, node.y, node_size, border_color, border_width
         )
         
+        # Con poco zoom no se dibujan detalles ni etiquetas
+        if low_detail:
+            return
+        
         # Dibujar borde interno para efecto de profundidad
         arcade.draw_circle_outline(
             node.x, node.y, node_size - 2, 
@@ -594,55 +876,79 @@ class GameScene:
                 anchor_x="center",
                 bold=True
             )
+        elif node.id == self.memory_map.analytics.get_best_node_id():
+            # Marcar el nodo recomendado
+            arcade.draw_lrbt_rectangle_filled(
+                node.x - 65, node.x + 65, node.y + 40, node.y + 70,
+                (*self.config.COLORS['success'], 180)
+            )
+            arcade.draw_lrbt_rectangle_outline(
+                node.x - 65, node.x + 65, node.y + 40, node.y + 70,
+                self.config.COLORS['accent'], 2
+            )
+            arcade.draw_text(
+                "RECOMENDADO",
+                node.x, node.y + 50,
+                self.config.COLORS['text'],
+                font_size=10,
+                anchor_x="center",
+                bold=True
+            )
     
     def _is_node_available(self, node):
         """Verificar si un nodo está disponible para jugar"""
-        available_nodes = self.memory_map.get_available_nodes()
-        return node in available_nodes
+        return self.memory_map.is_available(node.id)
     
-    def draw_connections(self):
+    def _update_recommendations(self):
+        """Pasar las áreas débiles del jugador al análisis del mapa"""
+        self.memory_map.analytics.set_weak_puzzle_types(
+            self.puzzle_manager.get_weak_puzzle_types()
+        )
+    
+    def draw_connections(self, edges, low_detail=False):
         """Dibujar conexiones entre nodos con estilo de energía mística"""
         import arcade
         
-        for node in self.memory_map.nodes.values():
-            for connected_id in node.connections:
-                if connected_id in self.memory_map.nodes:
-                    connected_node = self.memory_map.nodes[connected_id]
-                    
-                    # Determinar color de conexión basado en estado
-                    if node.completed and connected_node.completed:
-                        connection_color = self.config.COLORS['success']
-                        glow_color = (*self.config.COLORS['success'], 100)
-                        width = 4
-                    elif node == self.current_node or connected_node == self.current_node:
-                        connection_color = self.config.COLORS['torch']
-                        glow_color = (*self.config.COLORS['torch'], 120)
-                        width = 5
-                    else:
-                        connection_color = self.config.COLORS['secondary']
-                        glow_color = (*self.config.COLORS['secondary'], 80)
-                        width = 3
-                    
-                    # Dibujar efecto de resplandor
-                    arcade.draw_line(
-                        node.x, node.y,
-                        connected_node.x, connected_node.y,
-                        glow_color, width + 2
-                    )
-                    
-                    # Dibujar línea principal
-                    arcade.draw_line(
-                        node.x, node.y,
-                        connected_node.x, connected_node.y,
-                        connection_color, width
-                    )
-                    
-                    # Dibujar línea brillante central
-                    arcade.draw_line(
-                        node.x, node.y,
-                        connected_node.x, connected_node.y,
-                        self.config.COLORS['accent'], 1
-                    )
+        for node_id, connected_id in edges:
+            node = self.memory_map.nodes[node_id]
+            connected_node = self.memory_map.nodes[connected_id]
+            
+            # Determinar color de conexión basado en estado
+            if node.completed and connected_node.completed:
+                connection_color = self.config.COLORS['success']
+                glow_color = (*self.config.COLORS['success'], 100)
+                width = 4
+            elif node == self.current_node or connected_node == self.current_node:
+                connection_color = self.config.COLORS['torch']
+                glow_color = (*self.config.COLORS['torch'], 120)
+                width = 5
+            else:
+                connection_color = self.config.COLORS['secondary']
+                glow_color = (*self.config.COLORS['secondary'], 80)
+                width = 3
+            
+            if not low_detail:
+                # Dibujar efecto de resplandor
+                arcade.draw_line(
+                    node.x, node.y,
+                    connected_node.x, connected_node.y,
+                    glow_color, width + 2
+                )
+            
+            # Dibujar línea principal
+            arcade.draw_line(
+                node.x, node.y,
+                connected_node.x, connected_node.y,
+                connection_color, width
+            )
+            
+            if not low_detail:
+                # Dibujar línea brillante central
+                arcade.draw_line(
+                    node.x, node.y,
+                    connected_node.x, connected_node.y,
+                    self.config.COLORS['accent'], 1
+                )
     
     def draw_map_ui(self):
         """Dibujar UI del mapa con estilo de pergamino antiguo"""
@@ -722,6 +1028,15 @@ class GameScene:
             bold=True
         )
         
+        # Nivel de dificultad actual
+        arcade.draw_text(
+            f"Nivel {self.level}: {self.level_name}",
+            20, self.config.SCREEN_HEIGHT - 105,
+            self.config.COLORS['accent'],
+            font_size=self.config.FONT_SIZE_SMALL,
+            bold=True
+        )
+        
         # Panel de instrucciones con bordes mejorados
         arcade.draw_lrbt_rectangle_filled(
             5, 610, 5, 85,
@@ -741,7 +1056,14 @@ class GameScene:
         # Instrucciones
         arcade.draw_text(
             "ESPACIO: Seleccionar nodo | ←→: Navegar | ESC: Inicio / Pausa",
-            20, 30,
+            20, 38,
+            self.config.COLORS['text'],
+            font_size=self.config.FONT_SIZE_SMALL,
+            bold=True
+        )
+        arcade.draw_text(
+            "WASD: Mover cámara | +/-: Zoom | C: Centrar",
+            20, 16,
             self.config.COLORS['text'],
             font_size=self.config.FONT_SIZE_SMALL,
             bold=True
@@ -749,9 +1071,12 @@ class GameScene:
         
         # Mostrar nodo actual seleccionado
         if self.current_node:
+            analytics = self.memory_map.analytics
+            unlocks = len(analytics.get_unlocks(self.current_node.id))
             arcade.draw_text(
-                f"Nodo seleccionado: {self.current_node.id} ({self.current_node.puzzle_type})",
-                20, 50,
+                f"Nodo seleccionado: {self.current_node.id} ({self.current_node.puzzle_type})"
+                f" | Desbloquea: {unlocks}",
+                20, 60,
                 self.config.COLORS['accent'],
                 font_size=self.config.FONT_SIZE_SMALL,
                 bold=True
@@ -762,11 +1087,15 @@ class GameScene:
     
     def draw_puzzle_view(self):
         """Dibujar vista del puzzle"""
-        if self.puzzle_manager.current_puzzle:
-            self.puzzle_manager.current_puzzle.draw_puzzle(
-                self.config.SCREEN_WIDTH,
-                self.config.SCREEN_HEIGHT
-            )
+        puzzle = self.puzzle_manager.current_puzzle
+        plugin = self.puzzle_registry.for_puzzle(puzzle) if puzzle else None
+        if plugin:
+            plugin.draw(puzzle, self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT)
+        
+        # Oscurecimiento de El Olvido y demás efectos sobre el tablero
+        self.anomaly_effects.draw(
+            self.anomaly_manager, self.puzzle_manager.effects.parameters.visibility_radius
+        )
         
         # Dibujar información del puzzle
         puzzle_info = self.puzzle_manager.get_puzzle_info()
@@ -838,11 +1167,23 @@ class GameScene:
         # Efectos de iluminación
         self._draw_lighting_effects(all_corners=True)
         
-        # Panel principal de pergamino
+        # Panel principal de pergamino (se recompone solo si cambia el tipo de mensaje)
         panel_width = self.config.SCREEN_WIDTH - 100
         panel_height = self.config.SCREEN_HEIGHT - 100
         panel_x = (self.config.SCREEN_WIDTH - panel_width) // 2
         panel_y = (self.config.SCREEN_HEIGHT - panel_height) // 2
+        get_panel_compositor().draw(
+            "story", (panel_x, panel_y, panel_width, panel_height), self.story.message.kind,
+            lambda: self._draw_story_panel(panel_x, panel_y, panel_width, panel_height)
+        )
+        
+        # Texto de la historia: líneas maquetadas una vez y reveladas poco a poco
+        self.story.draw(self.config.SCREEN_WIDTH // 2, self.config.SCREEN_HEIGHT // 2,
+                        self.config.SCREEN_WIDTH - 200)
+    
+    def _draw_story_panel(self, panel_x, panel_y, panel_width, panel_height):
+        """Pergamino con el fragmento de historia o el mensaje de resultado"""
+        import arcade
         
         # Fondo de pergamino con múltiples capas
         arcade.draw_lrbt_rectangle_filled(
@@ -871,20 +1212,8 @@ class GameScene:
             (*self.config.COLORS['torch'], 100), 2
         )
         
-        # Determinar si es victoria o derrota
-        is_victory = "completado" in self.story_text.lower() or "éxito" in self.story_text.lower()
-        is_defeat = "agotado" in self.story_text.lower() or "fallado" in self.story_text.lower()
-        
         # Título según el tipo de mensaje
-        if is_victory:
-            title = "🎉 ¡VICTORIA! 🎉"
-            title_color = self.config.COLORS['success']
-        elif is_defeat:
-            title = "💀 TIEMPO AGOTADO 💀"
-            title_color = self.config.COLORS['error']
-        else:
-            title = "📜 HISTORIA 📜"
-            title_color = self.config.COLORS['accent']
+        title, title_color = self.story.title
         
         # Título con efecto épico
         arcade.draw_text(
@@ -904,28 +1233,6 @@ class GameScene:
             bold=True
         )
         
-        # Texto de la historia con sombra
-        arcade.draw_text(
-            self.story_text,
-            self.config.SCREEN_WIDTH // 2 + 2, self.config.SCREEN_HEIGHT // 2 - 2,
-            self.config.COLORS['shadow'],
-            font_size=self.config.FONT_SIZE_MEDIUM,
-            anchor_x="center",
-            anchor_y="center",
-            width=self.config.SCREEN_WIDTH - 200,
-            bold=True
-        )
-        arcade.draw_text(
-            self.story_text,
-            self.config.SCREEN_WIDTH // 2, self.config.SCREEN_HEIGHT // 2,
-            self.config.COLORS['text'],
-            font_size=self.config.FONT_SIZE_MEDIUM,
-            anchor_x="center",
-            anchor_y="center",
-            width=self.config.SCREEN_WIDTH - 200,
-            bold=True
-        )
-        
         # Panel de instrucciones en la parte inferior
         instruction_panel_y = panel_y + 50
         arcade.draw_lrbt_rectangle_filled(
@@ -964,179 +1271,18 @@ class GameScene:
     
     def draw_level_complete_view(self):
         """Dibujar pantalla de nivel completado"""
-        import arcade
-        
-        screen_width = arcade.get_window().width
-        screen_height = arcade.get_window().height
-        
-        # Fondo
-        arcade.draw_lrbt_rectangle_filled(
-            0, screen_width, 0, screen_height,
-            self.config.COLORS['background']
-        )
-        
-        # Título épico
-        arcade.draw_text(
-            "🎉 ¡NIVEL COMPLETADO! 🎉",
-            screen_width // 2,
-            screen_height - 100,
-            self.config.COLORS['success'],
-            font_size=48,
-            anchor_x="center",
-            bold=True
-        )
-        
-        # Mensaje épico
-        arcade.draw_text(
-            "¡Has restaurado todos los fragmentos del Códice Mnemónico!",
-            screen_width // 2,
-            screen_height - 150,
-            self.config.COLORS['primary'],
-            font_size=24,
-            anchor_x="center"
-        )
-        
-        # Estadísticas
+        # Toda la pantalla es un panel fijo hasta que cambia el progreso o el foco
         completed_nodes = sum(1 for node in self.memory_map.nodes.values() if node.completed)
-        total_nodes = len(self.memory_map.nodes)
-        
-        arcade.draw_text(
-            f"Fragmentos restaurados: {completed_nodes}/{total_nodes}",
-            screen_width // 2,
-            screen_height - 200,
-            self.config.COLORS['secondary'],
-            font_size=20,
-            anchor_x="center"
-        )
-        
-        # Mensaje de continuación
-        arcade.draw_text(
-            "¿Estás listo para el siguiente desafío?",
-            screen_width // 2,
-            screen_height // 2 + 50,
-            self.config.COLORS['text'],
-            font_size=22,
-            anchor_x="center"
-        )
-        
-        # Opciones
-        arcade.draw_text(
-            "SÍ - Continuar al siguiente nivel",
-            screen_width // 2,
-            screen_height // 2,
-            self.config.COLORS['accent'],
-            font_size=18,
-            anchor_x="center"
-        )
-        
-        arcade.draw_text(
-            "NO - Volver al menú principal",
-            screen_width // 2,
-            screen_height // 2 - 30,
-            self.config.COLORS['text'],
-            font_size=18,
-            anchor_x="center"
-        )
-        
-        # Instrucciones
-        arcade.draw_text(
-            "Presiona S para continuar o N para volver al menú",
-            screen_width // 2,
-            50,
-            self.config.COLORS['accent'],
-            font_size=16,
-            anchor_x="center"
+        self.level_stats_label.set_text(f"Fragmentos restaurados: {completed_nodes}/{len(self.memory_map.nodes)}")
+        layer = self.level_complete_layer
+        get_panel_compositor().draw(
+            "level_complete", (0, 0, self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT),
+            layer.version, layer.draw
         )
     
     def draw_construction_view(self):
         """Dibujar pantalla de construcción"""
-        import arcade
-        
-        screen_width = arcade.get_window().width
-        screen_height = arcade.get_window().height
-        
-        # Fondo
-        arcade.draw_lrbt_rectangle_filled(
-            0, screen_width, 0, screen_height,
-            self.config.COLORS['background']
-        )
-        
-        # Título
-        arcade.draw_text(
-            "🚧 NIVEL 2 EN CONSTRUCCIÓN 🚧",
-            screen_width // 2,
-            screen_height - 100,
-            self.config.COLORS['warning'],
-            font_size=36,
-            anchor_x="center",
-            bold=True
-        )
-        
-        # Mensaje
-        arcade.draw_text(
-            "¡Gracias por completar el primer nivel!",
-            screen_width // 2,
-            screen_height - 150,
-            self.config.COLORS['primary'],
-            font_size=24,
-            anchor_x="center"
-        )
-        
-        arcade.draw_text(
-            "El siguiente nivel está siendo desarrollado",
-            screen_width // 2,
-            screen_height - 180,
-            self.config.COLORS['text'],
-            font_size=20,
-            anchor_x="center"
-        )
-        
-        # Información de desarrollo
-        arcade.draw_text(
-            "Próximamente:",
-            screen_width // 2,
-            screen_height // 2 + 50,
-            self.config.COLORS['secondary'],
-            font_size=22,
-            anchor_x="center"
-        )
-        
-        arcade.draw_text(
-            "• Puzzles más complejos",
-            screen_width // 2,
-            screen_height // 2 + 20,
-            self.config.COLORS['text'],
-            font_size=18,
-            anchor_x="center"
-        )
-        
-        arcade.draw_text(
-            "• Nuevas anomalías de memoria",
-            screen_width // 2,
-            screen_height // 2 - 10,
-            self.config.COLORS['text'],
-            font_size=18,
-            anchor_x="center"
-        )
-        
-        arcade.draw_text(
-            "• Habilidades cognitivas avanzadas",
-            screen_width // 2,
-            screen_height // 2 - 40,
-            self.config.COLORS['text'],
-            font_size=18,
-            anchor_x="center"
-        )
-        
-        # Instrucciones
-        arcade.draw_text(
-            "Presiona ESPACIO para volver al menú principal",
-            screen_width // 2,
-            50,
-            self.config.COLORS['accent'],
-            font_size=16,
-            anchor_x="center"
-        )
+        self.construction_layer.draw()
     
     def draw_active_anomalies(self):
         """Dibujar anomalías activas con estilo de maldiciones antiguas"""
@@ -1145,26 +1291,28 @@ class GameScene:
         active_anomalies = self.anomaly_manager.get_active_anomalies()
         
         if active_anomalies:
+            fade = self.tweens.value(self.anomaly_panel_fade, 1.0)
+            
             # Panel de anomalías con estilo de pergamino maldito mejorado
             arcade.draw_lrbt_rectangle_filled(
                 5, 310, self.config.SCREEN_HEIGHT - 245, self.config.SCREEN_HEIGHT - 145,
-                (*self.config.COLORS['error'], 180)
+                (*self.config.COLORS['error'], int(180 * fade))
             )
             # Borde exterior
             arcade.draw_lrbt_rectangle_outline(
                 5, 310, self.config.SCREEN_HEIGHT - 245, self.config.SCREEN_HEIGHT - 145,
-                self.config.COLORS['error'], 3
+                (*self.config.COLORS['error'], int(255 * fade)), 3
             )
             # Borde interior
             arcade.draw_lrbt_rectangle_outline(
                 8, 307, self.config.SCREEN_HEIGHT - 242, self.config.SCREEN_HEIGHT - 148,
-                (*self.config.COLORS['text'], 100), 1
+                (*self.config.COLORS['text'], int(100 * fade)), 1
             )
             
             arcade.draw_text(
                 "MALDICIONES ACTIVAS:",
                 20, self.config.SCREEN_HEIGHT - 170,
-                self.config.COLORS['text'],
+                (*self.config.COLORS['text'], int(255 * fade)),
                 font_size=self.config.FONT_SIZE_SMALL,
                 bold=True
             )
@@ -1174,7 +1322,7 @@ class GameScene:
                 arcade.draw_text(
                     f"• {anomaly.name}",
                     30, self.config.SCREEN_HEIGHT - y_offset,
-                    self.config.COLORS['text'],
+                    (*self.config.COLORS['text'], int(255 * fade)),
                     font_size=self.config.FONT_SIZE_SMALL
                 )
                 y_offset += 20
@@ -1186,9 +1334,9 @@ class GameScene:
             window = arcade.get_window()
             if hasattr(window, 'play_temporary_music'):
                 window.play_temporary_music("victory.mp3")
-                print("Música de victoria reproducida")
+                audio_logger.info("Música de victoria reproducida")
         except Exception as e:
-            print(f"Error al reproducir música de victoria: {e}")
+            audio_logger.warning("Error al reproducir música de victoria: %s", e)
     
     def play_defeat_music(self):
         """Reproducir música de derrota"""
@@ -1197,9 +1345,9 @@ class GameScene:
             window = arcade.get_window()
             if hasattr(window, 'play_temporary_music'):
                 window.play_temporary_music("game_over.mp3")
-                print("Música de derrota reproducida")
+                audio_logger.info("Música de derrota reproducida")
         except Exception as e:
-            print(f"Error al reproducir música de derrota: {e}")
+            audio_logger.warning("Error al reproducir música de derrota: %s", e)
     
     def resume_background_music(self):
         """Reanudar música de fondo"""
@@ -1208,9 +1356,9 @@ class GameScene:
             window = arcade.get_window()
             if hasattr(window, 'resume_background_music'):
                 window.resume_background_music()
-                print("Música de fondo reanudada")
+                audio_logger.info("Música de fondo reanudada")
         except Exception as e:
-            print(f"Error al reanudar música de fondo: {e}")
+            audio_logger.warning("Error al reanudar música de fondo: %s", e)
     
     def return_to_main_menu(self):
         """Volver al menú principal"""
@@ -1219,144 +1367,40 @@ class GameScene:
             window = arcade.get_window()
             if hasattr(window, 'return_to_menu'):
                 window.return_to_menu()
-                print("Volviendo al menú principal con progreso guardado")
+                logger.info("Volviendo al menú principal con progreso guardado")
             else:
                 # Fallback al método anterior
                 window.current_state = "menu"
-                print("Volviendo al menú principal")
+                logger.info("Volviendo al menú principal")
         except Exception as e:
-            print(f"Error al volver al menú: {e}")
+            logger.error("Error al volver al menú: %s", e)
     
     def draw_pause_view(self):
         """Dibujar pantalla de pausa con diseño de ruinas"""
-        import arcade
-        
         # Fondo atmosférico de ruinas
         self._draw_atmospheric_background(all_corners=True)
         
         # Efectos de iluminación
         self._draw_lighting_effects(all_corners=True)
         
-        # Panel principal de pergamino
-        panel_width = 400
-        panel_height = 300
-        panel_x = (self.config.SCREEN_WIDTH - panel_width) // 2
-        panel_y = (self.config.SCREEN_HEIGHT - panel_height) // 2
-        
-        # Fondo de pergamino con múltiples capas
-        arcade.draw_lrbt_rectangle_filled(
-            panel_x, panel_x + panel_width,
-            panel_y, panel_y + panel_height,
-            (*self.config.COLORS['primary'], 240)
-        )
-        
-        # Bordes exteriores
-        arcade.draw_lrbt_rectangle_outline(
-            panel_x, panel_x + panel_width,
-            panel_y, panel_y + panel_height,
-            self.config.COLORS['secondary'], 6
-        )
-        
-        # Bordes interiores
-        arcade.draw_lrbt_rectangle_outline(
-            panel_x + 10, panel_x + panel_width - 10,
-            panel_y + 10, panel_y + panel_height - 10,
-            (*self.config.COLORS['accent'], 150), 4
-        )
-        
-        arcade.draw_lrbt_rectangle_outline(
-            panel_x + 20, panel_x + panel_width - 20,
-            panel_y + 20, panel_y + panel_height - 20,
-            (*self.config.COLORS['torch'], 100), 2
-        )
-        
-        # Título PAUSA con efecto épico
-        arcade.draw_text(
-            "PAUSA",
-            self.config.SCREEN_WIDTH // 2 + 3, panel_y + panel_height - 80,
-            self.config.COLORS['shadow'],
-            font_size=36,
-            anchor_x="center",
-            bold=True
-        )
-        arcade.draw_text(
-            "PAUSA",
-            self.config.SCREEN_WIDTH // 2, panel_y + panel_height - 77,
-            self.config.COLORS['accent'],
-            font_size=36,
-            anchor_x="center",
-            bold=True
-        )
-        
-        # Botón Reanudar
-        resume_y = panel_y + panel_height - 150
-        self._draw_pause_button(
-            "REANUDAR",
-            self.config.SCREEN_WIDTH // 2, resume_y,
-            self.config.COLORS['success'],
-            is_selected=(self.selected_pause_button == 0)
-        )
-        
-        # Botón Salir al Mapa
-        exit_y = panel_y + panel_height - 220
-        self._draw_pause_button(
-            "SALIR AL MAPA",
-            self.config.SCREEN_WIDTH // 2, exit_y,
-            self.config.COLORS['error'],
-            is_selected=(self.selected_pause_button == 1)
-        )
-    
-    def _draw_pause_button(self, text, x, y, bg_color, is_selected=False):
-        """Dibujar botón de pausa con estilo de pergamino"""
-        # Efecto de resplandor si está seleccionado
-        if is_selected:
-            arcade.draw_lrbt_rectangle_filled(
-                x - 130, x + 130, y - 30, y + 30,
-                (*self.config.COLORS['torch'], 80)
-            )
-        
-        # Fondo del botón
-        arcade.draw_lrbt_rectangle_filled(
-            x - 120, x + 120, y - 20, y + 20,
-            (*bg_color, 220)
-        )
-        
-        # Borde exterior
-        border_color = self.config.COLORS['torch'] if is_selected else self.config.COLORS['secondary']
-        border_width = 4 if is_selected else 3
-        arcade.draw_lrbt_rectangle_outline(
-            x - 120, x + 120, y - 20, y + 20,
-            border_color, border_width
-        )
-        
-        # Borde interior
-        arcade.draw_lrbt_rectangle_outline(
-            x - 115, x + 115, y - 15, y + 15,
-            (*self.config.COLORS['accent'], 120), 2
-        )
-        
-        # Texto del botón con sombra
-        text_color = self.config.COLORS['torch'] if is_selected else self.config.COLORS['text']
-        arcade.draw_text(
-            text,
-            x + 2, y - 2,
-            self.config.COLORS['shadow'],
-            font_size=18,
-            anchor_x="center",
-            anchor_y="center",
-            bold=True
-        )
-        arcade.draw_text(
-            text,
-            x, y,
-            text_color,
-            font_size=18,
-            anchor_x="center",
-            anchor_y="center",
-            bold=True
-        )
+        # Panel principal de pergamino (se recompone al cambiar el botón con el foco)
+        layer = self.pause_layer
+        get_panel_compositor().draw("pause", self.pause_rect, layer.version, layer.draw)
     
     def handle_pause_input(self, key, modifiers):
-        """Manejar entrada en pantalla de pausa (ahora manejado por GameWindow)"""
-        # Esta función ya no se usa directamente, GameWindow maneja la navegación
-        pass
+        """Manejar entrada en pantalla de pausa"""
+        if key == arcade.key.ESCAPE:
+            # Salir al mapa con ESC (comportamiento por defecto) - no reanudar timer
+            self.exit_to_map()
+        else:
+            self.pause_buttons.handle_key(key)
+    
+    def resume_puzzle(self):
+        """Reanudar el puzzle pausado y su temporizador"""
+        if self.puzzle_manager.current_puzzle:
+            self.puzzle_manager.current_puzzle.resume_timer()
+        self.game_state = "puzzle_view"
+    
+    def exit_to_map(self):
+        """Salir de la pausa al mapa sin reanudar el temporizador"""
+        self.game_state = "map_view"
@@ -2,17 +2,70 @@
 Ventana principal del juego
 """
 
+import math
+import random
 import arcade
-from utils.config import Config
+from typing import Optional
+from utils.config import get_config, get_config_service
+from utils.game_clock import get_game_clock
+from utils.lighting import Light, get_light_layer, torch_lights
+from game.game_loop import FixedTimestepLoop
 from game.game_scene import GameScene
+from game.panel_compositor import get_panel_compositor
+from game.render_target import get_render_target
+from game.input_events import InputEvent, InputQueue, InputRecorder, KEY_PRESS, MOUSE_PRESS, MOUSE_SCROLL
+from game.screen_cache import ScreenCache
+from game.ui_widgets import Button, FocusList, WidgetLayer, parchment_button_style
+from utils.logger import get_logger
+
+logger = get_logger("window")
+audio_logger = get_logger("audio")
 
 class GameWindow(arcade.Window):
     """Ventana principal del juego El Códice Mnemónico"""
     
-    def __init__(self, width, height, title):
-        super().__init__(width, height, title)
+    def __init__(self, width, height, title, seed: Optional[int] = None, replay: bool = False):
+        self.config_service = get_config_service()
+        self.game_config = get_config()
+        super().__init__(width, height, title,
+                         fullscreen=self.game_config.FULLSCREEN,
+                         vsync=self.game_config.VSYNC,
+                         resizable=True)
+        
+        # Todo se dibuja a la resolución lógica (SCREEN_WIDTH x SCREEN_HEIGHT) y se escala a la ventana
+        self.render_target = get_render_target()
+        
+        # Aplicar los cambios de configuración hechos durante la partida
+        self.config_service.subscribe(self.on_config_changed)
+        
+        # Sesión determinista: semilla, reloj de juego y entrada encolada
+        self.replay = replay
+        self.session_seed = seed if seed is not None else random.SystemRandom().getrandbits(32)
+        random.seed(self.session_seed)
+        self.game_clock = get_game_clock()
+        self.game_clock.reset()
+        self.input_queue = InputQueue(self.game_clock)
+        self.input_recorder = None
+        if not replay and self.game_config.RECORD_INPUT:
+            self.input_recorder = InputRecorder.create(
+                self.game_config.REPLAY_DIR, self.session_seed, self.game_config.REPLAY_KEEP
+            )
+        self.input_handlers = {
+            KEY_PRESS: self.handle_key_press,
+            MOUSE_PRESS: self.handle_mouse_press,
+            MOUSE_SCROLL: self.handle_mouse_scroll
+        }
+        
+        # La lógica avanza en pasos fijos; on_update solo reparte el tiempo real
+        self.game_loop = FixedTimestepLoop(
+            self.game_config.TICK_RATE, self.game_config.MAX_TICKS_PER_FRAME, self.tick, self.game_clock
+        )
         
-        self.game_config = Config()
+        # Pantallas estáticas: se reutiliza el último fotograma y se baja el ritmo en reposo
+        self.screen_cache = ScreenCache()
+        self.frame_rate = 1 / 60  # ritmo normal de la ventana (el de arcade)
+        self.static_time = 0.0  # segundos seguidos en una pantalla estática
+        self.idle = False
         
         # Estados del juego
         self.current_state = "menu"  # menu, gameplay, pause, game_over
@@ -34,9 +87,10 @@ class GameWindow(arcade.Window):
             "a_lo_mejor.mp3"
         ]
         
-        # Menú
-        self.selected_button = 0  # 0: Iniciar, 1: Instrucciones, 2: Salir
+        # Menú: botones retenidos (Iniciar, Instrucciones, Salir)
         self.show_instructions = False
+        self.menu_buttons: Optional[FocusList] = None
+        self.setup_menu_widgets()
         
         # Configurar la escena inicial
         self.setup_menu()
@@ -44,6 +98,8 @@ class GameWindow(arcade.Window):
 
     def setup_music(self):
         """Cargar y reproducir la música de fondo"""
+        if self.replay:
+            return  # Las repeticiones no tienen sonido
         self.load_current_music()
     
     def stop_current_music(self):
@@ -61,7 +117,7 @@ class GameWindow(arcade.Window):
                 # Limpiar la referencia
                 self.music_player = None
             except Exception as e:
-                print(f"Error al detener música: {e}")
+                audio_logger.warning("Error al detener música: %s", e)
                 self.music_player = None
     
     def pause_background_music(self):
@@ -70,9 +126,9 @@ class GameWindow(arcade.Window):
             try:
                 if hasattr(self.music_player, 'pause'):
                     self.music_player.pause()
-                print("Música de fondo pausada")
+                audio_logger.info("Música de fondo pausada")
             except Exception as e:
-                print(f"Error al pausar música: {e}")
+                audio_logger.warning("Error al pausar música: %s", e)
     
     def stop_temporary_music(self):
         """Detener música temporal"""
@@ -83,9 +139,9 @@ class GameWindow(arcade.Window):
                 elif hasattr(self.temp_music_player, 'pause'):
                     self.temp_music_player.pause()
                 self.temp_music_player = None
-                print("Música temporal detenida")
+                audio_logger.info("Música temporal detenida")
             except Exception as e:
-                print(f"Error al detener música temporal: {e}")
+                audio_logger.warning("Error al detener música temporal: %s", e)
                 self.temp_music_player = None
     
     def resume_background_music(self):
@@ -100,14 +156,16 @@ class GameWindow(arcade.Window):
                 else:
                     # Si no hay resume, recargar la música
                     self.load_current_music()
-                print("Música de fondo reanudada")
+                audio_logger.info("Música de fondo reanudada")
             except Exception as e:
-                print(f"Error al reanudar música: {e}")
+                audio_logger.warning("Error al reanudar música: %s", e)
                 # Intentar recargar como fallback
                 self.load_current_music()
     
     def play_temporary_music(self, music_file: str):
         """Reproducir música temporal (victoria/derrota)"""
+        if self.replay:
+            return None
         try:
             # Detener música temporal anterior si existe
             self.stop_temporary_music()
@@ -117,15 +175,17 @@ class GameWindow(arcade.Window):
             
             # Cargar y reproducir música temporal
             temp_music = arcade.load_sound(f"assets/sounds/{music_file}")
-            self.temp_music_player = arcade.play_sound(temp_music, volume=0.4, loop=False)
-            print(f"Música temporal reproducida: {music_file}")
+            self.temp_music_player = arcade.play_sound(temp_music, volume=self.game_config.SOUND_VOLUME, loop=False)
+            audio_logger.info("Música temporal reproducida: %s", music_file)
             return self.temp_music_player
         except Exception as e:
-            print(f"Error al reproducir música temporal {music_file}: {e}")
+            audio_logger.warning("Error al reproducir música temporal %s: %s", music_file, e)
             return None
 
     def load_current_music(self):
         """Cargar la música actual"""
+        if self.replay:
+            return
         try:
             # Detener música anterior primero
             self.stop_current_music()
@@ -135,10 +195,10 @@ class GameWindow(arcade.Window):
             music_file = f"assets/sounds/music/{filename}"
             
             self.background_music = arcade.load_sound(music_file)
-            self.music_player = arcade.play_sound(self.background_music, volume=0.3, loop=True)
-            print(f"Música cargada: {self.format_song_name(filename)}")
+            self.music_player = arcade.play_sound(self.background_music, volume=self.game_config.MUSIC_VOLUME, loop=True)
+            audio_logger.info("Música cargada: %s", self.format_song_name(filename))
         except Exception as e:
-            print(f"Error al cargar la música {filename}: {e}")
+            audio_logger.warning("Error al cargar la música %s: %s", filename, e)
             # Intentar con la primera canción como fallback
             if self.current_music_index != 0:
                 self.current_music_index = 0
@@ -148,16 +208,17 @@ class GameWindow(arcade.Window):
                     music_file = f"assets/sounds/music/{fallback_filename}"
                     
                     self.background_music = arcade.load_sound(music_file)
-                    self.music_player = arcade.play_sound(self.background_music, volume=0.3, loop=True)
-                    print(f"Música de respaldo cargada: {self.format_song_name(fallback_filename)}")
+                    self.music_player = arcade.play_sound(self.background_music, volume=self.game_config.MUSIC_VOLUME, loop=True)
+                    audio_logger.info("Música de respaldo cargada: %s", self.format_song_name(fallback_filename))
                 except Exception as e2:
-                    print(f"Error al cargar música de respaldo: {e2}")
+                    audio_logger.warning("Error al cargar música de respaldo: %s", e2)
     
     def change_music(self, direction):
         """Cambiar música (direction: 1 para siguiente, -1 para anterior)"""
         # Cambiar índice con navegación circular
         self.current_music_index = (self.current_music_index + direction) % len(self.music_list)
-        print(f"Cambiando a canción {self.current_music_index + 1}/{len(self.music_list)}: {self.format_song_name(self.music_list[self.current_music_index])}")
+        audio_logger.info("Cambiando a canción %d/%d: %s", self.current_music_index + 1, len(self.music_list),
+                          self.format_song_name(self.music_list[self.current_music_index]))
         self.load_current_music()
     
     def format_song_name(self, filename):
@@ -175,11 +236,28 @@ class GameWindow(arcade.Window):
         self.current_state = "menu"
         # TODO: Implementar menú principal
     
+    def setup_menu_widgets(self):
+        """Crear los botones del menú (se rehacen al cambiar el tamaño lógico)"""
+        style = parchment_button_style(self.game_config.COLORS, 'primary', 'accent')
+        x = self.game_config.SCREEN_WIDTH // 2
+        y = self.game_config.SCREEN_HEIGHT // 2 + 50
+        focus = self.menu_buttons.focus if self.menu_buttons else 0
+        self.menu_buttons = FocusList([
+            Button("INICIAR AVENTURA", x, y, 300, 50, style, self.setup_game),
+            Button("INSTRUCCIONES", x, y - 80, 300, 50, style, self.open_instructions),
+            Button("SALIR", x, y - 160, 300, 50, style, arcade.exit)
+        ], focus=focus, activate_keys=(arcade.key.SPACE,))
+        self.menu_layer = WidgetLayer(self.menu_buttons.buttons)
+    
+    def open_instructions(self):
+        """Mostrar la pantalla de instrucciones"""
+        self.show_instructions = True
+    
     def save_progress(self):
         """Guardar el progreso actual del juego"""
         if self.game_scene:
             self.saved_progress = self.game_scene
-            print("Progreso guardado")
+            logger.info("Progreso guardado")
     
     def return_to_menu(self):
         """Volver al menú principal guardando el progreso"""
@@ -193,15 +271,25 @@ class GameWindow(arcade.Window):
         if self.saved_progress:
             # Restaurar progreso guardado
             self.game_scene = self.saved_progress
-            print("Progreso restaurado")
+            logger.info("Progreso restaurado")
         else:
             # Crear nueva partida
             self.game_scene = GameScene(self.game_config)
     
     def on_draw(self):
         """Renderizar el frame actual"""
-        self.clear()
+        with self.render_target.activate():
+            self.render_target.framebuffer.clear(color=self.background_color)
+            if self.is_static_screen():
+                self.screen_cache.draw(self.screen_key(), self.draw_current_state)
+            else:
+                self.screen_cache.invalidate()
+                self.draw_current_state()
         
+        self.render_target.present()
+    
+    def draw_current_state(self):
+        """Dibujar la pantalla del estado actual"""
         if self.current_state == "menu":
             self.draw_menu()
         elif self.current_state == "gameplay":
@@ -211,6 +299,19 @@ class GameWindow(arcade.Window):
         elif self.current_state == "game_over":
             self.draw_game_over()
     
+    def is_static_screen(self) -> bool:
+        """Si la pantalla actual solo cambia con la entrada (menú, instrucciones y vistas fijas)"""
+        if self.current_state == "menu":
+            return True
+        if self.current_state == "gameplay" and self.game_scene:
+            return self.game_scene.is_static()
+        return False
+    
+    def screen_key(self):
+        """Identificador de la pantalla mostrada; el resto de cambios invalidan la caché"""
+        scene_state = self.game_scene.game_state if self.game_scene else None
+        return (self.current_state, scene_state, self.show_instructions)
+    
     def draw_menu(self):
         """Dibujar el menú principal con estilo de ruinas antiguas"""
         # Fondo atmosférico
@@ -277,17 +378,7 @@ class GameWindow(arcade.Window):
     
     def _draw_menu_lighting(self):
         """Dibujar efectos de iluminación del menú"""
-        # Luz central mística
-        center_x = self.game_config.SCREEN_WIDTH // 2
-        center_y = self.game_config.SCREEN_HEIGHT // 2
-        
-        # Resplandor central más intenso
-        for radius in [400, 300, 200, 100]:
-            alpha = max(0, 60 - radius // 8)
-            arcade.draw_circle_filled(
-                center_x, center_y, radius,
-                (*self.game_config.COLORS['torch'], alpha)
-            )
+        torch_color = self.game_config.COLORS['torch']
         
         # Antorchas en las esquinas derechas
         torch_positions = [
@@ -295,16 +386,11 @@ class GameWindow(arcade.Window):
             (self.game_config.SCREEN_WIDTH - 120, 120)
         ]
         
-        for tx, ty in torch_positions:
-            # Llama de antorcha
-            arcade.draw_circle_filled(tx, ty, 20, self.game_config.COLORS['torch'])
-            # Resplandor de antorcha
-            for radius in [50, 35, 20]:
-                alpha = max(0, 40 - radius)
-                arcade.draw_circle_filled(
-                    tx, ty, radius,
-                    (*self.game_config.COLORS['torch'], alpha)
-                )
+        # Luz central mística más intensa y antorchas, en una sola llamada
+        lights = [Light(self.game_config.SCREEN_WIDTH // 2, self.game_config.SCREEN_HEIGHT // 2,
+                        400, torch_color, 0.3)]
+        lights += torch_lights(torch_positions, 20, 70, torch_color)
+        get_light_layer("menu").draw(lights)
     
     def _draw_menu_title(self):
         """Dibujar título principal del menú"""
@@ -376,76 +462,8 @@ class GameWindow(arcade.Window):
         )
     
     def _draw_menu_buttons(self):
-        """Dibujar botones del menú"""
-        button_y = self.game_config.SCREEN_HEIGHT // 2 + 50
-        
-        # Botón principal - Iniciar Aventura
-        is_selected = self.selected_button == 0
-        self._draw_menu_button(
-            "INICIAR AVENTURA",
-            self.game_config.SCREEN_WIDTH // 2, button_y,
-            self.game_config.COLORS['accent'] if is_selected else self.game_config.COLORS['primary'],
-            self.game_config.COLORS['torch'] if is_selected else self.game_config.COLORS['text'],
-            is_selected
-        )
-        
-        # Botón secundario - Instrucciones
-        is_selected = self.selected_button == 1
-        self._draw_menu_button(
-            "INSTRUCCIONES",
-            self.game_config.SCREEN_WIDTH // 2, button_y - 80,
-            self.game_config.COLORS['accent'] if is_selected else self.game_config.COLORS['primary'],
-            self.game_config.COLORS['torch'] if is_selected else self.game_config.COLORS['text'],
-            is_selected
-        )
-        
-        # Botón terciario - Salir
-        is_selected = self.selected_button == 2
-        self._draw_menu_button(
-            "SALIR",
-            self.game_config.SCREEN_WIDTH // 2, button_y - 160,
-            self.game_config.COLORS['accent'] if is_selected else self.game_config.COLORS['primary'],
-            self.game_config.COLORS['torch'] if is_selected else self.game_config.COLORS['text'],
-            is_selected
-        )
-    
-    def _draw_menu_button(self, text, x, y, bg_color, text_color, is_selected=False):
-        """Dibujar un botón del menú con estilo de pergamino"""
-        # Efecto de resplandor si está seleccionado
-        if is_selected:
-            arcade.draw_lrbt_rectangle_filled(
-                x - 160, x + 160, y - 35, y + 35,
-                (*self.game_config.COLORS['torch'], 80)
-            )
-        
-        # Fondo del botón
-        arcade.draw_lrbt_rectangle_filled(
-            x - 150, x + 150, y - 25, y + 25,
-            (*bg_color, 220)
-        )
-        # Borde exterior
-        border_color = self.game_config.COLORS['torch'] if is_selected else self.game_config.COLORS['secondary']
-        border_width = 4 if is_selected else 3
-        arcade.draw_lrbt_rectangle_outline(
-            x - 150, x + 150, y - 25, y + 25,
-            border_color, border_width
-        )
-        # Borde interior
-        arcade.draw_lrbt_rectangle_outline(
-            x - 145, x + 145, y - 20, y + 20,
-            (*self.game_config.COLORS['accent'], 120), 2
-        )
-        
-        # Texto del botón
-        arcade.draw_text(
-            text,
-            x, y,
-            text_color,
-            font_size=20,
-            anchor_x="center",
-            anchor_y="center",
-            bold=True
-        )
+        """Dibujar botones del menú (geometría y textos en lote, rehechos solo al cambiar el foco)"""
+        self.menu_layer.draw()
     
     def _draw_menu_info(self):
         """Dibujar información adicional del menú"""
@@ -476,12 +494,19 @@ class GameWindow(arcade.Window):
     
     def _draw_music_selector(self):
         """Dibujar selector de música en la esquina superior izquierda"""
-        # Panel de música compacto para evitar superposición
+        # Panel de música compacto para evitar superposición; se recompone al cambiar de canción
         panel_x = 10
         panel_y = self.game_config.SCREEN_HEIGHT - 10
         panel_width = 220
         panel_height = 175
-        
+        get_panel_compositor().draw(
+            "music_selector", (panel_x, panel_y - panel_height, panel_width, panel_height),
+            self.current_music_index,
+            lambda: self._draw_music_panel(panel_x, panel_y, panel_width, panel_height)
+        )
+    
+    def _draw_music_panel(self, panel_x, panel_y, panel_width, panel_height):
+        """Contenido del selector de música (panel_y es el borde superior)"""
         arcade.draw_lrbt_rectangle_filled(
             panel_x, panel_x + panel_width, panel_y - panel_height, panel_y,
             (*self.game_config.COLORS['primary'], 200)
@@ -587,6 +612,17 @@ class GameWindow(arcade.Window):
     
     def _draw_instructions_screen(self):
         """Dibujar pantalla de instrucciones"""
+        # El texto no cambia: cada panel se compone una vez
+        compositor = get_panel_compositor()
+        compositor.draw(
+            "instructions",
+            (self.game_config.SCREEN_WIDTH // 2 - 400, self.game_config.SCREEN_HEIGHT // 2 - 300, 800, 600),
+            "instructions", self._draw_instructions_panel
+        )
+        compositor.draw("instructions_controls", (10, 10, 290, 70), "controls", self._draw_instructions_controls)
+    
+    def _draw_instructions_panel(self):
+        """Pergamino central con las instrucciones"""
         # Fondo de pergamino para instrucciones
         arcade.draw_lrbt_rectangle_filled(
             self.game_config.SCREEN_WIDTH // 2 - 400, self.game_config.SCREEN_WIDTH // 2 + 400,
@@ -626,6 +662,7 @@ class GameWindow(arcade.Window):
             "CONTROLES:",
             "• Flechas ←→: Navegar entre nodos",
             "• ESPACIO: Seleccionar nodo/puzzle",
+            "• WASD y +/-: Mover y acercar la cámara del mapa",
             "• ESC: Pausa/Salir",
             "",
             "TIPOS DE PUZZLES:",
@@ -672,8 +709,9 @@ class GameWindow(arcade.Window):
                  bold=bold
             )
             y_offset -= 25
-         
-         # Instrucciones de control en la esquina inferior izquierda
+    
+    def _draw_instructions_controls(self):
+        """Instrucciones de control en la esquina inferior izquierda"""
         arcade.draw_lrbt_rectangle_filled(
             10, 300, 10, 80,
             (*self.game_config.COLORS['primary'], 180)
@@ -704,16 +742,10 @@ class GameWindow(arcade.Window):
         torch_x = self.game_config.SCREEN_WIDTH - 120
         torch_y = self.game_config.SCREEN_HEIGHT - 120
         
-        # Llama de antorcha
-        arcade.draw_circle_filled(torch_x, torch_y, 20, self.game_config.COLORS['torch'])
-        
-        # Resplandor de antorcha
-        for radius in [50, 35, 20]:
-            alpha = max(0, 40 - radius)
-            arcade.draw_circle_filled(
-                torch_x, torch_y, radius,
-                (*self.game_config.COLORS['torch'], alpha)
-            )
+        # Llama y resplandor de antorcha
+        get_light_layer("instructions").draw(
+            torch_lights([(torch_x, torch_y)], 20, 70, self.game_config.COLORS['torch'])
+        )
         
         # Fondo de musgo detrás de la antorcha
         arcade.draw_lrbt_rectangle_filled(
@@ -759,72 +791,71 @@ class GameWindow(arcade.Window):
         )
     
     def on_mouse_press(self, x, y, button, modifiers):
+        """Encolar clics del mouse (en coordenadas lógicas)"""
+        x, y = self.render_target.to_logical(x, y)
+        self.input_queue.push(MOUSE_PRESS, x, y, button)
+        self.wake()
+    
+    def on_mouse_scroll(self, x, y, scroll_x, scroll_y):
+        """Encolar la rueda del ratón (en coordenadas lógicas)"""
+        x, y = self.render_target.to_logical(x, y)
+        self.input_queue.push(MOUSE_SCROLL, x, y, scroll_x, scroll_y)
+        self.wake()
+    
+    def on_key_press(self, key, modifiers):
+        """Encolar teclas presionadas (se procesan en on_update)"""
+        self.input_queue.push(KEY_PRESS, key, modifiers)
+        self.wake()
+    
+    def on_resize(self, width, height):
+        """La imagen lógica se reescala sola; basta con volver al ritmo normal"""
+        super().on_resize(width, height)
+        self.wake()
+    
+    def dispatch_input(self, event: InputEvent):
+        """Procesar un evento de entrada encolado"""
+        self.input_handlers[event.kind](*event.args)
+    
+    def handle_mouse_press(self, x, y, button):
         """Manejar clics del mouse"""
+        if button != arcade.MOUSE_BUTTON_LEFT:
+            return
         if self.current_state == "menu":
-            # Verificar si se hizo clic en el botón de inicio
-            button_x = self.game_config.SCREEN_WIDTH // 2
-            button_y = self.game_config.SCREEN_HEIGHT // 2
-            button_width = 200
-            button_height = 50
-            
-            if (button_x - button_width // 2 <= x <= button_x + button_width // 2 and
-                button_y - button_height // 2 <= y <= button_y + button_height // 2):
-                self.setup_game()
+            # Activar el botón del menú bajo el cursor
+            if not self.show_instructions:
+                self.menu_buttons.handle_click(x, y)
+        elif self.current_state == "gameplay" and self.game_scene:
+            self.game_scene.on_mouse_press(x, y, button)
+    
+    def handle_mouse_scroll(self, x, y, scroll_x, scroll_y):
+        """Manejar la rueda del ratón"""
+        if self.current_state == "gameplay" and self.game_scene:
+            self.game_scene.on_mouse_scroll(x, y, scroll_x, scroll_y)
     
-    def on_key_press(self, key, modifiers):
+    def handle_key_press(self, key, modifiers):
         """Manejar teclas presionadas"""
         if self.current_state == "menu":
             self.handle_menu_input(key, modifiers)
         elif self.current_state == "gameplay":
-            # Verificar si GameScene está en estado pause
-            if self.game_scene and self.game_scene.game_state == "pause":
-                self.handle_pause_navigation(key, modifiers)
-            else:
-                # Pasar todas las teclas al game_scene para manejo normal
-                if self.game_scene:
-                    self.game_scene.on_key_press(key, modifiers)
+            # Pasar todas las teclas al game_scene (incluida la navegación de pausa)
+            if self.game_scene:
+                self.game_scene.on_key_press(key, modifiers)
         elif key == arcade.key.ESCAPE:
             # Solo manejar ESC para salir si no estamos en gameplay
             arcade.exit()
     
-    def handle_pause_navigation(self, key, modifiers):
-        """Manejar navegación en pantalla de pausa"""
-        if key == arcade.key.UP:
-            # Navegar hacia arriba (Reanudar)
-            self.game_scene.selected_pause_button = 0
-        elif key == arcade.key.DOWN:
-            # Navegar hacia abajo (Salir al mapa)
-            self.game_scene.selected_pause_button = 1
-        elif key == arcade.key.ENTER or key == arcade.key.SPACE:
-            # Ejecutar acción del botón seleccionado
-            if self.game_scene.selected_pause_button == 0:
-                # Reanudar puzzle - reanudar timer
-                if self.game_scene.puzzle_manager.current_puzzle:
-                    self.game_scene.puzzle_manager.current_puzzle.resume_timer()
-                self.game_scene.game_state = "puzzle_view"
-            elif self.game_scene.selected_pause_button == 1:
-                # Salir al mapa - no reanudar timer
-                self.game_scene.game_state = "map_view"
-        elif key == arcade.key.ESCAPE:
-            # Salir al mapa con ESC (comportamiento por defecto) - no reanudar timer
-            self.game_scene.game_state = "map_view"
-    
     def handle_menu_input(self, key, modifiers):
         """Manejar entrada en el menú"""
         if self.show_instructions:
             if key == arcade.key.ESCAPE:
                 self.show_instructions = False
         else:
-            # Navegación con flechas
-            if key == arcade.key.UP:
-                self.selected_button = (self.selected_button - 1) % 3
-            elif key == arcade.key.DOWN:
-                self.selected_button = (self.selected_button + 1) % 3
-            elif key == arcade.key.SPACE:
-                self.execute_selected_action()
+            # Navegación con flechas y ESPACIO sobre los botones
+            if self.menu_buttons.handle_key(key):
+                return
             
             # Cambio de música
-            elif key == arcade.key.A:
+            if key == arcade.key.A:
                 self.change_music(-1)
             elif key == arcade.key.D:
                 self.change_music(1)
@@ -835,14 +866,87 @@ class GameWindow(arcade.Window):
     
     def execute_selected_action(self):
         """Ejecutar la acción del botón seleccionado"""
-        if self.selected_button == 0:  # Iniciar Aventura
-            self.setup_game()
-        elif self.selected_button == 1:  # Instrucciones
-            self.show_instructions = True
-        elif self.selected_button == 2:  # Salir
-            arcade.exit()
+        self.menu_buttons.focused.activate()
+    
+    def on_config_changed(self, changed):
+        """Aplicar valores de configuración modificados"""
+        if {"SCREEN_WIDTH", "SCREEN_HEIGHT", "RENDER_SCALE"} & set(changed):
+            self.render_target.configure(
+                self.game_config.SCREEN_WIDTH, self.game_config.SCREEN_HEIGHT, self.game_config.RENDER_SCALE
+            )
+        if "SCREEN_WIDTH" in changed or "SCREEN_HEIGHT" in changed:
+            if not self.fullscreen:
+                self.set_size(self.game_config.SCREEN_WIDTH, self.game_config.SCREEN_HEIGHT)
+            self.setup_menu_widgets()
+            if self.game_scene:
+                self.game_scene.setup_ui()
+        if "FULLSCREEN" in changed:
+            self.set_fullscreen(self.game_config.FULLSCREEN)
+        if "VSYNC" in changed:
+            self.set_vsync(self.game_config.VSYNC)
+        if "MUSIC_VOLUME" in changed and self.music_player:
+            self.music_player.volume = self.game_config.MUSIC_VOLUME
+        if "SOUND_VOLUME" in changed and self.temp_music_player:
+            self.temp_music_player.volume = self.game_config.SOUND_VOLUME
+        self.screen_cache.invalidate()
     
     def on_update(self, delta_time):
-        """Actualizar la lógica del juego"""
+        """Repartir el tiempo del fotograma en pasos fijos de lógica"""
+        self.game_loop.advance(delta_time)
+        
+        # Tras un rato sin cambios en una pantalla estática se baja el ritmo de la ventana
+        self.static_time = self.static_time + delta_time if self.is_static_screen() else 0.0
+        if not self.idle and self.static_time >= self.game_config.IDLE_DELAY:
+            self.set_idle(True)
+        elif self.idle and not self.static_time:
+            self.set_idle(False)
+    
+    def wake(self):
+        """Volver al ritmo normal en cuanto llega entrada del jugador"""
+        self.static_time = 0.0
+        if self.idle:
+            self.set_idle(False)
+    
+    def set_idle(self, idle: bool):
+        """Cambiar entre el ritmo normal y el de reposo (la lógica sigue a su paso fijo)"""
+        self.idle = idle
+        config = self.game_config
+        rate = 1.0 / config.IDLE_FRAME_RATE if idle else self.frame_rate
+        # Cada fotograma de reposo tiene que poder ponerse al día con varios pasos
+        self.game_loop.max_ticks_per_frame = max(
+            config.MAX_TICKS_PER_FRAME, math.ceil(rate * config.TICK_RATE) + 1
+        )
+        self.set_update_rate(rate)
+        self.set_draw_rate(rate)
+        logger.debug("Ritmo de reposo" if idle else "Ritmo normal")
+    
+    def tick(self, delta_time):
+        """Un paso de lógica de duración fija"""
+        # Avanzar el reloj, grabar el paso y procesar la entrada acumulada
+        events = self.input_queue.drain()
+        self.game_clock.tick(delta_time)
+        if self.input_recorder:
+            self.input_recorder.write_frame(delta_time, events)
+        for event in events:
+            self.dispatch_input(event)
+        if events:
+            self.screen_cache.invalidate()
+        
+        # Recargar data/user_config.json si se editó
+        self.config_service.poll()
+        
         if self.current_state == "gameplay" and self.game_scene:
             self.game_scene.on_update(delta_time)
+    
+    def shutdown_scenes(self):
+        """Cancelar los niveles pendientes y detener el hilo de generación de la partida"""
+        for scene in (self.game_scene, self.saved_progress):
+            if scene:
+                scene.level_pipeline.shutdown()
+    
+    def on_close(self):
+        """Cerrar la grabación y la generación de niveles antes de cerrar la ventana"""
+        if self.input_recorder:
+            self.input_recorder.close()
+        self.shutdown_scenes()
+        super().on_close()
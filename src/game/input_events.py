@@ -0,0 +1,137 @@
+"""
+Cola de eventos de entrada con grabación binaria para repetir sesiones
+"""
+
+import os
+import struct
+import time
+from typing import BinaryIO, List, NamedTuple, Optional, Tuple
+from utils.game_clock import GameClock
+from utils.logger import get_logger
+
+logger = get_logger("input")
+
+# Tipos de registro
+TICK = 0
+KEY_PRESS = 1
+MOUSE_PRESS = 2
+MOUSE_SCROLL = 3
+
+# Formato de los argumentos de cada registro (precedidos por un byte con el tipo)
+RECORD_FORMATS = {
+    TICK: struct.Struct("<d"),            # delta_time
+    KEY_PRESS: struct.Struct("<QH"),      # tecla, modificadores
+    MOUSE_PRESS: struct.Struct("<ffB"),   # x, y, botón
+    MOUSE_SCROLL: struct.Struct("<ffff")  # x, y, scroll_x, scroll_y
+}
+
+# Cabecera: firma, versión y semilla de la sesión
+REPLAY_MAGIC = b"CDXREC"
+REPLAY_VERSION = 1
+HEADER = struct.Struct("<6sHQ")
+
+class InputEvent(NamedTuple):
+    """Evento de entrada con la marca de tiempo del reloj de juego"""
+    kind: int
+    time: float
+    args: Tuple
+
+class InputQueue:
+    """Acumula los eventos de la ventana hasta la siguiente actualización"""
+
+    def __init__(self, clock: GameClock):
+        self.clock = clock
+        self.events: List[InputEvent] = []
+
+    def push(self, kind: int, *args):
+        """Encolar un evento"""
+        self.events.append(InputEvent(kind, self.clock.time, args))
+
+    def drain(self) -> List[InputEvent]:
+        """Sacar todos los eventos pendientes en orden de llegada"""
+        events, self.events = self.events, []
+        return events
+
+class InputRecorder:
+    """Escribe la sesión como registros binarios: un TICK por actualización y sus eventos"""
+
+    # Fotogramas entre volcados a disco (una grabación sirve aunque el juego se cierre mal)
+    FLUSH_INTERVAL = 60
+
+    def __init__(self, stream: BinaryIO, seed: int):
+        self.stream = stream
+        self.seed = seed
+        self.frames = 0
+        self.stream.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed))
+
+    @classmethod
+    def create(cls, directory: str, seed: int, keep: int = 10) -> Optional['InputRecorder']:
+        """Abrir una grabación nueva en `directory` y borrar las más antiguas"""
+        try:
+            os.makedirs(directory, exist_ok=True)
+            existing = sorted(name for name in os.listdir(directory) if name.endswith(".cdxrec"))
+            for name in existing[:max(0, len(existing) - keep + 1)]:
+                os.remove(os.path.join(directory, name))
+
+            filename = time.strftime("%Y%m%d-%H%M%S") + f"-{seed:08x}.cdxrec"
+            path = os.path.join(directory, filename)
+            return cls(open(path, 'wb'), seed)
+        except OSError as e:
+            logger.warning("No se pudo crear la grabación de entrada: %s", e)
+            return None
+
+    @property
+    def path(self) -> str:
+        """Ruta del archivo de grabación"""
+        return getattr(self.stream, 'name', '')
+
+    def write_frame(self, delta_time: float, events: List[InputEvent]):
+        """Grabar una actualización con los eventos que procesa"""
+        chunks = [bytes((TICK,)), RECORD_FORMATS[TICK].pack(delta_time)]
+        for event in events:
+            chunks.append(bytes((event.kind,)))
+            chunks.append(RECORD_FORMATS[event.kind].pack(*event.args))
+        self.stream.write(b"".join(chunks))
+
+        self.frames += 1
+        if self.frames % self.FLUSH_INTERVAL == 0:
+            self.stream.flush()
+
+    def close(self):
+        """Cerrar el archivo de grabación"""
+        if not self.stream.closed:
+            self.stream.close()
+
+class Replay(NamedTuple):
+    """Sesión grabada: semilla y fotogramas (delta_time, eventos)"""
+    seed: int
+    frames: List[Tuple[float, List[InputEvent]]]
+
+def read_replay(path: str) -> Replay:
+    """Leer una grabación completa"""
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    magic, version, seed = HEADER.unpack_from(data, 0)
+    if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+        raise ValueError(f"{path} no es una grabación compatible")
+
+    frames: List[Tuple[float, List[InputEvent]]] = []
+    clock = 0.0
+    offset = HEADER.size
+    while offset < len(data):
+        kind = data[offset]
+        record = RECORD_FORMATS.get(kind)
+        if record is None or offset + 1 + record.size > len(data):
+            # Registro desconocido o cortado (el juego se cerró mientras grababa)
+            break
+        args = record.unpack_from(data, offset + 1)
+        offset += 1 + record.size
+
+        if kind == TICK:
+            frames.append((args[0], []))
+            clock += args[0]
+        elif frames:
+            # Los eventos se marcaron con el reloj del fotograma anterior
+            frames[-1][1].append(InputEvent(kind, clock - frames[-1][0], args))
+    return Replay(seed, frames)
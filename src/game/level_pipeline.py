@@ -0,0 +1,80 @@
+"""
+Generación de niveles en segundo plano
+"""
+
+import random
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Mapping, Optional
+from game.memory_map import MemoryMap
+from utils.config import Config
+from utils.content import DifficultyTier, get_content
+
+class PreparedLevel:
+    """Nivel ya generado y listo para jugarse"""
+
+    def __init__(self, level: int, tier: Optional[DifficultyTier], memory_map: MemoryMap):
+        self.level = level
+        self.tier = tier
+        self.memory_map = memory_map
+
+    @property
+    def name(self) -> str:
+        """Nombre del nivel de dificultad"""
+        return self.tier.name if self.tier else f"Nivel {self.level}"
+
+    @property
+    def anomaly_chance(self) -> float:
+        """Probabilidad de anomalías del nivel"""
+        return self.tier.anomaly_chance if self.tier else 1.0
+
+class LevelPipeline:
+    """Prepara el siguiente nivel en un hilo de trabajo mientras se juega el actual"""
+
+    def __init__(self, config: Config, seed: Optional[int] = None):
+        self.config = config
+        self._seed_source = random.Random(seed)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-pipeline")
+        self._pending: Dict[int, Future] = {}
+
+    @property
+    def difficulty_levels(self) -> Mapping[int, DifficultyTier]:
+        """Niveles de dificultad (de data/game_data.json)"""
+        return get_content().difficulty_levels
+    
+    def get_tier(self, level: int) -> Optional[DifficultyTier]:
+        """Obtener la configuración de un nivel de dificultad"""
+        return self.difficulty_levels.get(level)
+
+    def has_level(self, level: int) -> bool:
+        """Verificar si existe un nivel de dificultad"""
+        return level in self.difficulty_levels
+
+    def build_level(self, level: int, seed: Optional[int] = None) -> PreparedLevel:
+        """Generar un nivel completo (mapa, distribución, puzzles e índices)"""
+        tier = self.get_tier(level)
+        memory_map = MemoryMap(self.config, rng=random.Random(seed))
+        num_nodes = tier.puzzle_count if tier else None
+        memory_map.generate_map(difficulty_level=level, num_nodes=num_nodes)
+        return PreparedLevel(level, tier, memory_map)
+
+    def prefetch(self, level: int):
+        """Empezar a generar un nivel en segundo plano"""
+        if level in self._pending or not self.has_level(level):
+            return
+        # La semilla se decide aquí para que el resultado no dependa del hilo
+        seed = self._seed_source.getrandbits(32)
+        self._pending[level] = self._executor.submit(self.build_level, level, seed)
+
+    def take(self, level: int) -> PreparedLevel:
+        """Obtener un nivel; si no se pre-generó se construye en el momento"""
+        future = self._pending.pop(level, None)
+        if future is None:
+            return self.build_level(level, self._seed_source.getrandbits(32))
+        return future.result()
+
+    def shutdown(self):
+        """Detener el hilo de trabajo"""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,150 @@
+"""
+Análisis del grafo del mapa mental
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Set, Tuple
+
+# Distancia de los nodos a los que no se puede llegar
+UNREACHABLE = 10 ** 9
+
+class MapAnalytics:
+    """Distancias, desbloqueos y recomendaciones mantenidos de forma incremental"""
+
+    # Pesos de la puntuación de recomendación
+    UNLOCK_WEIGHT = 1.0
+    DISTANCE_WEIGHT = 2.0
+    DIFFICULTY_WEIGHT = 1.5
+    WEAK_AREA_BONUS = 1.0
+
+    def __init__(self, memory_map):
+        self.memory_map = memory_map
+        self.distances: Dict[int, int] = {}
+        self.unlocks: Dict[int, Tuple[int, ...]] = {}
+        self.weak_puzzle_types: Set[str] = set()
+        self.ranking: Tuple[int, ...] = ()
+        self.rank_positions: Dict[int, int] = {}
+        self.best_node_id = None
+        self.reset()
+
+    def reset(self):
+        """Recalcular todo desde cero (al generar un mapa)"""
+        nodes = self.memory_map.nodes
+        self.distances = {node_id: UNREACHABLE for node_id in nodes}
+
+        sources = [node_id for node_id, node in nodes.items() if node.completed]
+        for node_id in sources:
+            self.distances[node_id] = 0
+
+        # Sin nodos completados, el nodo inicial hace de frontera virtual
+        start_id = self.memory_map.start_node_id
+        if start_id in nodes and not nodes[start_id].completed:
+            self.distances[start_id] = min(self.distances[start_id], 1)
+            sources.append(start_id)
+
+        self._propagate(sources)
+        self.unlocks = {}
+        self._refresh_unlocks(nodes.keys())
+        self._rebuild_ranking()
+
+    def _propagate(self, sources: Iterable[int]) -> Set[int]:
+        """BFS multi-fuente que solo relaja distancias que disminuyen"""
+        nodes = self.memory_map.nodes
+        distances = self.distances
+        changed = set(sources)
+        queue = deque(changed)
+
+        while queue:
+            node_id = queue.popleft()
+            next_distance = distances[node_id] + 1
+            for neighbor_id in nodes[node_id].connections:
+                if neighbor_id in distances and distances[neighbor_id] > next_distance:
+                    distances[neighbor_id] = next_distance
+                    changed.add(neighbor_id)
+                    queue.append(neighbor_id)
+
+        return changed
+
+    def _refresh_unlocks(self, node_ids: Iterable[int]):
+        """Recalcular qué nodos desbloquearía completar cada nodo"""
+        nodes = self.memory_map.nodes
+        distances = self.distances
+        for node_id in node_ids:
+            node = nodes[node_id]
+            if node.completed:
+                self.unlocks.pop(node_id, None)
+                continue
+            self.unlocks[node_id] = tuple(
+                neighbor_id for neighbor_id in node.connections
+                if neighbor_id in distances and distances[neighbor_id] > 1
+            )
+
+    def _rebuild_ranking(self):
+        """Ordenar los nodos pendientes por conveniencia"""
+        nodes = self.memory_map.nodes
+        scores = []
+        for node_id, distance in self.distances.items():
+            node = nodes[node_id]
+            if node.completed or distance >= UNREACHABLE:
+                continue
+            score = (
+                len(self.unlocks.get(node_id, ())) * self.UNLOCK_WEIGHT
+                - (distance - 1) * self.DISTANCE_WEIGHT
+                - node.difficulty * self.DIFFICULTY_WEIGHT
+            )
+            if node.puzzle_type in self.weak_puzzle_types:
+                score += self.WEAK_AREA_BONUS
+            scores.append((-score, node_id))
+
+        scores.sort()
+        self.ranking = tuple(node_id for _, node_id in scores)
+        self.rank_positions = {node_id: i for i, node_id in enumerate(self.ranking)}
+        self.best_node_id = next(
+            (node_id for node_id in self.ranking if self.distances[node_id] == 1), None
+        )
+
+    def on_node_completed(self, node_id: int):
+        """Actualizar incrementalmente tras completar un nodo"""
+        if node_id not in self.distances:
+            return
+
+        self.distances[node_id] = 0
+        changed = self._propagate([node_id])
+
+        # Solo cambian los desbloqueos alrededor de las distancias modificadas
+        nodes = self.memory_map.nodes
+        affected = set(changed)
+        for changed_id in changed:
+            affected.update(n for n in nodes[changed_id].connections if n in nodes)
+        self._refresh_unlocks(affected)
+        self._rebuild_ranking()
+
+    def set_weak_puzzle_types(self, puzzle_types: Set[str]):
+        """Actualizar las áreas débiles del jugador"""
+        if puzzle_types != self.weak_puzzle_types:
+            self.weak_puzzle_types = set(puzzle_types)
+            self._rebuild_ranking()
+
+    def get_distance(self, node_id: int) -> int:
+        """Distancia al nodo completado más cercano"""
+        return self.distances.get(node_id, UNREACHABLE)
+
+    def is_available(self, node_id: int) -> bool:
+        """Verificar si un nodo se puede jugar ahora"""
+        return self.distances.get(node_id) == 1
+
+    def get_unlocks(self, node_id: int) -> Tuple[int, ...]:
+        """Nodos que se desbloquearían al completar un nodo"""
+        return self.unlocks.get(node_id, ())
+
+    def get_recommended(self) -> Tuple[int, ...]:
+        """Nodos pendientes ordenados de más a menos recomendable"""
+        return self.ranking
+
+    def get_rank(self, node_id: int) -> int:
+        """Posición de un nodo en la recomendación (-1 si no aplica)"""
+        return self.rank_positions.get(node_id, -1)
+
+    def get_best_node_id(self):
+        """Nodo disponible más recomendable"""
+        return self.best_node_id
@@ -3,9 +3,13 @@ Sistema de Anomalías de la Memoria
 """
 
 import random
-import time
-from typing import List, Dict, Any
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, NamedTuple, Optional, Type
+import numpy as np
+from utils.effects_pipeline import Modifier
 from utils.config import Config
+from utils.game_clock import game_time
+from utils.content import get_content
 
 class MemoryAnomaly:
     """Clase base para anomalías de la memoria"""
@@ -17,12 +21,21 @@ class MemoryAnomaly:
         self.active = False
         self.start_time = 0
         self.intensity = 1.0
+        self.rng = random.Random()
+        self.activations = 0  # distingue cada activación de la misma instancia
     
     def activate(self, intensity: float = 1.0):
         """Activar la anomalía"""
         self.active = True
-        self.start_time = time.time()
+        self.start_time = game_time()
         self.intensity = intensity
+        self.activations += 1
+        # Semilla propia sacada del generador global (sembrado por sesión, así se repite igual)
+        self.rng.seed(random.getrandbits(32))
+    
+    def elapsed(self) -> float:
+        """Segundos desde la activación"""
+        return game_time() - self.start_time
     
     def deactivate(self):
         """Desactivar la anomalía"""
@@ -32,12 +45,16 @@ class MemoryAnomaly:
         """Verificar si la anomalía ha expirado"""
         if not self.active or self.duration == 0:
             return False
-        return time.time() - self.start_time >= self.duration
+        return game_time() - self.start_time >= self.duration
     
     def update(self, delta_time: float):
         """Actualizar el estado de la anomalía"""
         if self.active and self.is_expired():
             self.deactivate()
+    
+    def modifier(self) -> Optional[Modifier]:
+        """Modificador que aporta mientras está activa (None si no afecta a los puzzles)"""
+        return None
 
 class ElOlvido(MemoryAnomaly):
     """Anomalía que oscurece partes del tablero"""
@@ -45,7 +62,7 @@ class ElOlvido(MemoryAnomaly):
     def __init__(self):
         super().__init__(
             "El Olvido",
-            "Oscurece partes del tablero temporalmente",
+            get_content().anomaly_descriptions["el_olvido"],
             duration=8.0
         )
         self.obscured_areas: List[Dict[str, Any]] = []
@@ -58,9 +75,9 @@ class ElOlvido(MemoryAnomaly):
         
         for _ in range(num_areas):
             area = {
-                'x': random.randint(100, 1100),
-                'y': random.randint(100, 700),
-                'radius': random.randint(50, 150),
+                'x': self.rng.randint(100, 1100),
+                'y': self.rng.randint(100, 700),
+                'radius': self.rng.randint(50, 150),
                 'opacity': 0.7 + intensity * 0.3
             }
             self.obscured_areas.append(area)
@@ -69,17 +86,46 @@ class ElOlvido(MemoryAnomaly):
         """Obtener áreas oscurecidas"""
         return self.obscured_areas if self.active else []
 
+class DistractionEvent(NamedTuple):
+    """Distracción programada: texto falso, posición y ventana de tiempo desde la activación"""
+    start: float
+    end: float
+    text: str
+    x: float
+    y: float
+
+class DistractionTimeline:
+    """Distracciones ordenadas en el tiempo, consumidas con un cursor que solo avanza"""
+    
+    def __init__(self, events: List[DistractionEvent]):
+        self.events = events
+        self.cursor = 0
+    
+    def current(self, elapsed: float) -> Optional[DistractionEvent]:
+        """Distracción visible en `elapsed` (el tiempo solo puede avanzar)"""
+        events = self.events
+        while self.cursor < len(events) and events[self.cursor].end <= elapsed:
+            self.cursor += 1
+        if self.cursor < len(events) and events[self.cursor].start <= elapsed:
+            return events[self.cursor]
+        return None
+
 class ElRuido(MemoryAnomaly):
     """Anomalía que introduce información falsa"""
     
+    # Duración de cada distracción y pausa entre ellas (la pausa se divide por la intensidad)
+    SHOW_TIME = (0.7, 1.4)
+    GAP_TIME = (0.6, 1.8)
+    
     def __init__(self):
         super().__init__(
             "El Ruido",
-            "Introduce información falsa o distractora",
+            get_content().anomaly_descriptions["el_ruido"],
             duration=6.0
         )
         self.false_information: List[str] = []
         self.distraction_level = 0.0
+        self.timeline = DistractionTimeline([])
     
     def activate(self, intensity: float = 1.0):
         super().activate(intensity)
@@ -96,17 +142,40 @@ class ElRuido(MemoryAnomaly):
         ]
         
         num_false = int(1 + intensity * 2)
-        self.false_information = random.sample(false_items, min(num_false, len(false_items)))
+        self.false_information = self.rng.sample(false_items, min(num_false, len(false_items)))
+        self.timeline = self._schedule_distractions()
+    
+    def _schedule_distractions(self) -> DistractionTimeline:
+        """Programar todas las distracciones de la activación de una vez"""
+        events = []
+        level = max(0.1, self.distraction_level)
+        t = self.rng.uniform(*self.GAP_TIME) / level
+        while self.false_information:
+            end = t + self.rng.uniform(*self.SHOW_TIME)
+            if end > self.duration:
+                break
+            events.append(DistractionEvent(
+                t, end,
+                self.rng.choice(self.false_information),
+                self.rng.uniform(200, 1000),
+                self.rng.uniform(150, 650)
+            ))
+            t = end + self.rng.uniform(*self.GAP_TIME) / level
+        return DistractionTimeline(events)
     
     def get_false_information(self) -> List[str]:
         """Obtener información falsa"""
         return self.false_information if self.active else []
     
+    def current_distraction(self) -> Optional[DistractionEvent]:
+        """Distracción que toca mostrar ahora"""
+        if not self.active:
+            return None
+        return self.timeline.current(self.elapsed())
+    
     def should_show_distraction(self) -> bool:
         """Verificar si debe mostrar distracción"""
-        if not self.active:
-            return False
-        return random.random() < self.distraction_level * 0.3
+        return self.current_distraction() is not None
 
 class LaRepeticion(MemoryAnomaly):
     """Anomalía que obliga a repetir puzzles más difíciles"""
@@ -114,7 +183,7 @@ class LaRepeticion(MemoryAnomaly):
     def __init__(self):
         super().__init__(
             "La Repetición",
-            "Obliga a resolver una versión más difícil de un puzzle completado",
+            get_content().anomaly_descriptions["la_repeticion"],
             duration=0  # Duración indefinida hasta completar
         )
         self.original_puzzle_type = ""
@@ -131,6 +200,9 @@ class LaRepeticion(MemoryAnomaly):
         """Obtener modificador de dificultad"""
         return self.increased_difficulty if self.active else 0.0
     
+    def modifier(self) -> Optional[Modifier]:
+        return Modifier(difficulty_delta=self.increased_difficulty)
+    
     def increment_attempts(self):
         """Incrementar intentos realizados"""
         self.attempts_made += 1
@@ -139,53 +211,121 @@ class LaRepeticion(MemoryAnomaly):
         """Verificar si debe desactivarse"""
         return self.attempts_made >= 3  # Máximo 3 intentos
 
+class AnomalyStore:
+    """Estado de las anomalías en arrays: una ranura preasignada por tipo"""
+    
+    def __init__(self, anomaly_types: Mapping[str, Type[MemoryAnomaly]]):
+        self.types = list(anomaly_types)
+        self.index = {anomaly_type: slot for slot, anomaly_type in enumerate(self.types)}
+        # Una instancia por tipo que se reutiliza en cada activación
+        self.instances = [anomaly_class() for anomaly_class in anomaly_types.values()]
+        
+        count = len(self.types)
+        self.active = np.zeros(count, dtype=bool)
+        self.start_times = np.zeros(count, dtype=np.float64)
+        self.durations = np.zeros(count, dtype=np.float64)  # 0 = hasta desactivarla
+        self.intensities = np.zeros(count, dtype=np.float64)
+        
+        # Cada cambio del conjunto activo incrementa la versión e invalida la vista
+        self.version = 0
+        self._view_version = -1
+        self._view: Mapping[str, MemoryAnomaly] = MappingProxyType({})
+    
+    def activate(self, anomaly_type: str, intensity: float = 1.0) -> MemoryAnomaly:
+        """Activar (o reiniciar) la anomalía de un tipo"""
+        slot = self.index[anomaly_type]
+        anomaly = self.instances[slot]
+        anomaly.activate(intensity)
+        
+        self.active[slot] = True
+        self.start_times[slot] = anomaly.start_time
+        self.durations[slot] = anomaly.duration
+        self.intensities[slot] = anomaly.intensity
+        self.version += 1
+        return anomaly
+    
+    def deactivate(self, anomaly_type: str):
+        """Desactivar la anomalía de un tipo"""
+        slot = self.index[anomaly_type]
+        if self.active[slot]:
+            self.instances[slot].deactivate()
+            self.active[slot] = False
+            self.version += 1
+    
+    def expire(self, now: float):
+        """Desactivar de una vez todas las anomalías cuya duración ha pasado"""
+        expired = self.active & (self.durations > 0) & (now - self.start_times >= self.durations)
+        if expired.any():
+            for slot in np.flatnonzero(expired):
+                self.instances[slot].deactivate()
+            self.active[expired] = False
+            self.version += 1
+    
+    def is_active(self, anomaly_type: str) -> bool:
+        """Si la anomalía de un tipo está activa"""
+        slot = self.index.get(anomaly_type)
+        return slot is not None and bool(self.active[slot])
+    
+    def active_view(self) -> Mapping[str, MemoryAnomaly]:
+        """Anomalías activas por tipo (solo se reconstruye cuando cambia la versión)"""
+        if self._view_version != self.version:
+            self._view = MappingProxyType({
+                self.types[slot]: self.instances[slot] for slot in np.flatnonzero(self.active)
+            })
+            self._view_version = self.version
+        return self._view
+
 class AnomalyManager:
     """Gestor de anomalías de la memoria"""
     
     def __init__(self, config: Config):
         self.config = config
-        self.active_anomalies: Dict[str, MemoryAnomaly] = {}
         self.anomaly_types = {
             "el_olvido": ElOlvido,
             "el_ruido": ElRuido,
             "la_repeticion": LaRepeticion
         }
+        self.store = AnomalyStore(self.anomaly_types)
         
-        # Probabilidades de activación
-        self.activation_probabilities = {
-            "el_olvido": 0.3,
-            "el_ruido": 0.4,
-            "la_repeticion": 0.2
-        }
+        # Probabilidad de que aparezca una anomalía (según el nivel de dificultad)
+        self.anomaly_chance = 1.0
         
-        # Tiempo entre activaciones
-        self.last_activation_time = 0
+        # Tiempo entre activaciones (el reloj de juego empieza en 0)
+        self.last_activation_time = float('-inf')
         self.min_activation_interval = 30.0  # segundos
     
+    @property
+    def active_anomalies(self) -> Mapping[str, MemoryAnomaly]:
+        """Anomalías activas por tipo"""
+        return self.store.active_view()
+    
+    @property
+    def activation_probabilities(self) -> Mapping[str, float]:
+        """Probabilidades de activación (de data/game_data.json)"""
+        return get_content().anomaly_probabilities
+    
     def can_activate_anomaly(self) -> bool:
         """Verificar si puede activar una anomalía"""
-        return time.time() - self.last_activation_time >= self.min_activation_interval
+        return game_time() - self.last_activation_time >= self.min_activation_interval
     
     def try_activate_anomaly(self, difficulty_level: float = 1.0) -> bool:
         """Intentar activar una anomalía aleatoria"""
         if not self.can_activate_anomaly():
             return False
         
+        if random.random() >= self.anomaly_chance:
+            return False
+        
         # Seleccionar anomalía basada en probabilidades
         anomaly_type = self._select_anomaly_type()
         if not anomaly_type:
             return False
         
-        # Crear y activar la anomalía
-        anomaly_class = self.anomaly_types[anomaly_type]
-        anomaly = anomaly_class()
-        
         # Calcular intensidad basada en dificultad
         intensity = min(2.0, difficulty_level * 0.5 + random.uniform(0.5, 1.0))
         
-        anomaly.activate(intensity)
-        self.active_anomalies[anomaly_type] = anomaly
-        self.last_activation_time = time.time()
+        self.store.activate(anomaly_type, intensity)
+        self.last_activation_time = game_time()
         
         return True
     
@@ -206,59 +346,41 @@ class AnomalyManager:
         if anomaly_type not in self.anomaly_types:
             return False
         
-        if anomaly_type in self.active_anomalies:
+        if self.store.is_active(anomaly_type):
             return False  # Ya está activa
         
-        anomaly_class = self.anomaly_types[anomaly_type]
-        anomaly = anomaly_class()
-        anomaly.activate(intensity)
-        
-        self.active_anomalies[anomaly_type] = anomaly
+        self.store.activate(anomaly_type, intensity)
         return True
     
     def deactivate_anomaly(self, anomaly_type: str):
         """Desactivar una anomalía específica"""
-        if anomaly_type in self.active_anomalies:
-            self.active_anomalies[anomaly_type].deactivate()
-            del self.active_anomalies[anomaly_type]
+        if anomaly_type in self.store.index:
+            self.store.deactivate(anomaly_type)
     
     def update_anomalies(self, delta_time: float):
         """Actualizar todas las anomalías activas"""
-        anomalies_to_remove = []
-        
-        for anomaly_type, anomaly in self.active_anomalies.items():
-            anomaly.update(delta_time)
-            
-            # Verificar si debe ser removida
-            if not anomaly.active or anomaly.is_expired():
-                anomalies_to_remove.append(anomaly_type)
-        
-        # Remover anomalías expiradas
-        for anomaly_type in anomalies_to_remove:
-            del self.active_anomalies[anomaly_type]
+        self.store.expire(game_time())
     
-    def get_active_anomalies(self) -> Dict[str, MemoryAnomaly]:
-        """Obtener anomalías activas"""
-        return {name: anomaly for name, anomaly in self.active_anomalies.items() 
-                if anomaly.active}
+    def get_active_anomalies(self) -> Mapping[str, MemoryAnomaly]:
+        """Obtener anomalías activas (vista de solo lectura, cacheada)"""
+        return self.store.active_view()
     
     def has_anomaly(self, anomaly_type: str) -> bool:
         """Verificar si tiene una anomalía específica activa"""
-        return (anomaly_type in self.active_anomalies and 
-                self.active_anomalies[anomaly_type].active)
+        return self.store.is_active(anomaly_type)
     
     def get_anomaly_effects(self) -> Dict[str, Any]:
         """Obtener efectos de todas las anomalías activas"""
         effects = {}
         
-        for anomaly_type, anomaly in self.active_anomalies.items():
-            if anomaly.active:
-                if anomaly_type == "el_olvido":
-                    effects["obscured_areas"] = anomaly.get_obscured_areas()
-                elif anomaly_type == "el_ruido":
-                    effects["false_information"] = anomaly.get_false_information()
-                    effects["show_distraction"] = anomaly.should_show_distraction()
-                elif anomaly_type == "la_repeticion":
-                    effects["difficulty_modifier"] = anomaly.get_difficulty_modifier()
+        for anomaly_type, anomaly in self.store.active_view().items():
+            if anomaly_type == "el_olvido":
+                effects["obscured_areas"] = anomaly.get_obscured_areas()
+            elif anomaly_type == "el_ruido":
+                effects["false_information"] = anomaly.get_false_information()
+                effects["distraction"] = anomaly.current_distraction()
+                effects["show_distraction"] = effects["distraction"] is not None
+            elif anomaly_type == "la_repeticion":
+                effects["difficulty_modifier"] = anomaly.get_difficulty_modifier()
         
         return effects
@@ -4,8 +4,12 @@ Sistema de Mapa Mental Procedural
 
 import random
 import math
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from utils.config import Config
+from utils.content import get_content
+from utils.spatial_grid import SpatialGrid
+from puzzles.registry import get_puzzle_registry
+from game.map_analytics import MapAnalytics
 
 class MemoryNode:
     """Nodo del mapa mental que representa un recuerdo/puzzle"""
@@ -32,39 +36,40 @@ class MemoryNode:
 class MemoryMap:
     """Mapa mental procedural del juego"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, rng: Optional[random.Random] = None):
         self.config = config
+        self.rng = rng or random  # Generador propio cuando se construye en otro hilo
         self.nodes: Dict[int, MemoryNode] = {}
         self.start_node_id = None
         self.current_node_id = None
         self.completed_nodes = set()
         
-        # Tipos de puzzles disponibles (solo los implementados)
-        self.puzzle_types = [
-            "simon_dice",
-            "patron_secuencia", 
-            "memoria_espacial"
-        ]
-        
-        # Fragmentos de historia
-        self.story_fragments = [
-            "En los anales del tiempo, cuando la memoria era sagrada...",
-            "Los antiguos archivistas guardaban secretos en sus mentes...",
-            "Cada símbolo cuenta una historia perdida...",
-            "La sabiduría se desvanece como la niebla al amanecer...",
-            "Solo quien domina la memoria puede restaurar el códice..."
-        ]
+        # Índices espaciales para descartar lo que queda fuera de cámara
+        self.node_index = SpatialGrid(config.SPATIAL_CELL_SIZE)
+        self.edge_index = SpatialGrid(config.SPATIAL_CELL_SIZE)
+        
+        # Distancias y recomendaciones del grafo
+        self.analytics = MapAnalytics(self)
+        
+        # Tipos de puzzles disponibles (los declarados en src/puzzles)
+        self.puzzle_types = get_puzzle_registry().types()
+        
+    @property
+    def story_fragments(self) -> Tuple[str, ...]:
+        """Fragmentos de historia (de data/game_data.json)"""
+        return get_content().story_fragments
     
-    def generate_map(self, difficulty_level: int = 1):
+    def generate_map(self, difficulty_level: int = 1, num_nodes: Optional[int] = None):
         """Generar un nuevo mapa mental procedural"""
         self.nodes.clear()
         self.completed_nodes.clear()
         
         # Determinar número de nodos basado en dificultad
-        num_nodes = min(
-            self.config.MAP_NODES_MAX,
-            self.config.MAP_NODES_MIN + difficulty_level * 2
-        )
+        if num_nodes is None:
+            num_nodes = min(
+                self.config.MAP_NODES_MAX,
+                self.config.MAP_NODES_MIN + difficulty_level * 2
+            )
         
         # Generar nodos en posiciones espirales
         self._generate_node_positions(num_nodes)
@@ -75,9 +80,15 @@ class MemoryMap:
         # Asignar tipos de puzzles y fragmentos de historia
         self._assign_puzzle_types()
         
+        # Indexar nodos y conexiones por posición
+        self._build_spatial_index()
+        
         # Establecer nodo inicial
         self.start_node_id = 0
         self.current_node_id = self.start_node_id
+        
+        # Precalcular distancias y desbloqueos
+        self.analytics.reset()
     
     def _generate_node_positions(self, num_nodes: int):
         """Generar posiciones de nodos en patrón espiral"""
@@ -113,9 +124,33 @@ class MemoryMap:
     def _assign_puzzle_types(self):
         """Asignar tipos de puzzles y fragmentos de historia a los nodos"""
         for node in self.nodes.values():
-            node.puzzle_type = random.choice(self.puzzle_types)
-            node.story_fragment = random.choice(self.story_fragments)
-            node.difficulty = random.uniform(0.8, 1.5)
+            node.puzzle_type = self.rng.choice(self.puzzle_types)
+            node.story_fragment = self.rng.choice(self.story_fragments)
+            node.difficulty = self.rng.uniform(0.8, 1.5)
+    
+    def _build_spatial_index(self):
+        """Construir los índices espaciales de nodos y conexiones"""
+        self.node_index.clear()
+        self.edge_index.clear()
+        
+        for node in self.nodes.values():
+            self.node_index.insert_point(node.id, node.x, node.y)
+            
+            # Cada conexión se indexa una sola vez por su caja envolvente
+            for connected_id in node.connections:
+                if connected_id > node.id and connected_id in self.nodes:
+                    other = self.nodes[connected_id]
+                    self.edge_index.insert(
+                        (node.id, connected_id),
+                        min(node.x, other.x), max(node.x, other.x),
+                        min(node.y, other.y), max(node.y, other.y)
+                    )
+    
+    def query_visible(self, left: float, right: float, bottom: float,
+                      top: float) -> Tuple[Set[int], Set[Tuple[int, int]]]:
+        """Obtener nodos y conexiones dentro de un rectángulo del mundo"""
+        return (self.node_index.query(left, right, bottom, top),
+                self.edge_index.query(left, right, bottom, top))
     
     def get_available_nodes(self) -> List[MemoryNode]:
         """Obtener nodos disponibles para jugar"""
@@ -139,11 +174,16 @@ class MemoryMap:
         
         return available
     
+    def is_available(self, node_id: int) -> bool:
+        """Verificar si un nodo está disponible para jugar"""
+        return self.analytics.is_available(node_id)
+    
     def complete_node(self, node_id: int):
         """Marcar un nodo como completado"""
         if node_id in self.nodes:
             self.nodes[node_id].completed = True
             self.completed_nodes.add(node_id)
+            self.analytics.on_node_completed(node_id)
             
             # Actualizar nodo actual si es necesario
             if node_id == self.current_node_id:
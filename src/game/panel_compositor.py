@@ -0,0 +1,143 @@
+"""
+Paneles compuestos dibujados una vez en su propio framebuffer y reutilizados como un solo quad
+"""
+
+import math
+import arcade
+from array import array
+from arcade.gl import BufferDescription
+from arcade.types import LBWH, LRBT
+from typing import Callable, Dict, Hashable, Optional, Tuple
+from game.render_target import get_render_target
+
+VERTEX_SHADER = """
+#version 330
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+in vec2 in_vert;
+in vec2 in_uv;
+out vec2 v_uv;
+
+void main() {
+    gl_Position = window.projection * window.view * vec4(in_vert, 0.0, 1.0);
+    v_uv = in_uv;
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 330
+
+uniform sampler2D panel;
+in vec2 v_uv;
+out vec4 f_color;
+
+void main() {
+    f_color = texture(panel, v_uv);
+}
+"""
+
+# Dentro del panel el color se acumula premultiplicado por la opacidad (el alfa también se compone)
+PANEL_BLEND = (arcade.gl.SRC_ALPHA, arcade.gl.ONE_MINUS_SRC_ALPHA, arcade.gl.ONE, arcade.gl.ONE_MINUS_SRC_ALPHA)
+# ...y así se mezcla el resultado sobre la pantalla
+PREMULTIPLIED_BLEND = (arcade.gl.ONE, arcade.gl.ONE_MINUS_SRC_ALPHA)
+
+Rect = Tuple[float, float, float, float]  # izquierda, abajo, ancho, alto
+
+class CachedPanel:
+    """Framebuffer y quad de un panel; se rehacen solo si cambia su tamaño"""
+
+    def __init__(self, rect: Rect, pixel_ratio: float):
+        ctx = arcade.get_window().ctx
+        left, bottom, width, height = rect
+        self.rect = rect
+        self.pixel_ratio = pixel_ratio
+        self.key: Optional[Hashable] = None
+
+        size = (max(1, math.ceil(width * pixel_ratio)), max(1, math.ceil(height * pixel_ratio)))
+        self.framebuffer = ctx.framebuffer(color_attachments=[ctx.texture(size, components=4)])
+        self.camera = arcade.Camera2D(
+            viewport=LBWH(0, 0, *size),
+            position=(left + width / 2, bottom + height / 2),
+            projection=LRBT(-width / 2, width / 2, -height / 2, height / 2),
+            render_target=self.framebuffer
+        )
+        vertices = array('f', [
+            left, bottom + height, 0.0, 1.0,
+            left, bottom, 0.0, 0.0,
+            left + width, bottom + height, 1.0, 1.0,
+            left + width, bottom, 1.0, 0.0,
+        ])
+        self.geometry = ctx.geometry(
+            [BufferDescription(ctx.buffer(data=vertices), "2f 2f", ["in_vert", "in_uv"])],
+            mode=ctx.TRIANGLE_STRIP
+        )
+
+    def render(self, draw_func: Callable[[], None]):
+        """Dibujar el contenido del panel en su framebuffer (en coordenadas de pantalla)"""
+        ctx = self.framebuffer.ctx
+        with self.camera.activate():
+            self.framebuffer.clear(color=(0, 0, 0, 0))
+            previous_blend = ctx.blend_func
+            ctx.blend_func = PANEL_BLEND
+            try:
+                draw_func()
+            finally:
+                ctx.blend_func = previous_blend
+
+class PanelCompositor:
+    """Paneles con nombre: cada uno se redibuja al cambiar su clave de contenido"""
+
+    PADDING = 4  # margen para los bordes gruesos que sobresalen del rectángulo del panel
+
+    def __init__(self):
+        self.panels: Dict[str, CachedPanel] = {}
+        self._program = None
+        self.redraws = 0  # veces que se rehízo algún panel
+
+    def draw(self, name: str, rect: Rect, key: Hashable, draw_func: Callable[[], None]) -> bool:
+        """Mostrar el panel `name`; solo llama a `draw_func` si cambió `key`. Devuelve si se redibujó"""
+        window = arcade.get_window()
+        ctx = window.ctx
+        left, bottom, width, height = rect
+        rect = (left - self.PADDING, bottom - self.PADDING,
+                width + 2 * self.PADDING, height + 2 * self.PADDING)
+        pixel_ratio = get_render_target().pixels_per_unit
+
+        panel = self.panels.get(name)
+        if panel is None or panel.rect != rect or panel.pixel_ratio != pixel_ratio:
+            panel = self.panels[name] = CachedPanel(rect, pixel_ratio)
+        if self._program is None:
+            self._program = ctx.program(vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER)
+
+        redrawn = key is None or key != panel.key
+        if redrawn:
+            panel.render(draw_func)
+            panel.key = key
+            self.redraws += 1
+
+        panel.framebuffer.color_attachments[0].use(0)
+        previous_blend = ctx.blend_func
+        with ctx.enabled(ctx.BLEND):
+            ctx.blend_func = PREMULTIPLIED_BLEND
+            panel.geometry.render(self._program)
+            ctx.blend_func = previous_blend
+        return redrawn
+
+    def invalidate(self, name: Optional[str] = None):
+        """Forzar el redibujo de un panel (o de todos)"""
+        for panel_name, panel in self.panels.items():
+            if name is None or panel_name == name:
+                panel.key = None
+
+_panel_compositor: Optional[PanelCompositor] = None
+
+def get_panel_compositor() -> PanelCompositor:
+    """Compositor de paneles compartido por la ventana y la escena"""
+    global _panel_compositor
+    if _panel_compositor is None:
+        _panel_compositor = PanelCompositor()
+    return _panel_compositor
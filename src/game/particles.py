@@ -0,0 +1,175 @@
+"""
+Partículas en arrays de NumPy dibujadas como puntos en una sola llamada
+"""
+
+import math
+import random
+import arcade
+import numpy as np
+from arcade.gl import BufferDescription
+from pyglet import gl
+from typing import Optional, Sequence, Tuple
+
+# Columnas del array de vértices (se sube tal cual a la GPU)
+X, Y, R, G, B, A, SIZE = range(7)
+VERTEX_FLOATS = 7
+
+VERTEX_SHADER = """
+#version 330
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+in vec2 in_pos;
+in vec4 in_color;
+in float in_size;
+out vec4 v_color;
+
+void main() {
+    gl_Position = window.projection * window.view * vec4(in_pos, 0.0, 1.0);
+    gl_PointSize = in_size;
+    v_color = in_color / 255.0;
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 330
+
+in vec4 v_color;
+out vec4 f_color;
+
+void main() {
+    // Punto redondo con el borde difuminado
+    vec2 offset = gl_PointCoord * 2.0 - 1.0;
+    float falloff = 1.0 - dot(offset, offset);
+    if (falloff <= 0.0) {
+        discard;
+    }
+    f_color = vec4(v_color.rgb, v_color.a * falloff * falloff);
+}
+"""
+
+class ParticleSystem:
+    """Estado de todas las partículas en arrays; las vivas se mantienen al principio"""
+
+    def __init__(self, capacity: int = 4096, seed: Optional[int] = None):
+        self.capacity = capacity
+        self.count = 0
+        # La semilla sale del generador global (sembrado por sesión) para que las repeticiones coincidan
+        self.rng = np.random.default_rng(random.getrandbits(32) if seed is None else seed)
+
+        self.vertices = np.zeros((capacity, VERTEX_FLOATS), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.gravity = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)  # segundos restantes
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.base_alpha = np.zeros(capacity, dtype=np.float32)
+        self.base_size = np.zeros(capacity, dtype=np.float32)
+
+        self._buffer = None
+        self._geometry = None
+        self._program = None
+
+    def emit(self, x: float, y: float, count: int, color: Tuple[int, ...],
+             speed: Tuple[float, float] = (20.0, 60.0), direction: float = 90.0, spread: float = 360.0,
+             life: Tuple[float, float] = (0.6, 1.2), size: Tuple[float, float] = (4.0, 8.0),
+             gravity: float = 0.0, jitter: float = 0.0):
+        """Crear `count` partículas en (x, y); la dirección y la dispersión van en grados"""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        start, end = self.count, self.count + count
+        rng = self.rng
+
+        angle = np.radians(direction + (rng.random(count) - 0.5) * spread)
+        magnitude = rng.uniform(speed[0], speed[1], count)
+        self.velocity[start:end, 0] = np.cos(angle) * magnitude
+        self.velocity[start:end, 1] = np.sin(angle) * magnitude
+
+        vertices = self.vertices[start:end]
+        vertices[:, X] = x + rng.uniform(-jitter, jitter, count)
+        vertices[:, Y] = y + rng.uniform(-jitter, jitter, count)
+        vertices[:, R:B + 1] = color[:3]
+        self.base_alpha[start:end] = color[3] if len(color) > 3 else 255
+        self.base_size[start:end] = rng.uniform(size[0], size[1], count)
+
+        lifetimes = rng.uniform(life[0], life[1], count)
+        self.life[start:end] = lifetimes
+        self.max_life[start:end] = lifetimes
+        self.gravity[start:end] = gravity
+        self.count = end
+
+    def update(self, delta_time: float):
+        """Integrar todas las partículas y descartar las que se apagaron"""
+        count = self.count
+        if count == 0:
+            return
+
+        life = self.life[:count]
+        life -= delta_time
+        alive = life > 0
+        if not alive.all():
+            # Compactar: las vivas pasan al principio de los arrays
+            count = int(alive.sum())
+            for array in (self.vertices, self.velocity, self.gravity, self.life,
+                          self.max_life, self.base_alpha, self.base_size):
+                array[:count] = array[:self.count][alive]
+            self.count = count
+            life = self.life[:count]
+
+        vertices = self.vertices[:count]
+        velocity = self.velocity[:count]
+        velocity[:, 1] += self.gravity[:count] * delta_time
+        vertices[:, X:Y + 1] += velocity * delta_time
+
+        # Se desvanecen y encogen al final de su vida
+        remaining = life / self.max_life[:count]
+        vertices[:, A] = self.base_alpha[:count] * remaining
+        vertices[:, SIZE] = self.base_size[:count] * (0.4 + 0.6 * remaining)
+
+    def clear(self):
+        """Eliminar todas las partículas"""
+        self.count = 0
+
+    def draw(self):
+        """Dibujar todas las partículas vivas con mezcla aditiva"""
+        if self.count == 0:
+            return
+        ctx = arcade.get_window().ctx
+        if self._program is None:
+            self._program = ctx.program(vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER)
+            self._buffer = ctx.buffer(reserve=self.vertices.nbytes, usage="stream")
+            self._geometry = ctx.geometry(
+                [BufferDescription(self._buffer, "2f 4f 1f", ["in_pos", "in_color", "in_size"])],
+                mode=ctx.POINTS
+            )
+
+        self._buffer.write(self.vertices[:self.count])
+        previous_blend = ctx.blend_func
+        with ctx.enabled(ctx.BLEND, gl.GL_PROGRAM_POINT_SIZE):
+            ctx.blend_func = (ctx.SRC_ALPHA, ctx.ONE)
+            self._geometry.render(self._program, vertices=self.count)
+            ctx.blend_func = previous_blend
+
+class Emitter:
+    """Emisión continua en una o varias posiciones (antorchas)"""
+
+    def __init__(self, system: ParticleSystem, positions: Sequence[Tuple[float, float]],
+                 rate: float, **params):
+        self.system = system
+        self.positions = list(positions)
+        self.rate = rate  # partículas por segundo y posición
+        self.params = params
+        self._pending = 0.0
+
+    def update(self, delta_time: float):
+        """Emitir las partículas que tocan en este paso"""
+        self._pending += self.rate * delta_time
+        count = math.floor(self._pending)
+        if count <= 0:
+            return
+        self._pending -= count
+        for x, y in self.positions:
+            self.system.emit(x, y, count, **self.params)
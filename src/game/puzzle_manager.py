@@ -3,11 +3,17 @@ Gestor de Puzzles del Juego
 """
 
 import random
-from typing import Dict, Optional, Any, List
-from puzzles.puzzle_base import Puzzle, SimonDicePuzzle, PatronSecuenciaPuzzle, MemoriaEspacialPuzzle
+from typing import Dict, Optional, Any, List, Set
+from puzzles.puzzle_base import Puzzle
+from puzzles.registry import get_puzzle_registry
+from puzzles.solvers import solve
 from game.memory_anomalies import AnomalyManager
 from game.cognitive_abilities import CognitiveAbilityManager
 from utils.config import Config
+from utils.effects_pipeline import EffectsPipeline
+from utils.logger import get_logger
+
+logger = get_logger("puzzles")
 
 class PuzzleManager:
     """Gestor principal de puzzles del juego"""
@@ -19,6 +25,10 @@ class PuzzleManager:
         self.anomaly_manager = AnomalyManager(config)
         self.ability_manager = CognitiveAbilityManager(config)
         
+        # Modificadores de habilidades y anomalías activas (se sincronizan al cambiar)
+        self.effects = EffectsPipeline()
+        self._effects_sources = (-1, -1)
+        
         # Estadísticas del jugador
         self.player_stats = {
             'puzzles_completed': 0,
@@ -33,40 +43,51 @@ class PuzzleManager:
     
     def create_puzzle(self, puzzle_type: str, difficulty: float = 1.0) -> Optional[Puzzle]:
         """Crear un nuevo puzzle"""
+        # La dificultad extra de las anomalías se aplica antes de generar y verificar
+        self._sync_effects()
+        difficulty += self.effects.parameters.difficulty_delta
         puzzle = self.puzzle_factory.create_puzzle(puzzle_type, difficulty)
         
         if puzzle:
             # Aplicar anomalías activas
             self._apply_active_anomalies(puzzle)
-            
-            # Configurar el puzzle
-            puzzle.setup_puzzle()
+            puzzle.apply_effects(self.effects.parameters)
             
             self.current_puzzle = puzzle
             return puzzle
         
         return None
     
+    def _sync_effects(self):
+        """Reconstruir la pila de efectos solo si cambiaron las habilidades o anomalías activas"""
+        sources = (self.ability_manager.version, self.anomaly_manager.store.version)
+        if sources == self._effects_sources:
+            return
+        self._effects_sources = sources
+        
+        active = list(self.ability_manager.get_active_abilities().items())
+        active += list(self.anomaly_manager.get_active_anomalies().items())
+        modifiers = []
+        for name, source in active:
+            modifier = source.modifier()
+            if modifier is not None:
+                modifiers.append((name, modifier))
+        self.effects.set_modifiers(modifiers)
+        
+        parameters = self.effects.parameters
+        if self.current_puzzle and self.current_puzzle.effects is not parameters:
+            self.current_puzzle.apply_effects(parameters)
+    
     def _apply_active_anomalies(self, puzzle: Puzzle):
         """Aplicar anomalías activas al puzzle"""
-        active_anomalies = self.anomaly_manager.get_active_anomalies()
-        
-        for anomaly_type, anomaly in active_anomalies.items():
+        for anomaly_type in self.anomaly_manager.get_active_anomalies():
             puzzle.add_anomaly(anomaly_type)
-            
-            # Aplicar efectos específicos
-            if anomaly_type == "la_repeticion":
-                difficulty_modifier = anomaly.get_difficulty_modifier()
-                puzzle.difficulty += difficulty_modifier
     
     def handle_puzzle_input(self, input_data: Any) -> bool:
         """Manejar entrada del puzzle actual"""
         if not self.current_puzzle:
             return False
         
-        # Aplicar efectos de habilidades cognitivas
-        self._apply_cognitive_abilities()
-        
         # Procesar entrada
         result = self.current_puzzle.handle_input(input_data)
         
@@ -75,19 +96,6 @@ class PuzzleManager:
         
         return result
     
-    def _apply_cognitive_abilities(self):
-        """Aplicar efectos de habilidades cognitivas activas"""
-        active_abilities = self.ability_manager.get_active_abilities()
-        
-        for ability_name, ability in active_abilities.items():
-            if ability_name == "enfoque":
-                # Ralentizar el tiempo del puzzle
-                if hasattr(self.current_puzzle, 'time_limit'):
-                    self.current_puzzle.time_limit *= 1.5
-            elif ability_name == "vision_periferica":
-                # Mejorar la visibilidad en puzzles de búsqueda
-                pass  # Implementar según el tipo de puzzle
-    
     def _on_puzzle_completed(self):
         """Manejar completación del puzzle"""
         if not self.current_puzzle:
@@ -98,7 +106,7 @@ class PuzzleManager:
         self.player_stats['total_score'] += self.current_puzzle.score
         
         # Calcular tiempo promedio
-        puzzle_time = self.config.PUZZLE_TIMEOUT - self.current_puzzle.get_remaining_time()
+        puzzle_time = self.current_puzzle.elapsed_time()
         total_puzzles = self.player_stats['puzzles_completed']
         current_avg = self.player_stats['average_time']
         self.player_stats['average_time'] = (current_avg * (total_puzzles - 1) + puzzle_time) / total_puzzles
@@ -165,6 +173,12 @@ class PuzzleManager:
         
         return max(0.5, min(3.0, base_difficulty))
     
+    def get_weak_puzzle_types(self) -> Set[str]:
+        """Obtener las áreas débiles como tipos de puzzle del mapa"""
+        registry = self.puzzle_factory.registry
+        plugins = (registry.for_class_name(name) for name in self.player_stats['weak_areas'])
+        return {plugin.puzzle_type for plugin in plugins if plugin}
+    
     def get_next_puzzle_type(self) -> str:
         """Obtener el siguiente tipo de puzzle basado en análisis adaptativo"""
         # Priorizar áreas débiles
@@ -183,6 +197,9 @@ class PuzzleManager:
         # Actualizar habilidades cognitivas
         self.ability_manager.update_abilities(delta_time)
         
+        # Recalcular los efectos si algo se activó o expiró
+        self._sync_effects()
+        
         # Actualizar puzzle actual
         if self.current_puzzle and not self.current_puzzle.completed:
             if self.current_puzzle.is_time_up():
@@ -230,21 +247,29 @@ class PuzzleFactory:
     
     def __init__(self, config: Config):
         self.config = config
-        self.puzzle_classes = {
-            'simon_dice': SimonDicePuzzle,
-            'patron_secuencia': PatronSecuenciaPuzzle,
-            'memoria_espacial': MemoriaEspacialPuzzle,
-            # TODO: Agregar más tipos de puzzles
-        }
+        # Los módulos de cada tipo se importan la primera vez que se crea uno
+        self.registry = get_puzzle_registry()
     
     def create_puzzle(self, puzzle_type: str, difficulty: float = 1.0) -> Optional[Puzzle]:
-        """Crear un puzzle del tipo especificado"""
-        if puzzle_type in self.puzzle_classes:
-            puzzle_class = self.puzzle_classes[puzzle_type]
-            return puzzle_class(difficulty, self.config)
+        """Crear, configurar y verificar un puzzle del tipo especificado"""
+        plugin = self.registry.get(puzzle_type)
+        if plugin is None:
+            return None
         
-        return None
+        for _ in range(self.config.PUZZLE_GENERATION_ATTEMPTS):
+            puzzle = plugin.create(difficulty, self.config)
+            puzzle.setup_puzzle()
+            
+            solution = solve(puzzle)
+            if solution is None or solution.valid:
+                return puzzle
+            logger.info("Puzzle %s descartado: %s", puzzle_type, solution.reason)
+        
+        # Mejor un puzzle imperfecto que ninguno
+        logger.warning("No se generó un puzzle %s válido tras %d intentos",
+                       puzzle_type, self.config.PUZZLE_GENERATION_ATTEMPTS)
+        return puzzle
     
     def get_available_puzzle_types(self) -> List[str]:
         """Obtener tipos de puzzles disponibles"""
-        return list(self.puzzle_classes.keys())
+        return self.registry.types()
@@ -0,0 +1,152 @@
+"""
+Framebuffer lógico de tamaño fijo escalado a la ventana física
+"""
+
+import arcade
+from contextlib import contextmanager
+from arcade.gl import Geometry, Program, geometry
+from arcade.types import LBWH, LRBT
+from typing import Optional, Tuple
+from utils.config import get_config
+
+VERTEX_SHADER = """
+#version 330
+
+in vec2 in_vert;
+in vec2 in_uv;
+out vec2 v_uv;
+
+void main() {
+    gl_Position = vec4(in_vert, 0.0, 1.0);
+    v_uv = in_uv;
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 330
+
+uniform sampler2D frame;
+in vec2 v_uv;
+out vec4 f_color;
+
+void main() {
+    f_color = vec4(texture(frame, v_uv).rgb, 1.0);
+}
+"""
+
+_blit: Optional[Tuple[Program, Geometry]] = None
+
+def get_blit() -> Tuple[Program, Geometry]:
+    """Programa y quad de pantalla completa para copiar una textura opaca (compartidos)"""
+    global _blit
+    if _blit is None:
+        ctx = arcade.get_window().ctx
+        _blit = (ctx.program(vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER),
+                 geometry.quad_2d_fs())
+    return _blit
+
+class RenderTarget:
+    """Todo se dibuja en coordenadas lógicas sobre este framebuffer y luego se escala con bandas negras"""
+
+    def __init__(self, logical_width: int, logical_height: int, render_scale: float = 1.0):
+        self.logical_width = logical_width
+        self.logical_height = logical_height
+        self.render_scale = render_scale
+        self.framebuffer = None
+        self.camera: Optional[arcade.Camera2D] = None
+        self.generation = 0  # cambia cada vez que se rehace el framebuffer
+
+    def configure(self, logical_width: int, logical_height: int, render_scale: float):
+        """Cambiar el tamaño lógico o la escala interna (el framebuffer se rehace al dibujar)"""
+        if (logical_width, logical_height, render_scale) != (
+                self.logical_width, self.logical_height, self.render_scale):
+            self.logical_width = logical_width
+            self.logical_height = logical_height
+            self.render_scale = render_scale
+            self.framebuffer = None
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Tamaño interno en píxeles (el lógico por la escala de render)"""
+        scale = max(0.1, self.render_scale)
+        return (max(1, round(self.logical_width * scale)), max(1, round(self.logical_height * scale)))
+
+    @property
+    def pixels_per_unit(self) -> float:
+        """Píxeles internos por unidad lógica"""
+        return self.size[0] / self.logical_width
+
+    def make_camera(self) -> arcade.Camera2D:
+        """Cámara del área lógica completa a la resolución interna"""
+        # Sin destino fijo: dibuja en el framebuffer activo (este o una caché del mismo tamaño)
+        framebuffer = self._ensure_framebuffer()
+        width, height = self.logical_width, self.logical_height
+        return arcade.Camera2D(
+            viewport=LBWH(0, 0, *framebuffer.size),
+            position=(width / 2, height / 2),
+            projection=LRBT(-width / 2, width / 2, -height / 2, height / 2)
+        )
+
+    def _ensure_framebuffer(self):
+        """Crear el framebuffer interno si no existe o cambió su tamaño"""
+        if self.framebuffer is None:
+            ctx = arcade.get_window().ctx
+            self.framebuffer = ctx.framebuffer(color_attachments=[ctx.texture(self.size, components=4)])
+            self.camera = self.make_camera()
+            self.generation += 1
+        return self.framebuffer
+
+    @contextmanager
+    def activate(self):
+        """Contexto para dibujar en el framebuffer lógico con la proyección de pantalla"""
+        framebuffer = self._ensure_framebuffer()
+        with framebuffer.activate(), self.camera.activate():
+            yield framebuffer
+
+    def use_screen(self):
+        """Volver a la proyección lógica de pantalla (tras una cámara del mundo)"""
+        self._ensure_framebuffer()
+        self.camera.use()
+
+    def viewport(self, width: float, height: float) -> Tuple[float, float, float, float]:
+        """Rectángulo (izquierda, abajo, ancho, alto) que ocupa la imagen en una ventana de ese tamaño"""
+        scale = min(width / self.logical_width, height / self.logical_height)
+        view_width, view_height = self.logical_width * scale, self.logical_height * scale
+        return ((width - view_width) / 2, (height - view_height) / 2, view_width, view_height)
+
+    def to_logical(self, x: float, y: float) -> Tuple[float, float]:
+        """Convertir coordenadas de la ventana (ratón) a coordenadas lógicas"""
+        window = arcade.get_window()
+        left, bottom, width, height = self.viewport(window.width, window.height)
+        return ((x - left) * self.logical_width / width, (y - bottom) * self.logical_height / height)
+
+    def present(self):
+        """Escalar el framebuffer lógico a la ventana, centrado y con bandas negras"""
+        window = arcade.get_window()
+        ctx = window.ctx
+        program, quad = get_blit()
+
+        ctx.screen.use()
+        ctx.screen.clear(color=(0, 0, 0, 255))
+        width, height = window.get_framebuffer_size()
+        left, bottom, view_width, view_height = self.viewport(width, height)
+        ctx.viewport = (round(left), round(bottom), round(view_width), round(view_height))
+
+        texture = self._ensure_framebuffer().color_attachments[0]
+        # Sin escalado se copia píxel a píxel; si no, se suaviza
+        same_size = (round(view_width), round(view_height)) == texture.size
+        texture.filter = (ctx.NEAREST, ctx.NEAREST) if same_size else (ctx.LINEAR, ctx.LINEAR)
+        texture.use(0)
+        with ctx.enabled_only():
+            quad.render(program)
+        ctx.viewport = (0, 0, width, height)
+
+_render_target: Optional[RenderTarget] = None
+
+def get_render_target() -> RenderTarget:
+    """Framebuffer lógico compartido por la ventana, las cámaras y los paneles"""
+    global _render_target
+    if _render_target is None:
+        config = get_config()
+        _render_target = RenderTarget(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, config.RENDER_SCALE)
+    return _render_target
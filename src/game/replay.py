@@ -0,0 +1,44 @@
+"""
+Repetición de sesiones grabadas sin ventana y a máxima velocidad
+"""
+
+import time
+from typing import Any, Dict
+from utils.config import get_config
+from game.game_window import GameWindow
+from game.input_events import read_replay
+
+def run_replay(path: str) -> Dict[str, Any]:
+    """Volver a ejecutar una sesión grabada (solo lógica, sin dibujar ni esperar)"""
+    replay = read_replay(path)
+    config = get_config()
+    window = GameWindow(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, config.SCREEN_TITLE,
+                        seed=replay.seed, replay=True)
+
+    def queue_frame(index: int):
+        """Encolar la entrada grabada justo antes de su paso"""
+        window.input_queue.events.extend(replay.frames[index][1])
+
+    # Cada registro es un paso de lógica con su duración grabada: sin acumulador ni espera
+    start = time.perf_counter()
+    window.game_loop.run_headless((delta_time for delta_time, _ in replay.frames), queue_frame)
+    elapsed = time.perf_counter() - start
+    events = sum(len(frame_events) for _, frame_events in replay.frames)
+
+    scene = window.game_scene
+    summary = {
+        'seed': replay.seed,
+        'frames': len(replay.frames),
+        'events': events,
+        'game_time': window.game_clock.time,
+        'elapsed': elapsed,
+        'updates_per_second': len(replay.frames) / elapsed if elapsed > 0 else 0.0,
+        'state': window.current_state,
+        'game_state': scene.game_state if scene else None,
+        'level': scene.level if scene else None,
+        'completed_nodes': sorted(scene.memory_map.completed_nodes) if scene else [],
+        'score': scene.puzzle_manager.player_stats['total_score'] if scene else 0
+    }
+    window.shutdown_scenes()
+    window.close()
+    return summary
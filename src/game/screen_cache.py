@@ -0,0 +1,44 @@
+"""
+Fotograma guardado de las pantallas estáticas: se vuelve a dibujar solo cuando cambian
+"""
+
+import arcade
+from typing import Callable, Hashable, Optional
+from game.render_target import get_blit
+
+class ScreenCache:
+    """Dibuja una pantalla en un framebuffer propio y lo reutiliza mientras no se invalide"""
+
+    def __init__(self):
+        self._framebuffer = None
+        self._key: Optional[Hashable] = None
+        self.redraws = 0  # veces que se rehízo el fotograma guardado
+
+    def invalidate(self):
+        """Obligar a redibujar la pantalla en el siguiente fotograma"""
+        self._key = None
+
+    def draw(self, key: Hashable, draw_func: Callable[[], None]) -> bool:
+        """Mostrar la pantalla `key`; solo llama a `draw_func` si cambió. Devuelve si se redibujó"""
+        window = arcade.get_window()
+        ctx = window.ctx
+        # Mismo tamaño que el destino actual (el framebuffer lógico de la ventana)
+        size = ctx.active_framebuffer.size
+        if self._framebuffer is None or self._framebuffer.size != size:
+            self._framebuffer = ctx.framebuffer(color_attachments=[ctx.texture(size, components=4)])
+            self._key = None
+
+        redrawn = key is None or key != self._key
+        if redrawn:
+            with self._framebuffer.activate():
+                self._framebuffer.clear(color=window.background_color)
+                draw_func()
+            self._key = key
+            self.redraws += 1
+
+        # Copiar el fotograma guardado a la pantalla en una sola llamada y sin mezcla
+        program, quad = get_blit()
+        self._framebuffer.color_attachments[0].use(0)
+        with ctx.enabled_only():
+            quad.render(program)
+        return redrawn
@@ -0,0 +1,204 @@
+"""
+Presentación de los fragmentos de historia: maquetado en caché y revelado tipo máquina de escribir
+"""
+
+import re
+import arcade
+import pyglet
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from game.render_target import get_render_target
+from utils.config import Config
+
+# Tipos de mensaje (se guardan al crear el mensaje; el texto no se vuelve a analizar)
+STORY = "story"
+VICTORY = "victory"
+DEFEAT = "defeat"
+
+# Título y color (clave de Config.COLORS) de cada tipo de mensaje
+MESSAGE_TITLES: Dict[str, Tuple[str, str]] = {
+    STORY: ("📜 HISTORIA 📜", 'accent'),
+    VICTORY: ("🎉 ¡VICTORIA! 🎉", 'success'),
+    DEFEAT: ("💀 TIEMPO AGOTADO 💀", 'error'),
+}
+
+FONT_NAME = ("calibri", "arial")  # la misma búsqueda de fuente que arcade.Text
+LAYOUT_CACHE_SIZE = 32
+
+class StoryMessage(NamedTuple):
+    """Texto mostrado en la vista de historia y su tipo"""
+    text: str
+    kind: str = STORY
+
+class StoryLine(NamedTuple):
+    """Línea ya partida: primer carácter (en la cuenta de reveal_length) y avance acumulado de cada carácter"""
+    text: str
+    start: int
+    offsets: Tuple[float, ...]  # x al final de cada carácter, desde el inicio de la línea
+    width: float
+
+class StoryLayout(NamedTuple):
+    """Fragmento tokenizado, partido en líneas y medido una sola vez"""
+    lines: Tuple[StoryLine, ...]
+    line_height: float
+    length: int  # caracteres que recorre el revelado (igual a reveal_length del texto)
+
+def tokenize(text: str) -> List[str]:
+    """Separar palabras y espacios conservando los saltos de línea explícitos"""
+    return re.findall(r"\n|[^\S\n]+|\S+", text)
+
+def reveal_length(text: str) -> int:
+    """Caracteres que recorre el revelado (sin fuentes: la misma cuenta que hace el maquetado)"""
+    length = 0
+    line_empty = True
+    for token in tokenize(text):
+        if token == "\n":
+            line_empty = True
+        elif token.isspace():
+            # Los espacios se reducen a uno y se ignoran al principio de línea
+            length += 0 if line_empty else 1
+        else:
+            length += len(token)
+            line_empty = False
+    return length
+
+def _advances(font, text: str) -> List[float]:
+    """Avance horizontal de cada carácter con la fuente dada"""
+    glyphs, _ = font.get_glyphs(text)
+    return [glyph.advance for glyph in glyphs]
+
+def layout_story(text: str, width: float, font_size: float, bold: bool = True) -> StoryLayout:
+    """Partir el texto en líneas que quepan en `width` y medir cada carácter"""
+    font = pyglet.font.load(FONT_NAME, font_size, weight="bold" if bold else "normal")
+    lines: List[StoryLine] = []
+    current: List[str] = []
+    current_width = 0.0
+    position = 0  # caracteres ya colocados en líneas anteriores (el espacio del corte también cuenta)
+
+    def close_line():
+        nonlocal current, current_width, position
+        raw_text = "".join(current)
+        line_text = raw_text.rstrip()
+        offsets, x = [], 0.0
+        for advance in _advances(font, line_text):
+            x += advance
+            offsets.append(x)
+        lines.append(StoryLine(line_text, position, tuple(offsets), x))
+        position += len(raw_text)
+        current, current_width = [], 0.0
+
+    for token in tokenize(text):
+        if token == "\n":
+            close_line()
+            continue
+        if token.isspace():
+            if current:
+                current.append(" ")
+                current_width += sum(_advances(font, " "))
+            continue
+        token_width = sum(_advances(font, token))
+        if current and current_width + token_width > width:
+            close_line()
+        current.append(token)
+        current_width += token_width
+    if current or not lines:
+        close_line()
+
+    return StoryLayout(tuple(lines), (font.ascent - font.descent) * 1.3, position)
+
+_layouts: "OrderedDict[Tuple, StoryLayout]" = OrderedDict()
+
+def get_story_layout(text: str, width: float, font_size: float, bold: bool = True) -> StoryLayout:
+    """Maquetado de un texto, en caché por texto, ancho y fuente"""
+    key = (text, width, font_size, bold)
+    layout = _layouts.get(key)
+    if layout is None:
+        layout = _layouts[key] = layout_story(text, width, font_size, bold)
+        if len(_layouts) > LAYOUT_CACHE_SIZE:
+            _layouts.popitem(last=False)
+    else:
+        _layouts.move_to_end(key)
+    return layout
+
+class StoryPresenter:
+    """Mensaje actual de la vista de historia, revelado carácter a carácter"""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.message = StoryMessage("")
+        self.revealed = 0.0  # caracteres mostrados (fraccionario entre pasos)
+        self.length = 0  # se cuenta sin maquetar: las repeticiones sin ventana avanzan igual
+        self._runs_key: Optional[Tuple] = None
+        self._runs: List[Tuple[arcade.Text, arcade.Text]] = []  # sombra y texto por línea
+
+    def show(self, message: StoryMessage):
+        """Empezar a mostrar un mensaje nuevo desde el principio"""
+        self.message = message
+        self.revealed = 0.0
+        self.length = reveal_length(message.text)
+
+    @property
+    def title(self) -> Tuple[str, Tuple[int, int, int]]:
+        """Título y color del tipo de mensaje"""
+        title, color = MESSAGE_TITLES.get(self.message.kind, MESSAGE_TITLES[STORY])
+        return title, self.config.COLORS[color]
+
+    @property
+    def finished(self) -> bool:
+        """Si el mensaje ya se ve completo"""
+        return self.revealed >= self.length
+
+    def update(self, delta_time: float):
+        """Avanzar el revelado"""
+        if not self.finished:
+            self.revealed = min(float(self.length), self.revealed + delta_time * self.config.STORY_REVEAL_SPEED)
+
+    def reveal_all(self):
+        """Mostrar el mensaje completo de inmediato"""
+        self.revealed = float(self.length)
+
+    def draw(self, center_x: float, center_y: float, width: float):
+        """Dibujar las líneas ya reveladas centradas en (center_x, center_y)"""
+        font_size = self.config.FONT_SIZE_MEDIUM
+        layout = get_story_layout(self.message.text, width, font_size)
+        key = (layout, center_x, center_y)
+        if key != self._runs_key:
+            self._shape(layout, center_x, center_y, font_size)
+            self._runs_key = key
+
+        revealed = int(self.revealed)
+        for line, (shadow, text) in zip(layout.lines, self._runs):
+            visible = revealed - line.start
+            if visible <= 0:
+                break
+            if visible >= len(line.text):
+                shadow.draw()
+                text.draw()
+                continue
+            # Línea a medias: se recorta en el borde del último carácter revelado
+            self._draw_clipped((shadow, text), text.left + line.offsets[visible - 1])
+
+    def _shape(self, layout: StoryLayout, center_x: float, center_y: float, font_size: float):
+        """Crear los textos de cada línea (solo cuando cambia el maquetado o la posición)"""
+        top = center_y + layout.line_height * len(layout.lines) / 2
+        self._runs = []
+        for index, line in enumerate(layout.lines):
+            y = top - layout.line_height * (index + 0.5)
+            self._runs.append(tuple(
+                arcade.Text(line.text, center_x + dx, y + dy, color, font_size=font_size,
+                            anchor_x="center", anchor_y="center", bold=True)
+                for dx, dy, color in ((2, -2, self.config.COLORS['shadow']),
+                                      (0, 0, self.config.COLORS['text']))
+            ))
+
+    def _draw_clipped(self, texts, clip_x: float):
+        """Dibujar textos recortados a la izquierda de clip_x (en coordenadas lógicas)"""
+        ctx = arcade.get_window().ctx
+        scale = get_render_target().pixels_per_unit
+        width, height = ctx.active_framebuffer.size
+        ctx.scissor = (0, 0, max(0, min(width, round(clip_x * scale))), height)
+        try:
+            for text in texts:
+                text.draw()
+        finally:
+            ctx.scissor = None
@@ -0,0 +1,299 @@
+"""
+Widgets de interfaz en modo retenido: geometría y textos en lotes que solo se rehacen al cambiar
+"""
+
+import itertools
+import arcade
+import pyglet
+from arcade import shape_list
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+Color = Tuple[int, ...]
+
+# Versiones únicas entre todas las capas (una capa nueva nunca repite la clave de otra)
+_versions = itertools.count(1)
+
+# Orden de dibujo de los textos dentro del lote: primero las sombras
+SHADOW_GROUP = pyglet.graphics.Group(order=0)
+TEXT_GROUP = pyglet.graphics.Group(order=1)
+
+class Border(NamedTuple):
+    """Borde de un panel o botón: margen hacia dentro, color y grosor"""
+    inset: float
+    color: Color
+    width: float
+
+class ButtonStyle(NamedTuple):
+    """Aspecto de un botón en reposo y con el foco"""
+    fill: Color
+    focus_fill: Color
+    text: Color
+    focus_text: Color
+    border: Color
+    focus_border: Color
+    inner_border: Color
+    glow: Color  # resplandor detrás del botón con el foco
+    font_size: int = 20
+    shadow: Optional[Color] = None  # sombra del texto (None = sin sombra)
+    glow_margin: float = 10
+    inner_inset: float = 5
+
+def parchment_button_style(colors: Dict[str, Tuple[int, int, int]], fill: str, focus_fill: Optional[str] = None,
+                           font_size: int = 20, shadow: bool = False) -> ButtonStyle:
+    """Botón de pergamino del juego: el foco se marca con el color de antorcha"""
+    return ButtonStyle(
+        fill=(*colors[fill], 220),
+        focus_fill=(*colors[focus_fill or fill], 220),
+        text=colors['text'],
+        focus_text=colors['torch'],
+        border=colors['secondary'],
+        focus_border=colors['torch'],
+        inner_border=(*colors['accent'], 120),
+        glow=(*colors['torch'], 80),
+        font_size=font_size,
+        shadow=colors['shadow'] if shadow else None
+    )
+
+class Widget:
+    """Elemento con rectángulo de impacto; avisa a su capa cuando hay que rehacer la geometría"""
+
+    def __init__(self, center_x: float, center_y: float, width: float, height: float):
+        self.center_x = center_x
+        self.center_y = center_y
+        self.width = width
+        self.height = height
+        self.layer: Optional["WidgetLayer"] = None
+
+    @property
+    def rect(self) -> Tuple[float, float, float, float]:
+        """Rectángulo (izquierda, abajo, ancho, alto)"""
+        return (self.center_x - self.width / 2, self.center_y - self.height / 2, self.width, self.height)
+
+    def contains(self, x: float, y: float) -> bool:
+        """Si el punto cae dentro del widget"""
+        return (abs(x - self.center_x) <= self.width / 2 and
+                abs(y - self.center_y) <= self.height / 2)
+
+    def invalidate(self):
+        """Marcar la capa para rehacer su geometría antes del próximo dibujo"""
+        if self.layer:
+            self.layer.invalidate()
+
+    def attach(self, layer: "WidgetLayer"):
+        """Registrar el widget en una capa"""
+        self.layer = layer
+
+    def create_texts(self, batch: pyglet.graphics.Batch):
+        """Crear los textos del widget en el lote (al dibujar la capa por primera vez)"""
+
+    def build(self, shapes: shape_list.ShapeElementList):
+        """Añadir la geometría del widget a la lista de formas de la capa"""
+
+def _add_borders(shapes: shape_list.ShapeElementList, widget: Widget, borders: Iterable[Border]):
+    """Contornos concéntricos hacia dentro del rectángulo del widget"""
+    for border in borders:
+        shapes.append(shape_list.create_rectangle_outline(
+            widget.center_x, widget.center_y,
+            widget.width - 2 * border.inset, widget.height - 2 * border.inset,
+            border.color, border.width
+        ))
+
+class Panel(Widget):
+    """Fondo de pergamino con varios bordes"""
+
+    def __init__(self, center_x: float, center_y: float, width: float, height: float,
+                 fill: Color, borders: Sequence[Border] = ()):
+        super().__init__(center_x, center_y, width, height)
+        self.fill = fill
+        self.borders = tuple(borders)
+
+    def build(self, shapes: shape_list.ShapeElementList):
+        """Fondo y bordes"""
+        shapes.append(shape_list.create_rectangle_filled(
+            self.center_x, self.center_y, self.width, self.height, self.fill
+        ))
+        _add_borders(shapes, self, self.borders)
+
+class Label(Widget):
+    """Texto fijo (con sombra opcional) dibujado dentro del lote de su capa"""
+
+    def __init__(self, text: str, x: float, y: float, color: Color, font_size: float = 18,
+                 bold: bool = False, anchor_x: str = "center", anchor_y: str = "baseline",
+                 shadow: Optional[Color] = None, shadow_offset: Tuple[float, float] = (2, -2)):
+        super().__init__(x, y, 0, 0)
+        self.text = text
+        self.color = color
+        self.font_size = font_size
+        self.bold = bold
+        self.anchor_x = anchor_x
+        self.anchor_y = anchor_y
+        self.shadow = shadow
+        self.shadow_offset = shadow_offset
+        self._shadow_text: Optional[arcade.Text] = None
+        self._text: Optional[arcade.Text] = None
+
+    def create_texts(self, batch: pyglet.graphics.Batch):
+        """Maquetar el texto (y su sombra) una sola vez dentro del lote"""
+        if self._text is not None:
+            return
+        if self.shadow is not None:
+            dx, dy = self.shadow_offset
+            self._shadow_text = self._make_text(self.center_x + dx, self.center_y + dy, self.shadow,
+                                                batch, SHADOW_GROUP)
+        self._text = self._make_text(self.center_x, self.center_y, self.color, batch, TEXT_GROUP)
+
+    def _make_text(self, x: float, y: float, color: Color, batch: pyglet.graphics.Batch,
+                   group: pyglet.graphics.Group) -> arcade.Text:
+        """Texto de pyglet dentro del lote"""
+        return arcade.Text(self.text, x, y, color, font_size=self.font_size, bold=self.bold,
+                           anchor_x=self.anchor_x, anchor_y=self.anchor_y, batch=batch, group=group)
+
+    def set_text(self, text: str):
+        """Cambiar el texto (pyglet rehace solo el maquetado de esta etiqueta)"""
+        if text != self.text:
+            self.text = text
+            for label in (self._shadow_text, self._text):
+                if label is not None:
+                    label.text = text
+            self.invalidate()
+
+    def set_color(self, color: Color):
+        """Cambiar el color del texto (no rehace el maquetado)"""
+        if color != self.color:
+            self.color = color
+            if self._text is not None:
+                self._text.color = color
+            self.invalidate()
+
+class Button(Widget):
+    """Botón con foco y acción; el foco cambia colores y bordes"""
+
+    def __init__(self, text: str, center_x: float, center_y: float, width: float, height: float,
+                 style: ButtonStyle, action: Optional[Callable[[], None]] = None):
+        super().__init__(center_x, center_y, width, height)
+        self.style = style
+        self.action = action
+        self.focused = False
+        self.label = Label(text, center_x, center_y, style.text, style.font_size, bold=True,
+                           anchor_y="center", shadow=style.shadow)
+
+    def attach(self, layer: "WidgetLayer"):
+        """Registrar también el texto del botón"""
+        super().attach(layer)
+        self.label.attach(layer)
+
+    def create_texts(self, batch: pyglet.graphics.Batch):
+        """El texto del botón va en el mismo lote"""
+        self.label.create_texts(batch)
+
+    def set_focused(self, focused: bool):
+        """Dar o quitar el foco"""
+        if focused != self.focused:
+            self.focused = focused
+            self.label.set_color(self.style.focus_text if focused else self.style.text)
+            self.invalidate()
+
+    def activate(self):
+        """Ejecutar la acción del botón"""
+        if self.action:
+            self.action()
+
+    def build(self, shapes: shape_list.ShapeElementList):
+        """Resplandor, fondo y bordes según el foco"""
+        style = self.style
+        if self.focused:
+            margin = style.glow_margin
+            shapes.append(shape_list.create_rectangle_filled(
+                self.center_x, self.center_y, self.width + 2 * margin, self.height + 2 * margin, style.glow
+            ))
+        shapes.append(shape_list.create_rectangle_filled(
+            self.center_x, self.center_y, self.width, self.height,
+            style.focus_fill if self.focused else style.fill
+        ))
+        _add_borders(shapes, self, (
+            Border(0, style.focus_border if self.focused else style.border, 4 if self.focused else 3),
+            Border(style.inner_inset, style.inner_border, 2),
+        ))
+
+class FocusList:
+    """Botones recorridos con las flechas; ENTER/ESPACIO activan el que tiene el foco"""
+
+    def __init__(self, buttons: Sequence[Button], wrap: bool = True, focus: int = 0,
+                 activate_keys: Sequence[int] = (arcade.key.ENTER, arcade.key.SPACE)):
+        self.buttons = list(buttons)
+        self.wrap = wrap
+        self.activate_keys = tuple(activate_keys)
+        self.focus = -1
+        self.set_focus(focus)
+
+    @property
+    def focused(self) -> Button:
+        """Botón con el foco"""
+        return self.buttons[self.focus]
+
+    def set_focus(self, index: int):
+        """Mover el foco a un botón concreto"""
+        if self.wrap:
+            index %= len(self.buttons)
+        else:
+            index = max(0, min(len(self.buttons) - 1, index))
+        if index != self.focus:
+            for position, button in enumerate(self.buttons):
+                button.set_focused(position == index)
+            self.focus = index
+
+    def handle_key(self, key: int) -> bool:
+        """Navegar o activar; devuelve si la tecla se usó"""
+        if key == arcade.key.UP:
+            self.set_focus(self.focus - 1)
+        elif key == arcade.key.DOWN:
+            self.set_focus(self.focus + 1)
+        elif key in self.activate_keys:
+            self.focused.activate()
+        else:
+            return False
+        return True
+
+    def handle_click(self, x: float, y: float) -> bool:
+        """Enfocar y activar el botón bajo el ratón; devuelve si había alguno"""
+        for index, button in enumerate(self.buttons):
+            if button.contains(x, y):
+                self.set_focus(index)
+                button.activate()
+                return True
+        return False
+
+class WidgetLayer:
+    """Widgets de una pantalla: formas en un ShapeElementList y textos en un lote de pyglet"""
+
+    def __init__(self, widgets: Iterable[Widget] = ()):
+        self.widgets: List[Widget] = []
+        self.batch: Optional[pyglet.graphics.Batch] = None  # se crea al dibujar (las repeticiones no dibujan)
+        self.shapes: Optional[shape_list.ShapeElementList] = None
+        self.version = next(_versions)  # cambia con cada modificación (sirve de clave para cachés externas)
+        for widget in widgets:
+            self.add(widget)
+
+    def add(self, widget: Widget) -> Widget:
+        """Añadir un widget a la capa"""
+        self.widgets.append(widget)
+        widget.attach(self)
+        self.invalidate()
+        return widget
+
+    def invalidate(self):
+        """Rehacer la geometría en el próximo dibujo"""
+        self.shapes = None
+        self.version = next(_versions)
+
+    def draw(self):
+        """Dibujar todas las formas y todos los textos (dos llamadas en lote)"""
+        if self.shapes is None:
+            if self.batch is None:
+                self.batch = pyglet.graphics.Batch()
+            self.shapes = shape_list.ShapeElementList()
+            for widget in self.widgets:
+                widget.build(self.shapes)
+                widget.create_texts(self.batch)
+        self.shapes.draw()
+        self.batch.draw()
@@ -0,0 +1,136 @@
+"""
+Motor de tableros de símbolos con NumPy
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Optional, Tuple
+
+# Celda vacía en tableros y comodín en plantillas
+EMPTY = -1
+
+class BoardEngine:
+    """Genera y analiza tableros de símbolos (matrices de enteros)"""
+
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = np.random.default_rng(seed)
+
+    def random_board(self, rows: int, cols: int, num_symbols: int) -> np.ndarray:
+        """Tablero con símbolos aleatorios"""
+        return self.rng.integers(0, num_symbols, size=(rows, cols), dtype=np.int8)
+
+    @staticmethod
+    def match_mask(board: np.ndarray, template: np.ndarray) -> np.ndarray:
+        """Posiciones (esquina superior izquierda) donde la plantilla coincide"""
+        windows = sliding_window_view(board, template.shape)
+        wildcard = template == EMPTY
+        return np.all((windows == template) | wildcard, axis=(2, 3))
+
+    def find_matches(self, board: np.ndarray, template: np.ndarray) -> np.ndarray:
+        """Lista de coincidencias como filas (fila, columna)"""
+        return np.argwhere(self.match_mask(board, template))
+
+    def plant_unique_pattern(self, rows: int, cols: int, template_shape: Tuple[int, int],
+                             num_symbols: int, max_rounds: int = 64):
+        """Generar un tablero donde una plantilla aparece exactamente una vez
+
+        Devuelve (tablero, plantilla, (fila, columna)) o None si no converge.
+        """
+        template_rows, template_cols = template_shape
+        template = self.random_board(template_rows, template_cols, num_symbols)
+        while len(np.unique(template)) < 2:
+            template = self.random_board(template_rows, template_cols, num_symbols)
+
+        board = self.random_board(rows, cols, num_symbols)
+        row = int(self.rng.integers(0, rows - template_rows + 1))
+        col = int(self.rng.integers(0, cols - template_cols + 1))
+        board[row:row + template_rows, col:col + template_cols] = template
+
+        # Celdas de la plantilla plantada (no se tocan al reparar)
+        planted = np.zeros(board.shape, dtype=bool)
+        planted[row:row + template_rows, col:col + template_cols] = True
+        offsets_r, offsets_c = np.indices(template_shape).reshape(2, -1)
+
+        for _ in range(max_rounds):
+            mask = self.match_mask(board, template)
+            mask[row, col] = False
+            spurious = np.argwhere(mask)
+            if len(spurious) == 0:
+                return board, template, (row, col)
+
+            # Romper cada coincidencia falsa cambiando una celda fuera de la zona plantada
+            for match_r, match_c in spurious:
+                cells_r = match_r + offsets_r
+                cells_c = match_c + offsets_c
+                free = ~planted[cells_r, cells_c]
+                pick = self.rng.choice(np.flatnonzero(free))
+                r, c = cells_r[pick], cells_c[pick]
+                board[r, c] = (board[r, c] + self.rng.integers(1, num_symbols)) % num_symbols
+
+        return None
+
+    def latin_square(self, size: int) -> np.ndarray:
+        """Cuadrado latino aleatorio (cada símbolo una vez por fila y columna)"""
+        base = (np.arange(size)[:, None] + np.arange(size)[None, :]) % size
+        rows = self.rng.permutation(size)
+        cols = self.rng.permutation(size)
+        symbols = self.rng.permutation(size).astype(np.int8)
+        return symbols[base[rows][:, cols]]
+
+    @staticmethod
+    def candidates(board: np.ndarray, num_symbols: int) -> np.ndarray:
+        """Candidatos (fila, columna, símbolo) permitidos por filas y columnas"""
+        empty = board == EMPTY
+        rows, cols = np.nonzero(~empty)
+        placed = np.zeros(board.shape + (num_symbols,), dtype=bool)
+        placed[rows, cols, board[rows, cols]] = True
+        row_has = placed.any(axis=1)
+        col_has = placed.any(axis=0)
+        return empty[:, :, None] & ~row_has[:, None, :] & ~col_has[None, :, :]
+
+    def propagate(self, board: np.ndarray, num_symbols: int) -> Optional[np.ndarray]:
+        """Resolver solo con deducciones forzadas (únicos desnudos y ocultos)
+
+        Si devuelve un tablero, esa es la única solución posible.
+        """
+        board = board.copy()
+        while True:
+            empty = board == EMPTY
+            if not empty.any():
+                return board
+
+            candidates = self.candidates(board, num_symbols)
+            counts = candidates.sum(axis=2)
+            if (empty & (counts == 0)).any():
+                return None  # Contradicción
+
+            # Único desnudo: la celda admite un solo símbolo
+            naked = (counts == 1)[:, :, None] & candidates
+            # Único oculto: el símbolo solo cabe en una celda de su fila o columna
+            row_single = candidates.sum(axis=1) == 1
+            col_single = candidates.sum(axis=0) == 1
+            hidden = candidates & (row_single[:, None, :] | col_single[None, :, :])
+
+            forced = naked | hidden
+            cells = forced.any(axis=2)
+            if not cells.any():
+                return None  # Hace falta adivinar: la solución no está garantizada
+            board[cells] = forced.argmax(axis=2)[cells]
+
+    def latin_puzzle(self, size: int, blanks: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Cuadrado latino con celdas vacías y solución única"""
+        solution = self.latin_square(size)
+        puzzle = solution.copy()
+        removed = 0
+
+        for index in self.rng.permutation(size * size):
+            if removed >= blanks:
+                break
+            r, c = divmod(int(index), size)
+            puzzle[r, c] = EMPTY
+            if self.propagate(puzzle, size) is None:
+                puzzle[r, c] = solution[r, c]
+            else:
+                removed += 1
+
+        return puzzle, solution
@@ -0,0 +1,131 @@
+"""
+Base para puzzles sobre tableros de símbolos
+"""
+
+import random
+import numpy as np
+from typing import Optional, Tuple
+from puzzles.puzzle_base import Puzzle, digit_bindings
+from puzzles.board_engine import BoardEngine, EMPTY
+from utils.config import Config
+
+class BoardPuzzle(Puzzle):
+    """Puzzle con un tablero de símbolos y un cursor"""
+
+    SYMBOLS = ("▲", "●", "■", "★", "◆", "▼")
+
+    DIRECTIONS = {
+        "UP": (-1, 0),
+        "DOWN": (1, 0),
+        "LEFT": (0, -1),
+        "RIGHT": (0, 1)
+    }
+
+    # Flechas para el cursor, 1-6 para símbolos, BACKSPACE/ENTER
+    KEY_BINDINGS = {
+        **{direction: direction for direction in DIRECTIONS},
+        **digit_bindings(1, 6),
+        "BACKSPACE": "BACKSPACE",
+        "ENTER": "ENTER"
+    }
+
+    def __init__(self, difficulty: float = 1.0, config: Config = None):
+        super().__init__(difficulty, config)
+        self.engine = BoardEngine(random.getrandbits(32))  # Reproducible con la semilla de la sesión
+        self.board = np.full((1, 1), EMPTY, dtype=np.int8)
+        self.cursor = (0, 0)
+
+        # Sprites del tablero (se reconstruyen al cambiar el tablero o la disposición)
+        self.board_version = 0
+        self._board_sprites = None
+        self._board_layout = None
+
+    def move_cursor(self, direction: str) -> bool:
+        """Mover el cursor dentro del tablero"""
+        if direction not in self.DIRECTIONS:
+            return False
+        dr, dc = self.DIRECTIONS[direction]
+        rows, cols = self.board.shape
+        row, col = self.cursor
+        self.cursor = (min(rows - 1, max(0, row + dr)), min(cols - 1, max(0, col + dc)))
+        return True
+
+    def _board_geometry(self, screen_width: int, screen_height: int, area: int,
+                        center_x: Optional[int] = None) -> Tuple[int, int, int]:
+        """Calcular esquina superior izquierda y tamaño de celda del tablero"""
+        rows, cols = self.board.shape
+        cell = max(12, area // max(rows, cols))
+        center_x = screen_width // 2 if center_x is None else center_x
+        left = center_x - cols * cell // 2
+        top = screen_height // 2 - 40 + rows * cell // 2
+        return left, top, cell
+
+    def _cell_center(self, row: int, col: int, left: int, top: int, cell: int) -> Tuple[int, int]:
+        """Centro en pantalla de una celda"""
+        return left + col * cell + cell // 2, top - row * cell - cell // 2
+
+    def _draw_board_frame(self, left: int, top: int, cell: int, board: np.ndarray):
+        """Dibujar el pergamino y las líneas del tablero"""
+        import arcade
+
+        rows, cols = board.shape
+        right = left + cols * cell
+        bottom = top - rows * cell
+
+        arcade.draw_lrbt_rectangle_filled(
+            left - 15, right + 15, bottom - 15, top + 15,
+            (*self.config.COLORS['primary'], 200)
+        )
+        arcade.draw_lrbt_rectangle_outline(
+            left - 15, right + 15, bottom - 15, top + 15,
+            self.config.COLORS['secondary'], 4
+        )
+
+        for i in range(cols + 1):
+            x = left + i * cell
+            arcade.draw_line(x, bottom, x, top, self.config.COLORS['secondary'], 1)
+        for i in range(rows + 1):
+            y = bottom + i * cell
+            arcade.draw_line(left, y, right, y, self.config.COLORS['secondary'], 1)
+
+    def _draw_board_symbols(self, board: np.ndarray, left: int, top: int, cell: int, colors=None):
+        """Dibujar todos los símbolos del tablero en una sola llamada
+
+        colors: matriz opcional de índices (0: acento, 1: texto, 2: error) por celda.
+        """
+        import arcade
+        from utils.glyph_atlas import get_glyph_atlas
+
+        layout = (left, top, cell, self.board_version, self.config.COLORS['accent'])
+        if self._board_sprites is None or self._board_layout != layout:
+            atlas = get_glyph_atlas()
+            palette = (self.config.COLORS['accent'], self.config.COLORS['text'], self.config.COLORS['error'])
+            font_size = max(8, int(cell * 0.45))
+            self._board_sprites = arcade.SpriteList()
+
+            rows, cols = np.nonzero(board != EMPTY)
+            for row, col in zip(rows.tolist(), cols.tolist()):
+                x, y = self._cell_center(row, col, left, top, cell)
+                color = palette[colors[row, col]] if colors is not None else palette[0]
+                self._board_sprites.append(atlas.create_sprite(
+                    self.SYMBOLS[board[row, col]], font_size, color, x, y, bold=True
+                ))
+            self._board_layout = layout
+
+        self._board_sprites.draw()
+
+    def _draw_cursor(self, left: int, top: int, cell: int, width: int = 1, height: int = 1):
+        """Resaltar la celda (o zona) seleccionada"""
+        import arcade
+
+        row, col = self.cursor
+        x0 = left + col * cell
+        y1 = top - row * cell
+        arcade.draw_lrbt_rectangle_outline(
+            x0 + 1, x0 + width * cell - 1, y1 - height * cell + 1, y1 - 1,
+            self.config.COLORS['warning'], 3
+        )
+
+    def _symbol_legend(self, count: int) -> str:
+        """Texto con la tecla de cada símbolo"""
+        return " ".join(f"{i + 1}={symbol}" for i, symbol in enumerate(self.SYMBOLS[:count]))
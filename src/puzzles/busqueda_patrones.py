@@ -0,0 +1,148 @@
+"""
+Puzzle de búsqueda de patrones
+"""
+
+import numpy as np
+from typing import Any
+from puzzles.board_puzzle import BoardPuzzle
+from utils.config import Config
+from utils.logger import get_logger
+
+logger = get_logger("puzzles")
+
+PUZZLE_PLUGINS = {"busqueda_patrones": "BusquedaPatronesPuzzle"}
+
+class BusquedaPatronesPuzzle(BoardPuzzle):
+    """Encontrar el único lugar del tablero donde aparece el patrón"""
+
+    def __init__(self, difficulty: float = 1.0, config: Config = None):
+        super().__init__(difficulty, config)
+        self.pattern = np.zeros((2, 2), dtype=np.int8)
+        self.answer = (0, 0)
+        self.num_symbols = 3
+
+        # Sprites del patrón (independientes de los del tablero)
+        self._pattern_sprites = None
+        self._pattern_layout = None
+
+    def setup_puzzle(self):
+        """Configurar el puzzle de búsqueda de patrones"""
+        size = min(16, 6 + int(self.difficulty * 3))
+        pattern_size = 2 if self.difficulty < 2.0 else 3
+        self.num_symbols = 3 if self.difficulty < 1.5 else 4
+
+        generated = None
+        while generated is None:
+            generated = self.engine.plant_unique_pattern(
+                size, size, (pattern_size, pattern_size), self.num_symbols
+            )
+
+        self.board, self.pattern, self.answer = generated
+        self.cursor = (0, 0)
+        self.total_steps = 1
+        self.current_step = 0
+        self.board_version += 1
+
+    def handle_input(self, input_data: Any) -> bool:
+        """Manejar entrada del jugador"""
+        if self.completed or not isinstance(input_data, str):
+            return False
+
+        if input_data in self.DIRECTIONS:
+            # La zona seleccionada tiene el tamaño del patrón y no sale del tablero
+            self.move_cursor(input_data)
+            max_row = self.board.shape[0] - self.pattern.shape[0]
+            max_col = self.board.shape[1] - self.pattern.shape[1]
+            self.cursor = (min(self.cursor[0], max_row), min(self.cursor[1], max_col))
+            return True
+
+        if input_data == "ENTER":
+            self.attempts += 1
+            if self.cursor == self.answer:
+                logger.info("¡CORRECTO! Has encontrado el patrón")
+                self.current_step = 1
+                self.complete_puzzle()
+                return True
+            logger.info("Incorrecto. El patrón no está en esa zona")
+            return False
+
+        return False
+
+    def draw_puzzle(self, screen_width: int, screen_height: int):
+        """Dibujar el puzzle de búsqueda de patrones con diseño de ruinas"""
+        import arcade
+        from utils.glyph_atlas import get_glyph_atlas
+
+        # Fondo atmosférico de ruinas
+        self._draw_ruins_background(screen_width, screen_height)
+
+        # Efectos de iluminación
+        self._draw_ruins_lighting(screen_width, screen_height)
+
+        # Título con estilo de pergamino
+        self._draw_puzzle_title("BÚSQUEDA DE PATRONES", screen_width, screen_height)
+
+        # Instrucciones con panel de pergamino
+        self._draw_instructions_panel(
+            screen_width, screen_height,
+            "Encuentra el patrón en el tablero"
+        )
+
+        arcade.draw_text(
+            "Flechas: mover la zona | ENTER: confirmar",
+            screen_width // 2,
+            screen_height - 110,
+            self.config.COLORS['accent'],
+            font_size=self.config.FONT_SIZE_SMALL,
+            anchor_x="center"
+        )
+
+        # Tablero a la derecha
+        left, top, cell = self._board_geometry(screen_width, screen_height, 440,
+                                               center_x=screen_width // 2 + 120)
+        self._draw_board_frame(left, top, cell, self.board)
+        self._draw_board_symbols(self.board, left, top, cell)
+        self._draw_cursor(left, top, cell, self.pattern.shape[1], self.pattern.shape[0])
+
+        # Patrón a buscar a la izquierda
+        pattern_cell = 50
+        rows, cols = self.pattern.shape
+        pattern_left = left - 90 - cols * pattern_cell
+        pattern_top = top - 40
+        arcade.draw_text(
+            "Patrón",
+            pattern_left + cols * pattern_cell // 2,
+            pattern_top + 25,
+            self.config.COLORS['text'],
+            font_size=self.config.FONT_SIZE_MEDIUM,
+            anchor_x="center",
+            bold=True
+        )
+        self._draw_board_frame(pattern_left, pattern_top, pattern_cell, self.pattern)
+
+        layout = (pattern_left, pattern_top, self.board_version, self.config.COLORS['accent'])
+        if self._pattern_sprites is None or self._pattern_layout != layout:
+            atlas = get_glyph_atlas()
+            self._pattern_sprites = arcade.SpriteList()
+            for row in range(rows):
+                for col in range(cols):
+                    x, y = self._cell_center(row, col, pattern_left, pattern_top, pattern_cell)
+                    self._pattern_sprites.append(atlas.create_sprite(
+                        self.SYMBOLS[self.pattern[row, col]], 24,
+                        self.config.COLORS['accent'], x, y, bold=True
+                    ))
+            self._pattern_layout = layout
+        self._pattern_sprites.draw()
+
+    def get_hint(self) -> str:
+        """Obtener una pista"""
+        if self.hints_used >= self.max_hints:
+            return "No hay más pistas disponibles"
+
+        self.hints_used += 1
+
+        row, col = self.answer
+        if self.hints_used == 1:
+            half = "superior" if row < self.board.shape[0] // 2 else "inferior"
+            return f"El patrón está en la mitad {half} del tablero"
+        return f"El patrón empieza en la columna {col + 1}"
@@ -0,0 +1,147 @@
+"""
+Puzzle de lógica de símbolos (cuadrado latino)
+"""
+
+import numpy as np
+from typing import Any
+from puzzles.board_puzzle import BoardPuzzle
+from puzzles.board_engine import EMPTY
+from utils.config import Config
+from utils.logger import get_logger
+
+logger = get_logger("puzzles")
+
+PUZZLE_PLUGINS = {"logica_simbolos": "LogicaSimbolosPuzzle"}
+
+class LogicaSimbolosPuzzle(BoardPuzzle):
+    """Completar el tablero: cada símbolo una vez por fila y columna"""
+
+    def __init__(self, difficulty: float = 1.0, config: Config = None):
+        super().__init__(difficulty, config)
+        self.size = 3
+        self.solution = self.board.copy()
+        self.given = np.zeros(self.board.shape, dtype=bool)
+        self.wrong = np.zeros(self.board.shape, dtype=bool)
+
+    def setup_puzzle(self):
+        """Configurar el puzzle de lógica de símbolos"""
+        self.size = max(3, min(len(self.SYMBOLS), 3 + int(self.difficulty)))
+        cells = self.size * self.size
+        blanks = min(cells - self.size, int(cells * (0.35 + 0.1 * self.difficulty)))
+
+        puzzle, self.solution = self.engine.latin_puzzle(self.size, blanks)
+        self.board = puzzle.copy()
+        self.given = puzzle != EMPTY
+        self.wrong = np.zeros(self.board.shape, dtype=bool)
+        self.total_steps = int((~self.given).sum())
+        self.current_step = 0
+
+        # Empezar en la primera celda vacía
+        empty = np.argwhere(~self.given)
+        self.cursor = tuple(int(v) for v in empty[0]) if len(empty) else (0, 0)
+        self.board_version += 1
+
+    def handle_input(self, input_data: Any) -> bool:
+        """Manejar entrada del jugador"""
+        if self.completed or not isinstance(input_data, str):
+            return False
+
+        if input_data in self.DIRECTIONS:
+            return self.move_cursor(input_data)
+
+        row, col = self.cursor
+        if self.given[row, col]:
+            return False
+
+        if input_data == "BACKSPACE":
+            self.board[row, col] = EMPTY
+            self.wrong[row, col] = False
+        elif input_data.isdigit() and 1 <= int(input_data) <= self.size:
+            self.board[row, col] = int(input_data) - 1
+            self.wrong[row, col] = False
+        else:
+            return False
+
+        self.board_version += 1
+        self.current_step = int(((self.board != EMPTY) & ~self.given).sum())
+
+        # Comprobar cuando el tablero está lleno
+        if self.current_step == self.total_steps:
+            self.attempts += 1
+            if np.array_equal(self.board, self.solution):
+                logger.info("¡CORRECTO! Has completado el tablero")
+                self.complete_puzzle()
+                return True
+            self.wrong = self.board != self.solution
+            logger.info("Incorrecto. Hay %d símbolos mal colocados", int(self.wrong.sum()))
+            return False
+
+        return True
+
+    def draw_puzzle(self, screen_width: int, screen_height: int):
+        """Dibujar el puzzle de lógica de símbolos con diseño de ruinas"""
+        import arcade
+
+        # Fondo atmosférico de ruinas
+        self._draw_ruins_background(screen_width, screen_height)
+
+        # Efectos de iluminación
+        self._draw_ruins_lighting(screen_width, screen_height)
+
+        # Título con estilo de pergamino
+        self._draw_puzzle_title("LÓGICA DE SÍMBOLOS", screen_width, screen_height)
+
+        # Instrucciones con panel de pergamino
+        self._draw_instructions_panel(
+            screen_width, screen_height,
+            "Cada símbolo una vez por fila y por columna"
+        )
+
+        arcade.draw_text(
+            f"Flechas: mover | {self._symbol_legend(self.size)} | BACKSPACE: borrar",
+            screen_width // 2,
+            screen_height - 110,
+            self.config.COLORS['accent'],
+            font_size=self.config.FONT_SIZE_SMALL,
+            anchor_x="center"
+        )
+
+        # Tablero: pistas en acento, respuestas en texto, errores en rojo
+        left, top, cell = self._board_geometry(screen_width, screen_height, 360)
+        self._draw_board_frame(left, top, cell, self.board)
+
+        for row, col in np.argwhere(self.given):
+            x0 = left + col * cell
+            y1 = top - row * cell
+            arcade.draw_lrbt_rectangle_filled(
+                x0 + 2, x0 + cell - 2, y1 - cell + 2, y1 - 2,
+                (*self.config.COLORS['secondary'], 120)
+            )
+
+        colors = np.where(self.given, 0, np.where(self.wrong, 2, 1))
+        self._draw_board_symbols(self.board, left, top, cell, colors)
+        self._draw_cursor(left, top, cell)
+
+        # Información del puzzle
+        progress = self.current_step / self.total_steps if self.total_steps else 0
+        arcade.draw_text(
+            f"Progreso: {progress:.1%}",
+            20,
+            screen_height - 70,
+            self.config.COLORS['text'],
+            font_size=self.config.FONT_SIZE_SMALL
+        )
+
+    def get_hint(self) -> str:
+        """Obtener una pista"""
+        if self.hints_used >= self.max_hints:
+            return "No hay más pistas disponibles"
+
+        self.hints_used += 1
+
+        # Revelar una celda vacía o incorrecta
+        pending = np.argwhere((self.board != self.solution) & ~self.given)
+        if not len(pending):
+            return "El tablero ya está completo"
+        row, col = (int(v) for v in pending[0])
+        return f"En la fila {row + 1}, columna {col + 1} va {self.SYMBOLS[self.solution[row, col]]}"
@@ -2,20 +2,39 @@
 Sistema base de puzzles
 """
 
-import time
 import random
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, Tuple
-from utils.config import Config
+from utils.config import Config, get_config
+from utils.effects_pipeline import DEFAULT_PARAMETERS, EffectiveParameters
+from utils.game_clock import game_time
+from puzzles.sequence_families import FAMILIES, generate_sequence
+from utils.logger import get_logger
+
+logger = get_logger("puzzles")
+
+# Tipos de puzzle de este módulo (los lee puzzles/registry.py sin importar el módulo)
+PUZZLE_PLUGINS = {
+    "simon_dice": "SimonDicePuzzle",
+    "patron_secuencia": "PatronSecuenciaPuzzle",
+    "memoria_espacial": "MemoriaEspacialPuzzle"
+}
+
+def digit_bindings(first: int, last: int) -> Dict[str, str]:
+    """Teclas numéricas de arcade -> dígito como texto"""
+    return {f"KEY_{digit}": str(digit) for digit in range(first, last + 1)}
 
 class Puzzle(ABC):
     """Clase base abstracta para todos los puzzles"""
     
+    # Nombre de tecla de arcade -> entrada que recibe handle_input
+    KEY_BINDINGS: Dict[str, str] = {}
+    
     def __init__(self, difficulty: float = 1.0, config: Config = None):
-        self.config = config or Config()
+        self.config = config or get_config()
         self.difficulty = difficulty
         self.completed = False
-        self.start_time = time.time()
+        self.start_time = game_time()
         self.time_limit = self.config.PUZZLE_TIMEOUT
         self.score = 0
         self.attempts = 0
@@ -33,6 +52,10 @@ class Puzzle(ABC):
         # Control de pausa del timer
         self.is_paused = False
         self.paused_time = 0.0  # Tiempo acumulado mientras estaba pausado
+        
+        # Efectos de habilidades y anomalías; el timer acumula por tramos de igual velocidad
+        self.effects = DEFAULT_PARAMETERS
+        self.elapsed_base = 0.0
     
     def _draw_ruins_background(self, screen_width: int, screen_height: int):
         """Dibujar fondo atmosférico de ruinas"""
@@ -74,19 +97,9 @@ class Puzzle(ABC):
 
     def _draw_ruins_lighting(self, screen_width: int, screen_height: int):
         """Dibujar efectos de iluminación de ruinas"""
-        import arcade
-        
-        # Luz central mística
-        center_x = screen_width // 2
-        center_y = screen_height // 2
+        from utils.lighting import Light, get_light_layer, torch_lights
         
-        # Resplandor central más intenso
-        for radius in [400, 300, 200, 100]:
-            alpha = max(0, 60 - radius // 8)
-            arcade.draw_circle_filled(
-                center_x, center_y, radius,
-                (*self.config.COLORS['torch'], alpha)
-            )
+        torch_color = self.config.COLORS['torch']
         
         # Antorchas en las esquinas
         torch_positions = [
@@ -96,16 +109,10 @@ class Puzzle(ABC):
             (screen_width - 120, 120)
         ]
         
-        for tx, ty in torch_positions:
-            # Llama de antorcha
-            arcade.draw_circle_filled(tx, ty, 20, self.config.COLORS['torch'])
-            # Resplandor de antorcha
-            for radius in [50, 35, 20]:
-                alpha = max(0, 40 - radius)
-                arcade.draw_circle_filled(
-                    tx, ty, radius,
-                    (*self.config.COLORS['torch'], alpha)
-                )
+        # Luz central mística más intensa y antorchas, en una sola llamada
+        lights = [Light(screen_width // 2, screen_height // 2, 400, torch_color, 0.3)]
+        lights += torch_lights(torch_positions, 20, 70, torch_color)
+        get_light_layer("puzzle").draw(lights)
 
     def _draw_puzzle_title(self, title: str, screen_width: int, screen_height: int):
         """Dibujar título del puzzle con estilo de pergamino"""
@@ -208,23 +215,35 @@ class Puzzle(ABC):
         """Obtener una pista para el puzzle"""
         pass
     
+    def elapsed_time(self) -> float:
+        """Tiempo de puzzle transcurrido (escalado por los efectos activos)"""
+        if self.is_paused:
+            return self.paused_time
+        return self.elapsed_base + (game_time() - self.start_time) * self.effects.time_scale
+    
+    def effective_time_limit(self) -> float:
+        """Límite de tiempo con el multiplicador de los efectos sobre el límite base"""
+        return self.time_limit * self.effects.time_limit_multiplier
+    
+    def apply_effects(self, effects: EffectiveParameters):
+        """Aplicar parámetros efectivos nuevos sin alterar el tiempo ya transcurrido"""
+        if not self.is_paused:
+            self.elapsed_base = self.elapsed_time()
+            self.start_time = game_time()
+        self.effects = effects
+    
+    def restart_timer(self):
+        """Empezar a contar el tiempo desde ahora"""
+        self.elapsed_base = 0.0
+        self.start_time = game_time()
+    
     def is_time_up(self) -> bool:
         """Verificar si se agotó el tiempo"""
-        if self.is_paused:
-            # Si está pausado, verificar usando el tiempo pausado
-            return self.paused_time >= self.time_limit
-        else:
-            # Si no está pausado, verificar normalmente
-            return time.time() - self.start_time >= self.time_limit
+        return self.elapsed_time() >= self.effective_time_limit()
     
     def get_remaining_time(self) -> float:
         """Obtener tiempo restante"""
-        if self.is_paused:
-            # Si está pausado, devolver el tiempo que quedaba cuando se pausó
-            return max(0, self.time_limit - self.paused_time)
-        else:
-            # Si no está pausado, calcular normalmente
-            return max(0, self.time_limit - (time.time() - self.start_time))
+        return max(0, self.effective_time_limit() - self.elapsed_time())
     
     def is_timer_active(self) -> bool:
         """Verificar si el timer está activo"""
@@ -233,16 +252,21 @@ class Puzzle(ABC):
     def pause_timer(self):
         """Pausar el timer del puzzle"""
         if not self.is_paused:
-            self.is_paused = True
             # Guardar el tiempo transcurrido hasta ahora
-            self.paused_time = time.time() - self.start_time
+            self.paused_time = self.elapsed_time()
+            self.is_paused = True
     
     def resume_timer(self):
         """Reanudar el timer del puzzle"""
         if self.is_paused:
             self.is_paused = False
-            # Ajustar el start_time para que el timer continúe desde donde se pausó
-            self.start_time = time.time() - self.paused_time
+            # Continuar desde el tiempo guardado al pausar
+            self.elapsed_base = self.paused_time
+            self.start_time = game_time()
+    
+    def update(self, delta_time: float):
+        """Actualizar la lógica del puzzle (se llama en cada on_update)"""
+        pass
     
     def add_anomaly(self, anomaly_type: str):
         """Agregar una anomalía al puzzle"""
@@ -263,7 +287,7 @@ class Puzzle(ABC):
         base_score = 100
         
         # Penalización por tiempo
-        time_penalty = int((self.time_limit - self.get_remaining_time()) * 2)
+        time_penalty = int((self.effective_time_limit() - self.get_remaining_time()) * 2)
         
         # Penalización por intentos
         attempt_penalty = self.attempts * 10
@@ -285,6 +309,9 @@ class Puzzle(ABC):
 class SimonDicePuzzle(Puzzle):
     """Puzzle tipo Simón Dice con símbolos"""
     
+    # Teclas 1-6 -> símbolos
+    KEY_BINDINGS = {f"KEY_{i}": symbol for i, symbol in enumerate(["▲", "●", "■", "★", "◆", "▼"], 1)}
+    
     def __init__(self, difficulty: float = 1.0, config: Config = None):
         super().__init__(difficulty, config)
         self.sequence: List[str] = []
@@ -296,6 +323,11 @@ class SimonDicePuzzle(Puzzle):
         self.last_symbol_time = 0
         self.timer_started = False  # Para controlar cuándo inicia el timer
         
+        # Sprites de símbolos (se reconstruyen solo si cambia la disposición)
+        self._sequence_sprites = None
+        self._selection_sprites = None
+        self._selection_layout = None
+        
     def setup_puzzle(self):
         """Configurar el puzzle de Simón Dice"""
         # Generar secuencia basada en dificultad
@@ -305,7 +337,7 @@ class SimonDicePuzzle(Puzzle):
         self.current_symbol_index = 0
         self.player_sequence = []
         self.showing_sequence = True
-        self.last_symbol_time = time.time()
+        self.last_symbol_time = game_time()
         self.timer_started = False  # Timer no iniciado hasta terminar demostración
     
     def is_timer_active(self) -> bool:
@@ -314,9 +346,19 @@ class SimonDicePuzzle(Puzzle):
     
     def update(self, delta_time: float):
         """Actualizar el puzzle"""
+        # Avanzar la demostración de la secuencia
+        if self.showing_sequence:
+            if self.current_symbol_index >= len(self.sequence):
+                self.showing_sequence = False
+            elif game_time() - self.last_symbol_time >= self.sequence_delay:
+                self.current_symbol_index += 1
+                self.last_symbol_time = game_time()
+                if self.current_symbol_index >= len(self.sequence):
+                    self.showing_sequence = False
+        
         # Si la demostración terminó y el timer no ha iniciado, iniciarlo
         if not self.showing_sequence and not self.timer_started:
-            self.start_time = time.time()
+            self.restart_timer()
             self.timer_started = True
     
     def handle_input(self, input_data: str) -> bool:
@@ -391,29 +433,7 @@ class SimonDicePuzzle(Puzzle):
         # Mostrar símbolo actual de la secuencia
         if self.current_symbol_index < len(self.sequence):
             symbol = self.sequence[self.current_symbol_index]
-            arcade.draw_text(
-                symbol,
-                screen_width // 2,
-                screen_height // 2,
-                self.config.COLORS['accent'],
-                font_size=72,
-                anchor_x="center",
-                anchor_y="center"
-            )
-            
-            # Avanzar al siguiente símbolo
-            if time.time() - self.last_symbol_time >= self.sequence_delay:
-                self.current_symbol_index += 1
-                self.last_symbol_time = time.time()
-                
-                if self.current_symbol_index >= len(self.sequence):
-                    self.showing_sequence = False
-                    # Iniciar timer cuando termine la demostración
-                    if not self.timer_started:
-                        self.start_time = time.time()
-                        self.timer_started = True
-        else:
-            self.showing_sequence = False
+            self._get_sequence_sprites(symbol, screen_width, screen_height).draw()
     
     def _draw_symbol_selection(self, screen_width: int, screen_height: int):
         """Dibujar los símbolos para seleccionar"""
@@ -447,26 +467,6 @@ class SimonDicePuzzle(Puzzle):
                 (*self.config.COLORS['accent'], 150), 2
             )
             
-            # Símbolo con sombra
-            arcade.draw_text(
-                symbol,
-                x + 2, y - 2,
-                self.config.COLORS['shadow'],
-                font_size=symbol_size,
-                anchor_x="center",
-                anchor_y="center",
-                bold=True
-            )
-            arcade.draw_text(
-                symbol,
-                x, y,
-                self.config.COLORS['accent'],
-                font_size=symbol_size,
-                anchor_x="center",
-                anchor_y="center",
-                bold=True
-            )
-            
             # Dibujar borde si está disponible
             arcade.draw_lrbt_rectangle_outline(
                 x - (symbol_size + 10) // 2,
@@ -477,6 +477,9 @@ class SimonDicePuzzle(Puzzle):
                 2
             )
         
+        # Todos los símbolos (con sombra) en una sola llamada
+        self._get_selection_sprites(start_x, spacing, screen_height // 2, symbol_size).draw()
+        
         # Mostrar secuencia del jugador
         if self.player_sequence:
             arcade.draw_text(
@@ -508,6 +511,42 @@ class SimonDicePuzzle(Puzzle):
                 anchor_x="center"
             )
     
+    def _get_sequence_sprites(self, symbol: str, screen_width: int, screen_height: int):
+        """Sprite del símbolo que se está mostrando"""
+        import arcade
+        from utils.glyph_atlas import get_glyph_atlas
+        
+        texture = get_glyph_atlas().get_texture(symbol, 72, self.config.COLORS['accent'])
+        if self._sequence_sprites is None:
+            self._sequence_sprites = arcade.SpriteList()
+            self._sequence_sprites.append(arcade.Sprite(texture))
+        
+        sprite = self._sequence_sprites[0]
+        sprite.texture = texture
+        sprite.position = (screen_width // 2, screen_height // 2)
+        return self._sequence_sprites
+    
+    def _get_selection_sprites(self, start_x: int, spacing: int, y: int, symbol_size: int):
+        """Sprites de los símbolos seleccionables con su sombra"""
+        import arcade
+        from utils.glyph_atlas import get_glyph_atlas
+        
+        layout = (start_x, spacing, y, symbol_size,
+                  self.config.COLORS['shadow'], self.config.COLORS['accent'])
+        if self._selection_sprites is None or self._selection_layout != layout:
+            atlas = get_glyph_atlas()
+            self._selection_sprites = arcade.SpriteList()
+            for i, symbol in enumerate(self.symbols):
+                x = start_x + i * spacing
+                self._selection_sprites.append(atlas.create_sprite(
+                    symbol, symbol_size, self.config.COLORS['shadow'], x + 2, y - 2, bold=True
+                ))
+                self._selection_sprites.append(atlas.create_sprite(
+                    symbol, symbol_size, self.config.COLORS['accent'], x, y, bold=True
+                ))
+            self._selection_layout = layout
+        return self._selection_sprites
+    
     def _draw_puzzle_info(self, screen_width: int, screen_height: int):
         """Dibujar información del puzzle"""
         import arcade
@@ -542,6 +581,8 @@ class SimonDicePuzzle(Puzzle):
 class MemoriaEspacialPuzzle(Puzzle):
     """Puzzle de memoria espacial - recordar posiciones"""
     
+    KEY_BINDINGS = {**digit_bindings(1, 4), "BACKSPACE": "BACKSPACE"}
+    
     def __init__(self, difficulty: float = 1.0, config: Config = None):
         super().__init__(difficulty, config)
         self.positions: List[Tuple[int, int]] = []
@@ -555,24 +596,32 @@ class MemoriaEspacialPuzzle(Puzzle):
     def setup_puzzle(self):
         """Configurar el puzzle de memoria espacial"""
         # Generar posiciones basadas en dificultad
-        num_positions = int(2 + self.difficulty)
-        self.positions = []
+        num_positions = min(int(2 + self.difficulty), self.grid_size * self.grid_size)
         
-        for _ in range(num_positions):
-            x = random.randint(0, self.grid_size - 1)
-            y = random.randint(0, self.grid_size - 1)
-            self.positions.append((x, y))
+        # Posiciones distintas (repetir una celda no aporta nada que recordar)
+        cells = random.sample(range(self.grid_size * self.grid_size), num_positions)
+        self.positions = [(cell % self.grid_size, cell // self.grid_size) for cell in cells]
         
         self.total_steps = num_positions
         self.current_position_index = 0
         self.player_positions = []
         self.showing_positions = True
-        self.last_position_time = time.time()
+        self.last_position_time = game_time()
     
     def is_timer_active(self) -> bool:
         """Verificar si el timer está activo"""
         return not self.showing_positions
     
+    def update(self, delta_time: float):
+        """Actualizar el puzzle"""
+        # Avanzar la demostración de posiciones
+        if self.showing_positions and game_time() - self.last_position_time >= self.position_delay:
+            self.current_position_index += 1
+            self.last_position_time = game_time()
+            
+            if self.current_position_index >= len(self.positions):
+                self.showing_positions = False
+    
     def handle_input(self, input_data: str) -> bool:
         """Manejar entrada del jugador"""
         if self.showing_positions:
@@ -594,17 +643,17 @@ class MemoriaEspacialPuzzle(Puzzle):
                             if (x, y) != expected_pos:
                                 # Incorrecto, reiniciar
                                 self.player_positions = []
-                                print(f"Incorrecto. La posición correcta era {expected_pos}")
+                                logger.info("Incorrecto. La posición correcta era %s", expected_pos)
                                 return False
                         
                         # Si todas las posiciones han sido ingresadas correctamente
                         if len(self.player_positions) == len(self.positions):
-                            print("¡CORRECTO! Has completado la secuencia")
+                            logger.info("¡CORRECTO! Has completado la secuencia")
                             self.complete_puzzle()
                             return True
                         return True
                 except ValueError:
-                    print("Formato inválido. Usa 'x,y' (ejemplo: '0,1')")
+                    logger.info("Formato inválido. Usa 'x,y' (ejemplo: '0,1')")
                     return False
             elif input_data.isdigit() and input_data in ['1', '2', '3', '4']:
                 # Entrada numérica para coordenadas (solo 1-4)
@@ -612,7 +661,7 @@ class MemoriaEspacialPuzzle(Puzzle):
                     self.current_input = ""
                 
                 self.current_input += input_data
-                print(f"Entrada actual: {self.current_input}")
+                logger.debug("Entrada actual: %s", self.current_input)
                 
                 # Si tenemos 2 dígitos, procesar como coordenada
                 if len(self.current_input) == 2:
@@ -630,17 +679,17 @@ class MemoriaEspacialPuzzle(Puzzle):
                                 if (x, y) != expected_pos:
                                     # Incorrecto, reiniciar
                                     self.player_positions = []
-                                    print(f"Incorrecto. La posición correcta era ({expected_pos[0]+1}, {expected_pos[1]+1})")
+                                    logger.info("Incorrecto. La posición correcta era (%d, %d)", expected_pos[0] + 1, expected_pos[1] + 1)
                                     return False
                             
                             # Si todas las posiciones han sido ingresadas correctamente
                             if len(self.player_positions) == len(self.positions):
-                                print("¡CORRECTO! Has completado la secuencia")
+                                logger.info("¡CORRECTO! Has completado la secuencia")
                                 self.complete_puzzle()
                                 return True
                             return True
                         else:
-                            print("Coordenadas fuera de rango. Usa 1-4")
+                            logger.info("Coordenadas fuera de rango. Usa 1-4")
                             self.current_input = ""
                             return False
                     except ValueError:
@@ -651,7 +700,7 @@ class MemoriaEspacialPuzzle(Puzzle):
                 # Borrar último dígito
                 if hasattr(self, 'current_input') and self.current_input:
                     self.current_input = self.current_input[:-1]
-                    print(f"Entrada actual: {self.current_input}")
+                    logger.debug("Entrada actual: %s", self.current_input)
                 return True
         
         return False
@@ -789,14 +838,6 @@ class MemoriaEspacialPuzzle(Puzzle):
                     cell_x, cell_y, cell_size // 3,
                     self.config.COLORS['accent']
                 )
-                
-                # Avanzar al siguiente símbolo
-                if time.time() - self.last_position_time >= self.position_delay:
-                    self.current_position_index += 1
-                    self.last_position_time = time.time()
-                    
-                    if self.current_position_index >= len(self.positions):
-                        self.showing_positions = False
         else:
             # Mostrar posiciones del jugador
             for i, (x, y) in enumerate(self.player_positions):
@@ -843,60 +884,28 @@ class MemoriaEspacialPuzzle(Puzzle):
 class PatronSecuenciaPuzzle(Puzzle):
     """Puzzle de patrones y secuencias lógicas"""
     
+    KEY_BINDINGS = {**digit_bindings(0, 9), "BACKSPACE": "BACKSPACE", "ENTER": "ENTER"}
+    
     def __init__(self, difficulty: float = 1.0, config: Config = None):
         super().__init__(difficulty, config)
         self.sequence: List[int] = []
         self.player_answer: Optional[int] = None
         self.pattern_type = ""
+        self.family_params: Tuple[int, ...] = ()
+        self.next_term = 0
         
     def setup_puzzle(self):
         """Configurar el puzzle de patrones"""
-        # Generar diferentes tipos de patrones
-        pattern_types = ["arithmetic", "geometric", "fibonacci", "prime"]
-        self.pattern_type = random.choice(pattern_types)
-        
-        if self.pattern_type == "arithmetic":
-            self._generate_arithmetic_sequence()
-        elif self.pattern_type == "geometric":
-            self._generate_geometric_sequence()
-        elif self.pattern_type == "fibonacci":
-            self._generate_fibonacci_sequence()
-        elif self.pattern_type == "prime":
-            self._generate_prime_sequence()
+        # La familia se elige según la dificultad y el siguiente término queda calculado
+        generated = generate_sequence(self.difficulty)
+        self.pattern_type = generated.family
+        self.family_params = generated.params
+        self.sequence = list(generated.terms)
+        self.next_term = generated.next_term
         
         self.total_steps = 1
         self.player_answer = None
     
-    def _generate_arithmetic_sequence(self):
-        """Generar secuencia aritmética"""
-        start = random.randint(1, 10)
-        step = random.randint(2, 5)
-        length = int(4 + self.difficulty)
-        
-        self.sequence = [start + i * step for i in range(length)]
-    
-    def _generate_geometric_sequence(self):
-        """Generar secuencia geométrica"""
-        start = random.randint(2, 5)
-        ratio = random.randint(2, 3)
-        length = int(4 + self.difficulty)
-        
-        self.sequence = [start * (ratio ** i) for i in range(length)]
-    
-    def _generate_fibonacci_sequence(self):
-        """Generar secuencia de Fibonacci"""
-        length = int(5 + self.difficulty)
-        self.sequence = [1, 1]
-        
-        for i in range(2, length):
-            self.sequence.append(self.sequence[i-1] + self.sequence[i-2])
-    
-    def _generate_prime_sequence(self):
-        """Generar secuencia de números primos"""
-        primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
-        length = int(4 + self.difficulty)
-        self.sequence = primes[:length]
-    
     def handle_input(self, input_data: str) -> bool:
         """Manejar entrada del jugador"""
         if self.completed:
@@ -913,7 +922,7 @@ class PatronSecuenciaPuzzle(Puzzle):
             return True
         elif input_data == "ENTER":
             if not hasattr(self, 'player_input_str') or not self.player_input_str:
-                print("¡Ingresa un número antes de presionar ENTER!")
+                logger.info("¡Ingresa un número antes de presionar ENTER!")
                 return False
 
             try:
@@ -922,15 +931,15 @@ class PatronSecuenciaPuzzle(Puzzle):
                 correct_answer = self._calculate_next_number()
 
                 if player_answer == correct_answer:
-                    print(f"¡CORRECTO! La respuesta era {correct_answer}")
+                    logger.info("¡CORRECTO! La respuesta era %d", correct_answer)
                     self.complete_puzzle()
                     return True
                 else:
-                    print(f"Incorrecto. La respuesta correcta era {correct_answer}")
+                    logger.info("Incorrecto. La respuesta correcta era %d", correct_answer)
                     self.player_input_str = ""
                     return False
             except ValueError:
-                print("Entrada inválida. Solo números.")
+                logger.info("Entrada inválida. Solo números.")
                 self.player_input_str = ""
                 return False
         
@@ -939,36 +948,11 @@ class PatronSecuenciaPuzzle(Puzzle):
     def _show_error_message(self, message: str):
         """Mostrar mensaje de error temporalmente"""
         # Por ahora solo imprimir, podríamos implementar un sistema de mensajes en pantalla
-        print(f"Error: {message}")
+        logger.info("Error: %s", message)
     
     def _calculate_next_number(self) -> int:
         """Calcular el siguiente número en la secuencia"""
-        if self.pattern_type == "arithmetic":
-            step = self.sequence[1] - self.sequence[0]
-            return self.sequence[-1] + step
-        elif self.pattern_type == "geometric":
-            ratio = self.sequence[1] // self.sequence[0]
-            return self.sequence[-1] * ratio
-        elif self.pattern_type == "fibonacci":
-            return self.sequence[-1] + self.sequence[-2]
-        elif self.pattern_type == "prime":
-            # Encontrar el siguiente primo
-            last_prime = self.sequence[-1]
-            candidate = last_prime + 1
-            while not self._is_prime(candidate):
-                candidate += 1
-            return candidate
-        
-        return 0
-    
-    def _is_prime(self, n: int) -> bool:
-        """Verificar si un número es primo"""
-        if n < 2:
-            return False
-        for i in range(2, int(n ** 0.5) + 1):
-            if n % i == 0:
-                return False
-        return True
+        return self.next_term
     
     def draw_puzzle(self, screen_width: int, screen_height: int):
         """Dibujar el puzzle de patrones con diseño de ruinas"""
@@ -1073,15 +1057,4 @@ class PatronSecuenciaPuzzle(Puzzle):
         
         self.hints_used += 1
         
-        if self.pattern_type == "arithmetic":
-            step = self.sequence[1] - self.sequence[0]
-            return f"Suma {step} al último número"
-        elif self.pattern_type == "geometric":
-            ratio = self.sequence[1] // self.sequence[0]
-            return f"Multiplica el último número por {ratio}"
-        elif self.pattern_type == "fibonacci":
-            return "Suma los dos últimos números"
-        elif self.pattern_type == "prime":
-            return "Busca el siguiente número primo"
-        
-        return "Observa la relación entre los números"
+        return FAMILIES[self.pattern_type].hint(self.family_params)
@@ -0,0 +1,141 @@
+"""
+Registro de tipos de puzzle con carga diferida
+"""
+
+import ast
+import importlib
+import os
+import threading
+from typing import Any, Dict, List, Optional, Type
+from utils.config import Config
+from utils.logger import get_logger
+
+logger = get_logger("puzzles")
+
+# Nombre de la declaración que cada módulo de puzzles expone: {tipo: nombre de clase}
+PLUGIN_DECLARATION = "PUZZLE_PLUGINS"
+
+class PuzzlePlugin:
+    """Tipo de puzzle registrado; su módulo se importa al primer uso"""
+
+    def __init__(self, puzzle_type: str, module_name: str, class_name: str):
+        self.puzzle_type = puzzle_type
+        self.module_name = module_name
+        self.class_name = class_name
+        self._puzzle_class = None
+        self._key_map: Optional[Dict[int, str]] = None
+
+    @property
+    def loaded(self) -> bool:
+        """Si el módulo ya se ha importado"""
+        return self._puzzle_class is not None
+
+    @property
+    def puzzle_class(self) -> Type:
+        """Clase del puzzle (importa el módulo la primera vez)"""
+        if self._puzzle_class is None:
+            module = importlib.import_module(self.module_name)
+            self._puzzle_class = getattr(module, self.class_name)
+        return self._puzzle_class
+
+    @property
+    def key_map(self) -> Dict[int, str]:
+        """Teclas de arcade -> entrada del puzzle, según KEY_BINDINGS de la clase"""
+        if self._key_map is None:
+            import arcade
+
+            self._key_map = {
+                getattr(arcade.key, key_name): input_data
+                for key_name, input_data in self.puzzle_class.KEY_BINDINGS.items()
+            }
+        return self._key_map
+
+    def decode(self, key: int) -> Optional[str]:
+        """Traducir una tecla a la entrada que entiende el puzzle"""
+        return self.key_map.get(key)
+
+    def create(self, difficulty: float, config: Config) -> Any:
+        """Instanciar un puzzle de este tipo"""
+        return self.puzzle_class(difficulty, config)
+
+    def draw(self, puzzle: Any, screen_width: int, screen_height: int):
+        """Dibujar un puzzle de este tipo"""
+        puzzle.draw_puzzle(screen_width, screen_height)
+
+class PuzzleRegistry:
+    """Descubre los tipos de puzzle en src/puzzles sin importar sus módulos"""
+
+    def __init__(self, package: str = "puzzles", directory: Optional[str] = None):
+        self.package = package
+        self.directory = directory or os.path.dirname(os.path.abspath(__file__))
+        self.plugins: Dict[str, PuzzlePlugin] = {}
+        self._by_class: Dict[str, PuzzlePlugin] = {}
+        self._discovered = False
+        self._lock = threading.Lock()
+
+    def discover(self):
+        """Leer las declaraciones PUZZLE_PLUGINS de cada módulo del paquete"""
+        with self._lock:
+            if self._discovered:
+                return
+            for filename in sorted(os.listdir(self.directory)):
+                if not filename.endswith(".py") or filename.startswith("_"):
+                    continue
+                path = os.path.join(self.directory, filename)
+                for puzzle_type, class_name in self._read_declaration(path).items():
+                    self.register(puzzle_type, f"{self.package}.{filename[:-3]}", class_name)
+            self._discovered = True
+
+    def _read_declaration(self, path: str) -> Dict[str, str]:
+        """Extraer PUZZLE_PLUGINS del código fuente sin ejecutarlo"""
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        if PLUGIN_DECLARATION not in source:
+            return {}
+
+        try:
+            tree = ast.parse(source, filename=path)
+            for node in tree.body:
+                if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                        and isinstance(node.targets[0], ast.Name)
+                        and node.targets[0].id == PLUGIN_DECLARATION):
+                    return dict(ast.literal_eval(node.value))
+        except (SyntaxError, ValueError) as e:
+            logger.error("Error leyendo los puzzles de %s: %s", path, e)
+        return {}
+
+    def register(self, puzzle_type: str, module_name: str, class_name: str) -> PuzzlePlugin:
+        """Registrar un tipo de puzzle"""
+        plugin = PuzzlePlugin(puzzle_type, module_name, class_name)
+        self.plugins[puzzle_type] = plugin
+        self._by_class[class_name] = plugin
+        return plugin
+
+    def get(self, puzzle_type: str) -> Optional[PuzzlePlugin]:
+        """Plugin de un tipo de puzzle"""
+        self.discover()
+        return self.plugins.get(puzzle_type)
+
+    def for_puzzle(self, puzzle: Any) -> Optional[PuzzlePlugin]:
+        """Plugin de un puzzle ya creado"""
+        return self.for_class_name(type(puzzle).__name__)
+
+    def for_class_name(self, class_name: str) -> Optional[PuzzlePlugin]:
+        """Plugin por nombre de clase (como los guardados en las estadísticas)"""
+        self.discover()
+        return self._by_class.get(class_name)
+
+    def types(self) -> List[str]:
+        """Tipos de puzzle disponibles"""
+        self.discover()
+        return list(self.plugins)
+
+# Instancia global del registro
+_puzzle_registry: Optional[PuzzleRegistry] = None
+
+def get_puzzle_registry() -> PuzzleRegistry:
+    """Obtener el registro de puzzles compartido"""
+    global _puzzle_registry
+    if _puzzle_registry is None:
+        _puzzle_registry = PuzzleRegistry()
+    return _puzzle_registry
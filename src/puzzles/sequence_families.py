@@ -0,0 +1,387 @@
+"""
+Familias de secuencias numéricas para los puzzles de patrones
+"""
+
+import math
+import random
+import numpy as np
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
+
+class PrimeSieve:
+    """Criba segmentada que crece bajo demanda y se comparte entre puzzles"""
+
+    # Más allá de este límite no se criba: se prueba por división
+    MAX_LIMIT = 1 << 22
+
+    def __init__(self, initial_limit: int = 1024):
+        # Primer tramo con la criba de Eratóstenes clásica
+        is_prime = np.ones(max(initial_limit, 4), dtype=bool)
+        is_prime[:2] = False
+        for p in range(2, int(len(is_prime) ** 0.5) + 1):
+            if is_prime[p]:
+                is_prime[p * p::p] = False
+        self.primes = np.flatnonzero(is_prime).astype(np.int64)
+        self.limit = len(is_prime)
+
+    def ensure_limit(self, limit: int):
+        """Cribar hasta al menos `limit` (exclusivo) por segmentos"""
+        while self.limit < limit:
+            low = self.limit
+            # Cada tramo llega como mucho a low², así sus primos base (hasta sqrt(high)) ya están cribados
+            high = min(max(limit, low * 2), low * low)
+            segment = np.ones(high - low, dtype=bool)
+
+            base = self.primes[self.primes * self.primes < high]
+            for p in base.tolist():
+                start = max(p * p, -(-low // p) * p)
+                segment[start - low::p] = False
+
+            self.primes = np.concatenate((self.primes, np.flatnonzero(segment) + low))
+            self.limit = high
+
+    def ensure_count(self, count: int):
+        """Asegurar que se conocen al menos `count` primos"""
+        while len(self.primes) < count:
+            self.ensure_limit(self.limit * 2)
+
+    def first(self, count: int, offset: int = 0) -> np.ndarray:
+        """Primos consecutivos empezando en el índice `offset`"""
+        self.ensure_count(offset + count)
+        return self.primes[offset:offset + count]
+
+    def is_prime(self, n: int) -> bool:
+        """Verificar si un número es primo"""
+        if n < 2:
+            return False
+        if n >= self.limit and n < self.MAX_LIMIT:
+            self.ensure_limit(n + 1)
+        if n < self.limit:
+            index = np.searchsorted(self.primes, n)
+            return index < len(self.primes) and self.primes[index] == n
+
+        # Números enormes: división por los primos cribados hasta su raíz
+        self.ensure_limit(int(n ** 0.5) + 2)
+        divisors = self.primes[self.primes * self.primes <= n]
+        return not np.any(n % divisors == 0)
+
+    def next_prime(self, n: int) -> int:
+        """Primo siguiente a n"""
+        if n + 1 < self.MAX_LIMIT:
+            while self.primes[-1] <= n:
+                self.ensure_limit(self.limit * 2)
+            return int(self.primes[np.searchsorted(self.primes, n, side='right')])
+
+        candidate = n + 1
+        while not self.is_prime(candidate):
+            candidate += 1
+        return candidate
+
+# Criba compartida por todos los puzzles
+PRIME_SIEVE = PrimeSieve()
+
+class SequenceFamily(ABC):
+    """Familia de secuencias con parámetros enteros"""
+
+    name = ""
+    base_difficulty = 1.0
+    min_difficulty = 0.0  # Dificultad a partir de la cual puede aparecer
+    extra_length = 0
+
+    def length_for(self, difficulty: float) -> int:
+        """Número de términos visibles"""
+        return int(4 + self.extra_length + difficulty)
+
+    @abstractmethod
+    def sample_params(self, rng: np.random.Generator, difficulty: float, count: int) -> np.ndarray:
+        """Parámetros aleatorios (una fila por secuencia)"""
+        pass
+
+    @abstractmethod
+    def batch(self, params: np.ndarray, count: int) -> np.ndarray:
+        """Generar varias secuencias a la vez (una fila por secuencia)"""
+        pass
+
+    @abstractmethod
+    def fit(self, sequence: Sequence[int]) -> Optional[int]:
+        """Siguiente término si la secuencia pertenece a la familia"""
+        pass
+
+    def hint(self, params: Tuple[int, ...]) -> str:
+        """Pista para el jugador"""
+        return "Observa la relación entre los números"
+
+def _constant_step(values: Sequence[int]) -> Optional[int]:
+    """Diferencia común de una progresión aritmética"""
+    diffs = {b - a for a, b in zip(values, values[1:])}
+    return diffs.pop() if len(diffs) == 1 else None
+
+class Arithmetic(SequenceFamily):
+    """a, a+d, a+2d, ..."""
+
+    name = "arithmetic"
+    base_difficulty = 0.5
+
+    def sample_params(self, rng, difficulty, count):
+        start = rng.integers(1, 11, count)
+        step = rng.integers(2, 6 + int(difficulty), count)
+        return np.stack((start, step), axis=1)
+
+    def batch(self, params, count):
+        return params[:, :1] + params[:, 1:2] * np.arange(count)
+
+    def fit(self, sequence):
+        step = _constant_step(sequence)
+        return sequence[-1] + step if step else None
+
+    def hint(self, params):
+        return f"Suma {params[1]} al último número"
+
+class Geometric(SequenceFamily):
+    """a, a*r, a*r², ..."""
+
+    name = "geometric"
+    base_difficulty = 1.0
+
+    def sample_params(self, rng, difficulty, count):
+        start = rng.integers(2, 6, count)
+        ratio = rng.integers(2, 4 + int(difficulty >= 2.0), count)
+        return np.stack((start, ratio), axis=1)
+
+    def batch(self, params, count):
+        return params[:, :1] * params[:, 1:2] ** np.arange(count)
+
+    def fit(self, sequence):
+        if not all(a != 0 and b % a == 0 for a, b in zip(sequence, sequence[1:])):
+            return None
+        ratios = {b // a for a, b in zip(sequence, sequence[1:])}
+        if len(ratios) != 1 or ratios == {1}:
+            return None
+        return sequence[-1] * ratios.pop()
+
+    def hint(self, params):
+        return f"Multiplica el último número por {params[1]}"
+
+class Fibonacci(SequenceFamily):
+    """Cada término es la suma de los dos anteriores"""
+
+    name = "fibonacci"
+    base_difficulty = 1.2
+    extra_length = 1
+
+    def sample_params(self, rng, difficulty, count):
+        first = rng.integers(1, 2 + int(difficulty), count)
+        second = first + rng.integers(0, 1 + int(difficulty), count)
+        return np.stack((first, second), axis=1)
+
+    def batch(self, params, count):
+        terms = np.empty((len(params), count), dtype=np.int64)
+        terms[:, :2] = params[:, :2][:, :count]
+        for i in range(2, count):
+            terms[:, i] = terms[:, i - 1] + terms[:, i - 2]
+        return terms
+
+    def fit(self, sequence):
+        if len(sequence) < 3:
+            return None
+        if all(c == a + b for a, b, c in zip(sequence, sequence[1:], sequence[2:])):
+            return sequence[-1] + sequence[-2]
+        return None
+
+    def hint(self, params):
+        return "Suma los dos últimos números"
+
+class Primes(SequenceFamily):
+    """Números primos consecutivos"""
+
+    name = "prime"
+    base_difficulty = 1.5
+
+    def sample_params(self, rng, difficulty, count):
+        return rng.integers(0, 1 + int(difficulty * 3), count)[:, None]
+
+    def batch(self, params, count):
+        primes = PRIME_SIEVE.first(int(params[:, 0].max()) + count)
+        return primes[params[:, :1] + np.arange(count)]
+
+    def fit(self, sequence):
+        if not all(PRIME_SIEVE.is_prime(n) for n in sequence):
+            return None
+        if any(PRIME_SIEVE.next_prime(a) != b for a, b in zip(sequence, sequence[1:])):
+            return None
+        return PRIME_SIEVE.next_prime(sequence[-1])
+
+    def hint(self, params):
+        return "Busca el siguiente número primo"
+
+def _consecutive_roots(sequence: Sequence[int], root) -> Optional[int]:
+    """Última raíz si los términos son f(n), f(n+1), ... para enteros consecutivos"""
+    roots = [root(n) for n in sequence]
+    if None in roots or any(b != a + 1 for a, b in zip(roots, roots[1:])):
+        return None
+    return roots[-1]
+
+def _square_root(n: int) -> Optional[int]:
+    """Raíz entera si n es un cuadrado perfecto"""
+    if n < 0:
+        return None
+    r = int(round(math.sqrt(n)))
+    return r if r * r == n else None
+
+def _triangular_root(n: int) -> Optional[int]:
+    """k tal que k(k+1)/2 = n, si existe"""
+    if n < 0:
+        return None
+    k = int(round((math.sqrt(8 * n + 1) - 1) / 2))
+    return k if k * (k + 1) // 2 == n else None
+
+class Squares(SequenceFamily):
+    """Cuadrados perfectos consecutivos"""
+
+    name = "square"
+    base_difficulty = 0.8
+
+    def sample_params(self, rng, difficulty, count):
+        return rng.integers(1, 2 + int(difficulty * 3), count)[:, None]
+
+    def batch(self, params, count):
+        return (params[:, :1] + np.arange(count)) ** 2
+
+    def fit(self, sequence):
+        root = _consecutive_roots(sequence, _square_root)
+        return (root + 1) ** 2 if root is not None else None
+
+    def hint(self, params):
+        return "Son cuadrados perfectos consecutivos"
+
+class Triangular(SequenceFamily):
+    """Números triangulares consecutivos"""
+
+    name = "triangular"
+    base_difficulty = 1.0
+    min_difficulty = 1.0
+
+    def sample_params(self, rng, difficulty, count):
+        return rng.integers(1, 2 + int(difficulty * 3), count)[:, None]
+
+    def batch(self, params, count):
+        n = params[:, :1] + np.arange(count)
+        return n * (n + 1) // 2
+
+    def fit(self, sequence):
+        root = _consecutive_roots(sequence, _triangular_root)
+        return (root + 1) * (root + 2) // 2 if root is not None else None
+
+    def hint(self, params):
+        return "La diferencia entre términos crece de uno en uno"
+
+class Interleaved(SequenceFamily):
+    """Dos progresiones aritméticas alternadas"""
+
+    name = "interleaved"
+    base_difficulty = 1.6
+    min_difficulty = 2.0
+
+    def length_for(self, difficulty):
+        # Cada progresión necesita al menos tres términos para ser reconocible
+        return max(6, super().length_for(difficulty))
+
+    def sample_params(self, rng, difficulty, count):
+        start_a = rng.integers(1, 11, count)
+        start_b = rng.integers(1, 11, count)
+        step_a = rng.integers(1, 7, count)
+        step_b = (step_a + rng.integers(1, 5, count)) % 6 + 1  # Distinto de step_a
+        return np.stack((start_a, step_a, start_b, step_b), axis=1)
+
+    def batch(self, params, count):
+        index = np.arange(count)
+        half = index // 2
+        odd = index % 2 == 1
+        first = params[:, :1] + params[:, 1:2] * half
+        second = params[:, 2:3] + params[:, 3:4] * half
+        return np.where(odd, second, first)
+
+    def fit(self, sequence):
+        if len(sequence) < 6:
+            return None
+        evens, odds = sequence[0::2], sequence[1::2]
+        step_even, step_odd = _constant_step(evens), _constant_step(odds)
+        if step_even is None or step_odd is None:
+            return None
+        return evens[-1] + step_even if len(sequence) % 2 == 0 else odds[-1] + step_odd
+
+    def hint(self, params):
+        return "Hay dos secuencias intercaladas"
+
+FAMILIES: Dict[str, SequenceFamily] = {
+    family.name: family for family in (
+        Arithmetic(), Geometric(), Fibonacci(), Primes(), Squares(), Triangular(), Interleaved()
+    )
+}
+
+class GeneratedSequence(NamedTuple):
+    """Secuencia generada con su siguiente término ya calculado"""
+    family: str
+    params: Tuple[int, ...]
+    terms: Tuple[int, ...]
+    next_term: int
+
+@lru_cache(maxsize=1024)
+def sequence_terms(family_name: str, params: Tuple[int, ...], count: int) -> Tuple[int, ...]:
+    """Términos de una secuencia (memorizado por familia y parámetros)"""
+    family = FAMILIES[family_name]
+    row = family.batch(np.array([params], dtype=np.int64), count)[0]
+    return tuple(int(n) for n in row)
+
+def estimate_difficulty(family_name: str, next_term: int) -> float:
+    """Dificultad estimada según la familia y el tamaño de la respuesta"""
+    return FAMILIES[family_name].base_difficulty + math.log10(max(1, abs(next_term))) * 0.3
+
+def generate_batch(family_name: str, difficulty: float, count: int,
+                   rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Generar muchas secuencias candidatas a la vez (incluye el siguiente término)"""
+    family = FAMILIES[family_name]
+    rng = rng or np.random.default_rng()
+    params = family.sample_params(rng, difficulty, count).astype(np.int64)
+    return params, family.batch(params, family.length_for(difficulty) + 1)
+
+@lru_cache(maxsize=64)
+def calibrate(difficulty: float, samples: int = 256) -> Dict[str, float]:
+    """Dificultad media estimada de cada familia disponible"""
+    rng = np.random.default_rng(int(difficulty * 10))
+    calibration = {}
+    for name, family in FAMILIES.items():
+        if family.min_difficulty > difficulty:
+            continue
+        _, terms = generate_batch(name, difficulty, samples, rng)
+        magnitude = np.log10(np.maximum(1, np.abs(terms[:, -1]))).mean()
+        calibration[name] = family.base_difficulty + float(magnitude) * 0.3
+    return calibration
+
+def choose_family(difficulty: float, rng=random) -> str:
+    """Elegir una familia, favoreciendo las de dificultad cercana a la pedida"""
+    calibration = calibrate(round(difficulty, 1))
+    names = list(calibration)
+    weights = [1.0 / (1.0 + abs(calibration[name] - difficulty)) for name in names]
+    return rng.choices(names, weights=weights)[0]
+
+def generate_sequence(difficulty: float, family_name: Optional[str] = None, rng=random) -> GeneratedSequence:
+    """Generar una secuencia para un puzzle"""
+    family_name = family_name or choose_family(difficulty, rng)
+    family = FAMILIES[family_name]
+    np_rng = np.random.default_rng(rng.getrandbits(32))
+    params = tuple(int(v) for v in family.sample_params(np_rng, difficulty, 1)[0])
+
+    terms = sequence_terms(family_name, params, family.length_for(difficulty) + 1)
+    return GeneratedSequence(family_name, params, terms[:-1], terms[-1])
+
+def fit_families(sequence: Sequence[int]) -> Dict[str, int]:
+    """Familias que explican una secuencia y el siguiente término que predicen"""
+    sequence = [int(n) for n in sequence]
+    fits = {}
+    for name, family in FAMILIES.items():
+        next_term = family.fit(sequence)
+        if next_term is not None:
+            fits[name] = next_term
+    return fits
@@ -0,0 +1,115 @@
+"""
+Resolutores y verificadores de puzzles
+"""
+
+import math
+import numpy as np
+from typing import Any, Callable, Dict, NamedTuple, Optional
+from puzzles.puzzle_base import Puzzle
+from puzzles.board_engine import EMPTY
+from puzzles.registry import get_puzzle_registry
+from puzzles.sequence_families import FAMILIES, estimate_difficulty, fit_families
+
+class Solution(NamedTuple):
+    """Resultado de resolver un puzzle"""
+    valid: bool
+    answer: Any = None
+    difficulty: float = 0.0  # Estimación en la misma escala que Puzzle.difficulty
+    reason: str = ""
+
+def _invalid(reason: str) -> Solution:
+    """Solución de un puzzle degenerado"""
+    return Solution(False, reason=reason)
+
+def solve_simon_dice(puzzle: Puzzle) -> Solution:
+    """La respuesta es la secuencia mostrada"""
+    sequence = list(puzzle.sequence)
+    if len(sequence) < 3:
+        return _invalid("secuencia demasiado corta")
+    if any(symbol not in puzzle.symbols for symbol in sequence):
+        return _invalid("símbolo desconocido en la secuencia")
+    if len(set(sequence)) == 1:
+        return _invalid("la secuencia repite un único símbolo")
+
+    # La longitud crece dos símbolos por punto de dificultad; repetir consecutivos la facilita
+    repeats = sum(1 for a, b in zip(sequence, sequence[1:]) if a == b)
+    estimate = (len(sequence) - 3) / 2 + (len(set(sequence)) - 1) * 0.05 - repeats * 0.1
+    return Solution(True, sequence, max(0.0, estimate))
+
+def solve_memoria_espacial(puzzle: Puzzle) -> Solution:
+    """La respuesta son las posiciones en orden"""
+    positions = [tuple(position) for position in puzzle.positions]
+    if len(positions) < 2:
+        return _invalid("muy pocas posiciones")
+    if any(not (0 <= x < puzzle.grid_size and 0 <= y < puzzle.grid_size) for x, y in positions):
+        return _invalid("posición fuera de la cuadrícula")
+    if len(set(positions)) != len(positions):
+        return _invalid("posiciones repetidas")
+
+    # Recorridos largos entre posiciones son más difíciles de recordar
+    path = sum(abs(x1 - x2) + abs(y1 - y2) for (x1, y1), (x2, y2) in zip(positions, positions[1:]))
+    estimate = (len(positions) - 2) + path / (len(positions) * puzzle.grid_size)
+    return Solution(True, positions, estimate)
+
+def solve_patron_secuencia(puzzle: Puzzle) -> Solution:
+    """Deducir el siguiente término sin mirar el generador"""
+    sequence = [int(n) for n in puzzle.sequence]
+    family = FAMILIES.get(puzzle.pattern_type)
+    if family is None:
+        return _invalid(f"patrón desconocido '{puzzle.pattern_type}'")
+    min_length = family.length_for(puzzle.difficulty)
+    if len(sequence) < min_length:
+        return _invalid(f"la secuencia tiene {len(sequence)} términos y se esperaban {min_length}")
+
+    fits = fit_families(sequence)
+    if puzzle.pattern_type not in fits:
+        return _invalid(f"la secuencia no sigue el patrón '{puzzle.pattern_type}'")
+    if len(set(fits.values())) > 1:
+        return _invalid("la secuencia admite varias respuestas")
+
+    answer = fits[puzzle.pattern_type]
+    return Solution(True, answer, estimate_difficulty(puzzle.pattern_type, answer))
+
+def solve_logica_simbolos(puzzle: Puzzle) -> Solution:
+    """Resolver el cuadrado latino solo con deducciones forzadas"""
+    clues = np.where(puzzle.given, puzzle.board, EMPTY).astype(np.int8)
+    solved = puzzle.engine.propagate(clues, puzzle.size)
+    if solved is None:
+        return _invalid("el tablero no tiene solución única por deducción")
+    if not np.array_equal(solved, puzzle.solution):
+        return _invalid("la solución deducida no coincide con la guardada")
+
+    blank_ratio = float((~puzzle.given).mean())
+    estimate = (puzzle.size - 3) + blank_ratio * 2
+    return Solution(True, solved, estimate)
+
+def solve_busqueda_patrones(puzzle: Puzzle) -> Solution:
+    """Buscar el patrón en todo el tablero"""
+    matches = puzzle.engine.find_matches(puzzle.board, puzzle.pattern)
+    if len(matches) != 1:
+        return _invalid(f"el patrón aparece {len(matches)} veces")
+    answer = tuple(int(v) for v in matches[0])
+    if answer != tuple(puzzle.answer):
+        return _invalid("la respuesta guardada no es la coincidencia")
+
+    # Más posiciones candidatas y más símbolos hacen la búsqueda más lenta
+    rows, cols = puzzle.board.shape
+    pattern_rows, pattern_cols = puzzle.pattern.shape
+    positions = (rows - pattern_rows + 1) * (cols - pattern_cols + 1)
+    estimate = math.log2(positions) / 3 + (pattern_rows * pattern_cols - 4) * 0.1 + (puzzle.num_symbols - 3) * 0.5
+    return Solution(True, answer, estimate)
+
+# Resolutor de cada tipo de puzzle del registro
+SOLVERS: Dict[str, Callable[[Puzzle], Solution]] = {
+    "simon_dice": solve_simon_dice,
+    "memoria_espacial": solve_memoria_espacial,
+    "patron_secuencia": solve_patron_secuencia,
+    "logica_simbolos": solve_logica_simbolos,
+    "busqueda_patrones": solve_busqueda_patrones
+}
+
+def solve(puzzle: Puzzle) -> Optional[Solution]:
+    """Resolver un puzzle ya configurado (None si no hay resolutor)"""
+    plugin = get_puzzle_registry().for_puzzle(puzzle)
+    solver = SOLVERS.get(plugin.puzzle_type) if plugin else None
+    return solver(puzzle) if solver else None
@@ -2,14 +2,54 @@
 Configuración del juego El Códice Mnemónico
 """
 
+import json
+import os
+import threading
+import time
+import weakref
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from utils.logger import get_logger
+
+logger = get_logger("config")
+
 class Config:
-    """Clase de configuración"""
+    """Valores por defecto de la configuración"""
     
     # Configuración de pantalla
     SCREEN_WIDTH = 1200
     SCREEN_HEIGHT = 800
     SCREEN_TITLE = "El Códice Mnemónico"
     
+    # Rutas de datos
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    GAME_DATA_PATH = os.path.join(BASE_DIR, "data", "game_data.json")
+    USER_CONFIG_PATH = os.path.join(BASE_DIR, "data", "user_config.json")
+    REPLAY_DIR = os.path.join(BASE_DIR, "data", "replays")
+    LOG_DIR = os.path.join(BASE_DIR, "logs")
+    
+    # Configuración de ventana y sonido
+    FULLSCREEN = False
+    VSYNC = True
+    RENDER_SCALE = 1.0  # resolución interna respecto a la lógica (menos de 1 en GPUs modestas)
+    MUSIC_VOLUME = 0.3
+    SOUND_VOLUME = 0.4
+    
+    # Configuración de depuración
+    SHOW_FPS = False
+    SHOW_DEBUG_INFO = False
+    LOG_LEVEL = "INFO"
+    LOG_CONSOLE_LEVEL = "WARNING"  # la consola solo recibe avisos; el detalle va a logs/
+    LOG_SUBSYSTEM_LEVELS = ""  # por ejemplo "puzzles=DEBUG,audio=WARNING"
+    LOG_RATE_LIMIT = 5  # mensajes iguales permitidos por ventana
+    LOG_RATE_WINDOW = 10.0  # segundos
+    LOG_MAX_BYTES = 1_000_000
+    LOG_BACKUPS = 3
+    
+    # Grabación de la entrada para repetir sesiones
+    RECORD_INPUT = True
+    REPLAY_KEEP = 10  # grabaciones que se conservan en REPLAY_DIR
+    
     # Configuración de colores - Tema de Ruinas Antiguas
     COLORS = {
         'background': (20, 25, 35),  # Azul oscuro profundo como piedra antigua
@@ -31,10 +71,18 @@ class Config:
     FONT_SIZE_LARGE = 24
     FONT_SIZE_MEDIUM = 18
     FONT_SIZE_SMALL = 14
+    STORY_REVEAL_SPEED = 45  # caracteres por segundo al revelar la historia
+    
+    # Bucle de simulación
+    TICK_RATE = 60  # pasos de lógica por segundo, independientes de los fotogramas
+    MAX_TICKS_PER_FRAME = 5  # pasos máximos para recuperarse de un fotograma lento
+    IDLE_FRAME_RATE = 10  # fotogramas por segundo en pantallas estáticas sin actividad
+    IDLE_DELAY = 0.5  # segundos sin cambios antes de bajar al ritmo de reposo
     
     # Configuración de puzzles
     PUZZLE_TIMEOUT = 30  # segundos
     PUZZLE_DIFFICULTY_INCREMENT = 0.1
+    PUZZLE_GENERATION_ATTEMPTS = 5  # reintentos si el verificador rechaza el puzzle
     
     # Configuración de habilidades cognitivas
     PALACIO_MENTAL_CAPACITY = 3
@@ -46,3 +94,263 @@ class Config:
     MAP_NODES_MAX = 15
     MAP_CONNECTIONS_MIN = 2
     MAP_CONNECTIONS_MAX = 4
+    
+    # Configuración de cámara del mapa
+    CAMERA_MIN_ZOOM = 0.4
+    CAMERA_MAX_ZOOM = 2.0
+    CAMERA_ZOOM_STEP = 1.2
+    CAMERA_PAN_STEP = 120  # píxeles de pantalla por pulsación
+    CAMERA_FOLLOW_SPEED = 6.0
+    CAMERA_LOD_ZOOM = 0.75  # por debajo se dibuja sin resplandor, sombra ni etiquetas
+    CAMERA_CULL_MARGIN = 80  # margen para etiquetas y resplandores
+    SPATIAL_CELL_SIZE = 200
+    
+    # Configuración de partículas
+    PARTICLE_CAPACITY = 4096  # partículas de efectos vivas a la vez
+    TORCH_PARTICLE_RATE = 40  # partículas por segundo y antorcha
+
+# Claves de data/user_config.json y la constante que sobrescriben
+USER_CONFIG_KEYS = {
+    "game_settings": {
+        "screen_width": "SCREEN_WIDTH",
+        "screen_height": "SCREEN_HEIGHT",
+        "fullscreen": "FULLSCREEN",
+        "vsync": "VSYNC",
+        "render_scale": "RENDER_SCALE",
+        "sound_volume": "SOUND_VOLUME",
+        "music_volume": "MUSIC_VOLUME"
+    },
+    "debug_settings": {
+        "show_fps": "SHOW_FPS",
+        "show_debug_info": "SHOW_DEBUG_INFO",
+        "log_level": "LOG_LEVEL"
+    }
+}
+
+ENV_PREFIX = "CODICE_"
+
+def _default_values() -> Dict[str, Any]:
+    """Constantes definidas en la clase Config"""
+    return {name: value for name, value in vars(Config).items() if name.isupper()}
+
+def _coerce(name: str, value: Any, default: Any) -> Any:
+    """Convertir un valor al tipo de su valor por defecto"""
+    if isinstance(default, bool):
+        if isinstance(value, str):
+            lowered = value.strip().lower()
+            if lowered in ("1", "true", "si", "sí", "yes", "on"):
+                return True
+            if lowered in ("0", "false", "no", "off"):
+                return False
+            raise ValueError(f"{name}: se esperaba un booleano, no '{value}'")
+        return bool(value)
+    if isinstance(default, int):
+        return int(value)
+    if isinstance(default, float):
+        return float(value)
+    if isinstance(default, str):
+        return str(value)
+    if isinstance(value, str):
+        value = json.loads(value)
+    if isinstance(default, dict):
+        return {key: tuple(color) for key, color in value.items()}
+    return type(default)(value)
+
+def _freeze_value(value: Any) -> Any:
+    """Evitar que se modifiquen por referencia los valores compuestos"""
+    if isinstance(value, dict):
+        return MappingProxyType(dict(value))
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+class ConfigSnapshot(Config):
+    """Configuración efectiva compartida (solo lectura)"""
+    
+    def __init__(self, values: Dict[str, Any]):
+        # Los valores viven en el __dict__ de la instancia: leerlos es un acceso normal a atributo
+        self.__dict__.update(values)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            f"La configuración es de solo lectura; usa get_config_service().set('{name}', ...)"
+        )
+    
+    def __delattr__(self, name):
+        raise AttributeError("La configuración es de solo lectura")
+
+class ConfigService:
+    """Combina las capas de configuración y avisa de los cambios"""
+    
+    def __init__(self, user_path: Optional[str] = None, environ: Optional[Dict[str, str]] = None,
+                 poll_interval: float = 1.0):
+        self.defaults = _default_values()
+        self.user_path = user_path or Config.USER_CONFIG_PATH
+        self.environ = os.environ if environ is None else environ
+        self.poll_interval = poll_interval
+        
+        # Capas en orden de prioridad creciente
+        self.user_values: Dict[str, Any] = {}
+        self.env_values: Dict[str, Any] = {}
+        self.cli_values: Dict[str, Any] = {}
+        self.runtime_values: Dict[str, Any] = {}
+        
+        self._listeners: List[Any] = []
+        self._user_mtime_ns = None
+        self._last_poll = 0.0
+        
+        self.user_values = self._load_user_file()
+        self.env_values = self._load_env()
+        self.snapshot = ConfigSnapshot(self._resolve())
+    
+    def _convert(self, name: str, value: Any, source: str) -> Optional[Any]:
+        """Validar una sobrescritura; devuelve None si no es válida"""
+        if name not in self.defaults:
+            logger.warning("Configuración desconocida en %s: %s", source, name)
+            return None
+        try:
+            return _coerce(name, value, self.defaults[name])
+        except (TypeError, ValueError, AttributeError) as e:
+            logger.warning("Valor inválido para %s en %s: %s", name, source, e)
+            return None
+    
+    def _load_user_file(self) -> Dict[str, Any]:
+        """Leer data/user_config.json (escrito por install.py)"""
+        try:
+            self._user_mtime_ns = os.stat(self.user_path).st_mtime_ns
+            with open(self.user_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            self._user_mtime_ns = None
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Error al leer la configuración de usuario: %s", e)
+            return dict(self.user_values)
+        
+        values = {}
+        for section, keys in USER_CONFIG_KEYS.items():
+            for key, value in data.get(section, {}).items():
+                if key not in keys:
+                    continue
+                converted = self._convert(keys[key], value, self.user_path)
+                if converted is not None:
+                    values[keys[key]] = converted
+        return values
+    
+    def _load_env(self) -> Dict[str, Any]:
+        """Leer sobrescrituras CODICE_<NOMBRE> del entorno"""
+        values = {}
+        for name in self.defaults:
+            raw = self.environ.get(ENV_PREFIX + name)
+            if raw is not None:
+                converted = self._convert(name, raw, "el entorno")
+                if converted is not None:
+                    values[name] = converted
+        return values
+    
+    def _resolve(self) -> Dict[str, Any]:
+        """Combinar todas las capas"""
+        values = dict(self.defaults)
+        for layer in (self.user_values, self.env_values, self.cli_values, self.runtime_values):
+            values.update(layer)
+        return {name: _freeze_value(value) for name, value in values.items()}
+    
+    def _rebuild(self) -> Dict[str, Any]:
+        """Actualizar la instantánea en su sitio y avisar de lo que cambió"""
+        current = self.snapshot.__dict__
+        changed = {name: value for name, value in self._resolve().items()
+                   if current.get(name) != value}
+        if changed:
+            current.update(changed)
+            self._notify(changed)
+        return changed
+    
+    def apply_overrides(self, assignments: Iterable[str]):
+        """Aplicar sobrescrituras de línea de comandos (NOMBRE=valor)"""
+        for assignment in assignments:
+            name, sep, raw = assignment.partition("=")
+            name = name.strip().upper()
+            if not sep:
+                logger.warning("Sobrescritura inválida (se esperaba NOMBRE=valor): %s", assignment)
+                continue
+            converted = self._convert(name, raw, "la línea de comandos")
+            if converted is not None:
+                self.cli_values[name] = converted
+        return self._rebuild()
+    
+    def set(self, name: str, value: Any) -> bool:
+        """Cambiar un valor durante la partida"""
+        converted = self._convert(name, value, "tiempo de ejecución")
+        if converted is None:
+            return False
+        self.runtime_values[name] = converted
+        self._rebuild()
+        return True
+    
+    def reset(self, name: str):
+        """Quitar un cambio hecho durante la partida"""
+        if self.runtime_values.pop(name, None) is not None:
+            self._rebuild()
+    
+    def reload(self) -> Dict[str, Any]:
+        """Volver a leer el archivo de usuario y el entorno"""
+        self.user_values = self._load_user_file()
+        self.env_values = self._load_env()
+        return self._rebuild()
+    
+    def poll(self) -> bool:
+        """Recargar si cambió el archivo de usuario; devuelve True si hubo cambios"""
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_interval:
+            return False
+        self._last_poll = now
+        
+        try:
+            mtime_ns = os.stat(self.user_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns == self._user_mtime_ns:
+            return False
+        return bool(self.reload())
+    
+    def subscribe(self, callback: Callable[[Dict[str, Any]], None]):
+        """Registrar una función que recibe los valores cambiados"""
+        # Los métodos se guardan con referencia débil para no mantener vivas escenas viejas
+        if hasattr(callback, '__self__'):
+            self._listeners.append(weakref.WeakMethod(callback))
+        else:
+            self._listeners.append(lambda: callback)
+    
+    def unsubscribe(self, callback: Callable[[Dict[str, Any]], None]):
+        """Quitar una función registrada"""
+        self._listeners = [ref for ref in self._listeners if ref() not in (None, callback)]
+    
+    def _notify(self, changed: Dict[str, Any]):
+        """Avisar a los suscriptores"""
+        alive = []
+        for ref in self._listeners:
+            callback = ref()
+            if callback is None:
+                continue
+            alive.append(ref)
+            try:
+                callback(changed)
+            except Exception as e:
+                logger.exception("Error al aplicar cambios de configuración: %s", e)
+        self._listeners = alive
+
+_service: Optional[ConfigService] = None
+_service_lock = threading.Lock()
+
+def get_config_service() -> ConfigService:
+    """Obtener el servicio de configuración compartido"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = ConfigService()
+    return _service
+
+def get_config() -> ConfigSnapshot:
+    """Obtener la configuración efectiva compartida"""
+    return get_config_service().snapshot
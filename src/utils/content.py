@@ -0,0 +1,231 @@
+"""
+Carga de contenido del juego desde data/game_data.json
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+from utils.config import Config
+from utils.logger import get_logger
+
+logger = get_logger("content")
+
+# Cambiar al modificar el formato compilado
+CACHE_VERSION = 1
+
+REQUIRED_ABILITIES = ("palacio_mental", "vision_periferica", "enfoque")
+REQUIRED_ANOMALIES = ("el_olvido", "el_ruido", "la_repeticion")
+
+class DifficultyTier(NamedTuple):
+    """Nivel de dificultad definido en los datos"""
+    name: str
+    description: str
+    puzzle_count: int
+    anomaly_chance: float
+
+class GameContent(NamedTuple):
+    """Contenido del juego compilado e inmutable"""
+    story_fragments: Tuple[str, ...]
+    puzzle_descriptions: Mapping[str, str]
+    anomaly_descriptions: Mapping[str, str]
+    anomaly_probabilities: Mapping[str, float]
+    ability_descriptions: Mapping[str, str]
+    difficulty_levels: Mapping[int, DifficultyTier]
+
+def _require(condition: bool, message: str):
+    """Lanzar un error de validación si no se cumple la condición"""
+    if not condition:
+        raise ValueError(f"game_data.json inválido: {message}")
+
+def _text_mapping(data: Dict[str, Any], key: str, required: Tuple[str, ...] = ()) -> Dict[str, str]:
+    """Validar una sección de textos por clave"""
+    section = data.get(key)
+    _require(isinstance(section, dict), f"'{key}' debe ser un objeto")
+    for name, text in section.items():
+        _require(isinstance(text, str) and text, f"'{key}.{name}' debe ser un texto")
+    for name in required:
+        _require(name in section, f"falta '{key}.{name}'")
+    return section
+
+def compile_content(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validar el JSON y convertirlo al formato compilado (solo tipos básicos)"""
+    _require(isinstance(data, dict), "la raíz debe ser un objeto")
+
+    fragments = data.get("story_fragments")
+    _require(isinstance(fragments, list) and fragments, "'story_fragments' debe ser una lista no vacía")
+    for fragment in fragments:
+        _require(isinstance(fragment, str) and fragment, "cada fragmento debe ser un texto")
+
+    probabilities = data.get("anomaly_probabilities")
+    _require(isinstance(probabilities, dict), "'anomaly_probabilities' debe ser un objeto")
+    for name, probability in probabilities.items():
+        _require(name in REQUIRED_ANOMALIES, f"anomalía desconocida '{name}'")
+        _require(isinstance(probability, (int, float)) and 0 <= probability <= 1,
+                 f"'anomaly_probabilities.{name}' debe estar entre 0 y 1")
+    _require(sum(probabilities.values()) <= 1.0 + 1e-9, "las probabilidades de anomalías suman más de 1")
+
+    levels = data.get("difficulty_levels")
+    _require(isinstance(levels, dict) and levels, "'difficulty_levels' debe ser un objeto no vacío")
+    compiled_levels = {}
+    for level, tier in levels.items():
+        _require(level.isdigit(), f"nivel '{level}' debe ser numérico")
+        _require(isinstance(tier, dict), f"nivel '{level}' debe ser un objeto")
+        _require(isinstance(tier.get("name"), str), f"falta 'name' en el nivel {level}")
+        _require(isinstance(tier.get("puzzle_count"), int) and tier["puzzle_count"] > 0,
+                 f"'puzzle_count' del nivel {level} debe ser un entero positivo")
+        chance = tier.get("anomaly_chance")
+        _require(isinstance(chance, (int, float)) and 0 <= chance <= 1,
+                 f"'anomaly_chance' del nivel {level} debe estar entre 0 y 1")
+        compiled_levels[int(level)] = (
+            tier["name"], tier.get("description", ""), tier["puzzle_count"], float(chance)
+        )
+
+    return {
+        "story_fragments": tuple(fragments),
+        "puzzle_descriptions": _text_mapping(data, "puzzle_descriptions"),
+        "anomaly_descriptions": _text_mapping(data, "anomaly_descriptions", REQUIRED_ANOMALIES),
+        "anomaly_probabilities": {name: float(p) for name, p in probabilities.items()},
+        "ability_descriptions": _text_mapping(data, "ability_descriptions", REQUIRED_ABILITIES),
+        "difficulty_levels": compiled_levels,
+    }
+
+def _freeze(compiled: Dict[str, Any]) -> GameContent:
+    """Construir el contenido inmutable con cadenas internadas"""
+    intern = sys.intern
+
+    def text_map(section):
+        return MappingProxyType({intern(k): intern(v) for k, v in section.items()})
+
+    return GameContent(
+        story_fragments=tuple(intern(f) for f in compiled["story_fragments"]),
+        puzzle_descriptions=text_map(compiled["puzzle_descriptions"]),
+        anomaly_descriptions=text_map(compiled["anomaly_descriptions"]),
+        anomaly_probabilities=MappingProxyType(
+            {intern(k): v for k, v in compiled["anomaly_probabilities"].items()}
+        ),
+        ability_descriptions=text_map(compiled["ability_descriptions"]),
+        difficulty_levels=MappingProxyType({
+            level: DifficultyTier(intern(name), intern(description), count, chance)
+            for level, (name, description, count, chance) in compiled["difficulty_levels"].items()
+        }),
+    )
+
+class ContentLoader:
+    """Carga, cachea y recarga en caliente el contenido del juego"""
+
+    def __init__(self, path: str, cache_path: Optional[str] = None,
+                 poll_interval: float = 1.0):
+        self.path = path
+        self.cache_path = cache_path or os.path.join(
+            os.path.dirname(path), "." + os.path.splitext(os.path.basename(path))[0] + ".cache"
+        )
+        self.poll_interval = poll_interval
+        self.content: Optional[GameContent] = None
+        self._mtime_ns = None
+        self._last_poll = 0.0
+        self._lock = threading.Lock()
+
+    def load(self) -> GameContent:
+        """Cargar el contenido (desde la caché si sigue siendo válida)"""
+        with self._lock:
+            stat = os.stat(self.path)
+            compiled = self._read_cache(stat)
+            if compiled is None:
+                with open(self.path, 'rb') as f:
+                    raw = f.read()
+                compiled = compile_content(json.loads(raw.decode('utf-8')))
+                self._write_cache(stat, hashlib.sha256(raw).hexdigest(), compiled)
+
+            self.content = _freeze(compiled)
+            self._mtime_ns = stat.st_mtime_ns
+            return self.content
+
+    def get(self) -> GameContent:
+        """Obtener el contenido actual (cargándolo la primera vez)"""
+        return self.content if self.content is not None else self.load()
+
+    def poll(self) -> bool:
+        """Recargar si el archivo cambió; devuelve True si hubo recarga"""
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_interval:
+            return False
+        self._last_poll = now
+
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return False
+        if mtime_ns == self._mtime_ns:
+            return False
+
+        try:
+            self.load()
+            return True
+        except (OSError, ValueError) as e:
+            # Conservar el contenido anterior y no reintentar hasta el próximo cambio
+            logger.error("Error al recargar contenido: %s", e)
+            self._mtime_ns = mtime_ns
+            return False
+
+    def _cache_key(self, stat: os.stat_result) -> Tuple:
+        """Clave de la caché: formato, versión de Python y archivo"""
+        return (CACHE_VERSION, sys.version_info[:2], stat.st_mtime_ns, stat.st_size)
+
+    def _read_cache(self, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Leer la caché binaria si corresponde al archivo actual"""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cached = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if not isinstance(cached, dict) or cached.get("format") != (CACHE_VERSION, sys.version_info[:2]):
+            return None
+        if cached.get("key") == self._cache_key(stat):
+            return cached["content"]
+
+        # Cambió la fecha pero quizá no el contenido: comparar el hash
+        with open(self.path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        if cached.get("sha256") != digest:
+            return None
+        self._write_cache(stat, digest, cached["content"])
+        return cached["content"]
+
+    def _write_cache(self, stat: os.stat_result, digest: str, compiled: Dict[str, Any]):
+        """Guardar la caché binaria (los errores no son fatales)"""
+        payload = {
+            "format": (CACHE_VERSION, sys.version_info[:2]),
+            "key": self._cache_key(stat),
+            "sha256": digest,
+            "content": compiled,
+        }
+        temp_path = self.cache_path + ".tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                marshal.dump(payload, f)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.warning("No se pudo escribir la caché de contenido: %s", e)
+
+_default_loader: Optional[ContentLoader] = None
+_default_lock = threading.Lock()
+
+def get_content_loader() -> ContentLoader:
+    """Obtener el cargador compartido de contenido"""
+    global _default_loader
+    if _default_loader is None:
+        with _default_lock:
+            if _default_loader is None:
+                _default_loader = ContentLoader(Config.GAME_DATA_PATH)
+    return _default_loader
+
+def get_content() -> GameContent:
+    """Obtener el contenido actual del juego"""
+    return get_content_loader().get()
@@ -0,0 +1,56 @@
+"""
+Pila de modificadores de habilidades y anomalías sobre los puzzles
+"""
+
+from typing import Dict, Iterable, NamedTuple, Tuple
+
+class Modifier(NamedTuple):
+    """Aportación de una habilidad o anomalía (los factores se multiplican, los deltas se suman)"""
+    time_scale: float = 1.0  # velocidad del reloj del puzzle
+    time_limit_multiplier: float = 1.0  # sobre el límite base del puzzle
+    visibility_radius: float = 1.0  # >1 reduce las zonas ocultas
+    difficulty_delta: float = 0.0  # dificultad extra de los puzzles nuevos
+
+class EffectiveParameters(NamedTuple):
+    """Resultado de resolver la pila; los puzzles lo leen directamente"""
+    time_scale: float = 1.0
+    time_limit_multiplier: float = 1.0
+    visibility_radius: float = 1.0
+    difficulty_delta: float = 0.0
+
+DEFAULT_PARAMETERS = EffectiveParameters()
+
+class EffectsPipeline:
+    """Resuelve la pila solo cuando cambia; leer los parámetros no cuesta nada"""
+
+    def __init__(self):
+        self.modifiers: Dict[str, Modifier] = {}
+        self.version = 0
+        self._parameters = DEFAULT_PARAMETERS
+        self._resolved_version = 0
+
+    def set_modifiers(self, modifiers: Iterable[Tuple[str, Modifier]]):
+        """Sustituir la pila por los modificadores de las fuentes activas"""
+        modifiers = dict(modifiers)
+        if modifiers != self.modifiers:
+            self.modifiers = modifiers
+            self.version += 1
+
+    @property
+    def parameters(self) -> EffectiveParameters:
+        """Parámetros efectivos (se recalculan solo si la pila cambió)"""
+        if self._resolved_version != self.version:
+            self._parameters = self._resolve()
+            self._resolved_version = self.version
+        return self._parameters
+
+    def _resolve(self) -> EffectiveParameters:
+        """Combinar todos los modificadores de la pila"""
+        time_scale = time_limit = visibility = 1.0
+        difficulty = 0.0
+        for modifier in self.modifiers.values():
+            time_scale *= modifier.time_scale
+            time_limit *= modifier.time_limit_multiplier
+            visibility *= modifier.visibility_radius
+            difficulty += modifier.difficulty_delta
+        return EffectiveParameters(time_scale, time_limit, visibility, difficulty)
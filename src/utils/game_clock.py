@@ -0,0 +1,38 @@
+"""
+Reloj de juego compartido
+"""
+
+from typing import Optional
+
+class GameClock:
+    """Tiempo de juego: avanza con el delta_time de cada actualización, no con el reloj del sistema"""
+
+    def __init__(self):
+        self.time = 0.0
+        self.frame = 0
+        self.alpha = 0.0  # fracción del siguiente paso fijo ya transcurrida (solo para dibujar)
+
+    def tick(self, delta_time: float):
+        """Avanzar el reloj un fotograma"""
+        self.time += delta_time
+        self.frame += 1
+
+    def reset(self):
+        """Volver a cero (al empezar una sesión o una repetición)"""
+        self.time = 0.0
+        self.frame = 0
+        self.alpha = 0.0
+
+# Instancia global del reloj
+_game_clock: Optional[GameClock] = None
+
+def get_game_clock() -> GameClock:
+    """Obtener el reloj de juego compartido"""
+    global _game_clock
+    if _game_clock is None:
+        _game_clock = GameClock()
+    return _game_clock
+
+def game_time() -> float:
+    """Segundos de juego transcurridos (sustituye a time.time() en la lógica)"""
+    return get_game_clock().time
@@ -0,0 +1,66 @@
+"""
+Atlas de glifos para los símbolos de los puzzles
+"""
+
+import arcade
+from typing import Dict, Optional, Tuple
+
+GlyphKey = Tuple[str, int, Tuple[int, ...], bool]
+
+class GlyphAtlas:
+    """Rasteriza cada símbolo una sola vez por tamaño y color en el atlas de texturas"""
+
+    def __init__(self, font_name: Optional[str] = None):
+        self.font_name = font_name
+        self._textures: Dict[GlyphKey, arcade.Texture] = {}
+
+    def get_texture(self, symbol: str, font_size: int, color, bold: bool = False) -> arcade.Texture:
+        """Obtener la textura de un símbolo (se rasteriza la primera vez)"""
+        key = (symbol, font_size, tuple(color), bold)
+        texture = self._textures.get(key)
+        if texture is None:
+            texture = self._rasterize(key)
+            self._textures[key] = texture
+        return texture
+
+    def _rasterize(self, key: GlyphKey) -> arcade.Texture:
+        """Dibujar el símbolo en una región propia del atlas compartido"""
+        symbol, font_size, color, bold = key
+        text = arcade.Text(
+            symbol, 0, 0, color,
+            font_size=font_size,
+            font_name=self.font_name or ("calibri", "arial"),
+            bold=bold,
+            anchor_y="baseline"
+        )
+        width = max(1, int(text.right - text.left) + 2)
+        height = max(1, int(text.top - text.bottom) + 2)
+        text.x = 1 - text.left
+        text.y = 1 - text.bottom
+
+        # Nombre único: el atlas deduplica las texturas por nombre
+        texture = arcade.Texture.create_empty(f"glyph:{symbol}:{font_size}:{color}:{bold}", (width, height))
+        atlas = arcade.get_window().ctx.default_atlas
+        atlas.add(texture)
+        with atlas.render_into(texture) as framebuffer:
+            framebuffer.clear(color=arcade.color.TRANSPARENT_BLACK)
+            text.draw()
+        return texture
+
+    def create_sprite(self, symbol: str, font_size: int, color, x: float, y: float,
+                      bold: bool = False) -> arcade.Sprite:
+        """Crear un sprite centrado en (x, y) para un símbolo"""
+        return arcade.Sprite(self.get_texture(symbol, font_size, color, bold), center_x=x, center_y=y)
+
+    def clear(self):
+        """Olvidar las texturas (por ejemplo al recrear la ventana)"""
+        self._textures.clear()
+
+_atlas: Optional[GlyphAtlas] = None
+
+def get_glyph_atlas() -> GlyphAtlas:
+    """Obtener el atlas de glifos compartido"""
+    global _atlas
+    if _atlas is None:
+        _atlas = GlyphAtlas()
+    return _atlas
@@ -0,0 +1,134 @@
+"""
+Iluminación con texturas de resplandor precalculadas y mezcla aditiva
+"""
+
+import math
+import arcade
+import numpy as np
+from PIL import Image
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from utils.game_clock import game_time
+
+# Perfiles de luz (cada uno es una textura blanca que se tiñe con el color del sprite)
+GLOW = "glow"  # caída suave hasta el borde
+FLAME = "flame"  # disco brillante con el borde difuminado
+
+TEXTURE_SIZE = 256
+
+# Mezcla aditiva ponderada por la opacidad del sprite (BLEND_ADDITIVE de arcade la ignora)
+ADDITIVE_ALPHA = (arcade.gl.SRC_ALPHA, arcade.gl.ONE)
+
+class Light(NamedTuple):
+    """Fuente de luz: el radio es el del resplandor completo y la intensidad su opacidad máxima"""
+    x: float
+    y: float
+    radius: float
+    color: Tuple[int, int, int]
+    intensity: float = 1.0
+    kind: str = GLOW
+    flicker: float = 0.0  # amplitud del parpadeo (0 = luz fija)
+
+def _falloff(kind: str, distance: np.ndarray) -> np.ndarray:
+    """Opacidad según la distancia normalizada al centro (0 en el centro, 1 en el borde)"""
+    inside = np.clip(1.0 - distance, 0.0, 1.0)
+    if kind == FLAME:
+        return np.clip(inside / 0.25, 0.0, 1.0)
+    return inside * inside
+
+def _build_texture(kind: str) -> arcade.Texture:
+    """Rasterizar un perfil de luz una sola vez"""
+    coords = (np.arange(TEXTURE_SIZE) + 0.5) / TEXTURE_SIZE * 2.0 - 1.0
+    distance = np.hypot(coords[None, :], coords[:, None])
+    rgba = np.full((TEXTURE_SIZE, TEXTURE_SIZE, 4), 255, dtype=np.uint8)
+    rgba[..., 3] = (_falloff(kind, distance) * 255).astype(np.uint8)
+    return arcade.Texture(Image.fromarray(rgba, 'RGBA'), hash=f"light:{kind}:{TEXTURE_SIZE}")
+
+_textures: Dict[str, arcade.Texture] = {}
+
+def light_texture(kind: str) -> arcade.Texture:
+    """Textura de un perfil de luz (se genera la primera vez)"""
+    texture = _textures.get(kind)
+    if texture is None:
+        texture = _textures[kind] = _build_texture(kind)
+    return texture
+
+def torch_lights(positions: Sequence[Tuple[float, float]], flame_radius: float, glow_radius: float,
+                 color: Tuple[int, int, int]) -> List[Light]:
+    """Llama y resplandor de cada antorcha, con parpadeo"""
+    # Núcleo más anaranjado: la mezcla aditiva lo aclara sobre la piedra
+    flame_color = (color[0], int(color[1] * 0.8), int(color[2] * 0.5))
+    lights = []
+    for x, y in positions:
+        lights.append(Light(x, y, glow_radius, color, 0.35, GLOW, 0.3))
+        lights.append(Light(x, y, flame_radius, flame_color, 0.8, FLAME, 0.15))
+    return lights
+
+class LightLayer:
+    """Luces de una pantalla en un SpriteList aditivo; solo se tocan los sprites que cambian"""
+
+    def __init__(self):
+        self.sprites = arcade.SpriteList()
+        self.lights: List[Optional[Light]] = []
+        self._flickering: List[int] = []
+
+    def draw(self, lights: Sequence[Light]):
+        """Dibujar todas las luces con una sola llamada"""
+        self._sync(lights)
+        if not self.sprites:
+            return
+
+        # El parpadeo solo cambia la opacidad de los sprites, no su geometría
+        if self._flickering:
+            now = game_time()
+            for index in self._flickering:
+                light = self.lights[index]
+                self.sprites[index].alpha = int(255 * light.intensity * _flicker(light, now))
+
+        self.sprites.draw(blend_function=ADDITIVE_ALPHA)
+
+    def _sync(self, lights: Sequence[Light]):
+        """Actualizar los sprites cuyas luces cambiaron desde el último dibujo"""
+        changed = False
+        for index, light in enumerate(lights):
+            if index == len(self.sprites):
+                self.sprites.append(arcade.Sprite(light_texture(light.kind)))
+                self.lights.append(None)
+            if self.lights[index] == light:
+                continue
+
+            sprite = self.sprites[index]
+            previous = self.lights[index]
+            if previous is None or previous.kind != light.kind:
+                sprite.texture = light_texture(light.kind)
+            sprite.position = (light.x, light.y)
+            sprite.width = sprite.height = light.radius * 2
+            sprite.color = (*light.color[:3], int(255 * light.intensity))
+            sprite.visible = True
+            self.lights[index] = light
+            changed = True
+
+        # Sobran sprites de un dibujo anterior con más luces
+        for index in range(len(lights), len(self.sprites)):
+            if self.lights[index] is not None:
+                self.sprites[index].visible = False
+                self.lights[index] = None
+                changed = True
+
+        if changed:
+            self._flickering = [index for index, light in enumerate(self.lights)
+                                if light is not None and light.flicker > 0]
+
+def _flicker(light: Light, now: float) -> float:
+    """Factor de parpadeo reproducible a partir del tiempo de juego y la posición"""
+    phase = light.x * 0.013 + light.y * 0.029
+    wave = 0.6 * math.sin(now * 7.3 + phase) + 0.4 * math.sin(now * 12.9 + phase * 2.1)
+    return 1.0 - light.flicker * (0.5 + 0.5 * wave)
+
+_layers: Dict[str, LightLayer] = {}
+
+def get_light_layer(name: str) -> LightLayer:
+    """Capa de luces con nombre (una por pantalla o uso)"""
+    layer = _layers.get(name)
+    if layer is None:
+        layer = _layers[name] = LightLayer()
+    return layer
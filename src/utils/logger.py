@@ -0,0 +1,190 @@
+"""
+Registro estructurado asíncrono (JSON por líneas en logs/)
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+from typing import Any, Dict, Optional, Tuple
+from utils.game_clock import game_time
+
+# Todos los subsistemas cuelgan de este logger: codice.puzzles, codice.audio, ...
+ROOT_LOGGER = "codice"
+
+# Atributos estándar de LogRecord; el resto son campos extra del mensaje
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+def get_logger(subsystem: str) -> logging.Logger:
+    """Logger de un subsistema"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{subsystem}")
+
+class JsonLineFormatter(logging.Formatter):
+    """Un objeto JSON por línea con los campos extra del mensaje"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": round(record.created, 3),
+            "level": record.levelname,
+            "subsystem": record.name[len(ROOT_LOGGER) + 1:] or ROOT_LOGGER,
+            "message": record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class RateLimitFilter(logging.Filter):
+    """Deja pasar como mucho `limit` mensajes iguales por ventana de `window` segundos"""
+
+    # Más plantillas distintas que esto y se olvidan las ventanas (evita crecer sin límite)
+    MAX_KEYS = 1024
+
+    def __init__(self, limit: int = 5, window: float = 10.0):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self._windows: Dict[Tuple[str, int, Any], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Se agrupa por plantilla, no por mensaje ya formateado
+        key = (record.name, record.levelno, record.msg)
+        now = time.monotonic()
+        state = self._windows.get(key)
+        if state is None or now - state[0] >= self.window:
+            if len(self._windows) >= self.MAX_KEYS:
+                self._windows.clear()
+            suppressed = state[2] if state else 0
+            self._windows[key] = [now, 1, 0]
+            if suppressed:
+                record.suppressed = suppressed
+            return True
+
+        state[1] += 1
+        if state[1] > self.limit:
+            state[2] += 1
+            return False
+        return True
+
+class GameTimeFilter(logging.Filter):
+    """Añade el tiempo de juego para cruzar el registro con las grabaciones de entrada"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.game_time = round(game_time(), 3)
+        return True
+
+class ThreadQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler para un hilo del mismo proceso: sin copiar el registro ni formatear la excepción"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Fijar el texto ahora por si los argumentos cambian antes de escribirse
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+class LoggingService:
+    """Cola en el hilo del juego y un hilo que escribe a disco y consola"""
+
+    def __init__(self):
+        self.queue_handler: Optional[ThreadQueueHandler] = None
+        self.console_handler: Optional[logging.Handler] = None
+        self.rate_limit: Optional[RateLimitFilter] = None
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        self.log_path = ""
+
+    def setup(self, config):
+        """Configurar los manejadores según la configuración (solo la primera vez)"""
+        if self.listener is not None:
+            self.apply_levels(config)
+            return
+
+        handlers = []
+        try:
+            os.makedirs(config.LOG_DIR, exist_ok=True)
+            self.log_path = os.path.join(config.LOG_DIR, "codice.jsonl")
+            file_handler = logging.handlers.RotatingFileHandler(
+                self.log_path, maxBytes=config.LOG_MAX_BYTES, backupCount=config.LOG_BACKUPS,
+                encoding='utf-8'
+            )
+            file_handler.setFormatter(JsonLineFormatter())
+            handlers.append(file_handler)
+        except OSError as e:
+            sys.stderr.write(f"No se pudo abrir el registro en {config.LOG_DIR}: {e}\n")
+
+        self.console_handler = logging.StreamHandler(sys.stderr)
+        self.console_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+        handlers.append(self.console_handler)
+
+        # En el hilo del juego solo se filtra y se encola
+        self.rate_limit = RateLimitFilter(config.LOG_RATE_LIMIT, config.LOG_RATE_WINDOW)
+        self.queue_handler = ThreadQueueHandler(queue.SimpleQueue())
+        self.queue_handler.addFilter(self.rate_limit)
+        self.queue_handler.addFilter(GameTimeFilter())
+
+        root = logging.getLogger(ROOT_LOGGER)
+        root.addHandler(self.queue_handler)
+        root.propagate = False
+
+        self.listener = logging.handlers.QueueListener(
+            self.queue_handler.queue, *handlers, respect_handler_level=True
+        )
+        self.listener.start()
+        atexit.register(self.shutdown)
+        self.apply_levels(config)
+
+        # Los niveles se pueden cambiar en caliente desde data/user_config.json
+        from utils.config import get_config_service
+        get_config_service().subscribe(self.on_config_changed)
+
+    def apply_levels(self, config):
+        """Nivel general, de consola y por subsistema (LOG_SUBSYSTEM_LEVELS="audio=WARNING,...")"""
+        logging.getLogger(ROOT_LOGGER).setLevel(_parse_level(config.LOG_LEVEL, logging.INFO))
+        if self.console_handler is not None:
+            self.console_handler.setLevel(_parse_level(config.LOG_CONSOLE_LEVEL, logging.WARNING))
+
+        for assignment in filter(None, (part.strip() for part in config.LOG_SUBSYSTEM_LEVELS.split(","))):
+            subsystem, _, level = assignment.partition("=")
+            get_logger(subsystem.strip()).setLevel(_parse_level(level, logging.NOTSET))
+
+    def on_config_changed(self, changed: Dict[str, Any]):
+        """Aplicar niveles modificados sin reiniciar"""
+        if any(name.startswith("LOG_") for name in changed):
+            from utils.config import get_config
+            self.apply_levels(get_config())
+
+    def shutdown(self):
+        """Vaciar la cola y detener el hilo de escritura"""
+        if self.listener is None:
+            return
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+        logging.getLogger(ROOT_LOGGER).removeHandler(self.queue_handler)
+        self.listener = None
+
+def _parse_level(name: str, default: int) -> int:
+    """Nombre de nivel (INFO, DEBUG, ...) a su valor numérico"""
+    level = logging.getLevelName(str(name).strip().upper())
+    return level if isinstance(level, int) else default
+
+# Instancia global del servicio de registro
+_logging_service: Optional[LoggingService] = None
+
+def get_logging_service() -> LoggingService:
+    """Obtener el servicio de registro compartido"""
+    global _logging_service
+    if _logging_service is None:
+        _logging_service = LoggingService()
+    return _logging_service
+
+def setup_logging(config):
+    """Arrancar el registro asíncrono con la configuración dada"""
+    get_logging_service().setup(config)
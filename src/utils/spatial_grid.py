@@ -0,0 +1,47 @@
+"""
+Índice espacial de rejilla uniforme
+"""
+
+import math
+from typing import Any, Dict, List, Set, Tuple
+
+class SpatialGrid:
+    """Rejilla uniforme para consultar elementos dentro de un rectángulo"""
+
+    def __init__(self, cell_size: float = 200.0):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Any]] = {}
+
+    def clear(self):
+        """Vaciar el índice"""
+        self.cells.clear()
+
+    def _cell_range(self, left: float, right: float, bottom: float, top: float):
+        """Obtener el rango de celdas que cubre un rectángulo"""
+        return (
+            math.floor(left / self.cell_size), math.floor(right / self.cell_size),
+            math.floor(bottom / self.cell_size), math.floor(top / self.cell_size)
+        )
+
+    def insert(self, item: Any, left: float, right: float, bottom: float, top: float):
+        """Insertar un elemento ocupando el rectángulo indicado"""
+        x0, x1, y0, y1 = self._cell_range(left, right, bottom, top)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.cells.setdefault((cx, cy), []).append(item)
+
+    def insert_point(self, item: Any, x: float, y: float, radius: float = 0.0):
+        """Insertar un elemento circular"""
+        self.insert(item, x - radius, x + radius, y - radius, y + radius)
+
+    def query(self, left: float, right: float, bottom: float, top: float) -> Set[Any]:
+        """Obtener los elementos que pueden intersectar el rectángulo"""
+        found = set()
+        x0, x1, y0, y1 = self._cell_range(left, right, bottom, top)
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return found
@@ -0,0 +1,159 @@
+"""
+Interpolaciones (tweens) en lote: todas avanzan en un solo paso vectorizado por fotograma
+"""
+
+from typing import NamedTuple
+import numpy as np
+
+# Identificadores de easing (fila de la tabla EASING_TABLES)
+LINEAR = 0
+EASE_IN_OUT_CUBIC = 1
+EASE_IN_QUAD = 2
+EASE_OUT_QUAD = 3
+PULSE = 4  # 0 -> 1 -> 0 suave; pensado para tweens en bucle
+
+# Muestras por tabla; entre muestras se interpola linealmente
+EASING_SAMPLES = 1024
+
+def _build_easing_tables() -> np.ndarray:
+    """Precalcular todas las curvas de easing"""
+    t = np.linspace(0.0, 1.0, EASING_SAMPLES)
+    tables = np.empty((5, EASING_SAMPLES), dtype=np.float64)
+    tables[LINEAR] = t
+    # Misma curva que helpers.ease_in_out_cubic
+    tables[EASE_IN_OUT_CUBIC] = np.where(t < 0.5, 4 * t ** 3, 1 - (-2 * t + 2) ** 3 / 2)
+    tables[EASE_IN_QUAD] = t * t
+    tables[EASE_OUT_QUAD] = 1 - (1 - t) ** 2
+    tables[PULSE] = np.sin(np.pi * t) ** 2
+    return tables
+
+EASING_TABLES = _build_easing_tables()
+_FLAT_TABLES = EASING_TABLES.ravel()
+
+class TweenHandle(NamedTuple):
+    """Referencia a un tween; deja de ser válida cuando su ranura se reutiliza"""
+    slot: int
+    generation: int
+
+class TweenSystem:
+    """Tweens guardados en arrays de NumPy con ranuras reutilizables"""
+
+    def __init__(self, capacity: int = 64):
+        self.count = 0  # ranuras usadas alguna vez (el paso solo recorre estas)
+        self.free_slots = []
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        """Crear o ampliar los arrays conservando los tweens existentes"""
+        def grow(old, dtype, fill=0):
+            new = np.full(capacity, fill, dtype=dtype)
+            if old is not None:
+                new[:len(old)] = old
+            return new
+
+        self.capacity = capacity
+        self.start = grow(getattr(self, 'start', None), np.float64)
+        self.span = grow(getattr(self, 'span', None), np.float64)  # final - inicial
+        self.elapsed = grow(getattr(self, 'elapsed', None), np.float64)
+        self.duration = grow(getattr(self, 'duration', None), np.float64, 1.0)
+        self.rate = grow(getattr(self, 'rate', None), np.float64, 1.0)  # 1 / duración
+        self.table_offset = grow(getattr(self, 'table_offset', None), np.intp)  # easing * EASING_SAMPLES
+        # Banderas como 0.0/1.0 para usarlas como factores sin conversiones en cada paso
+        self.loop = grow(getattr(self, 'loop', None), np.float64)
+        self.active = grow(getattr(self, 'active', None), np.float64)
+        self.values = grow(getattr(self, 'values', None), np.float64)
+        self.generation = grow(getattr(self, 'generation', None), np.int64)
+
+    def start_tween(self, start: float, end: float, duration: float,
+                    easing: int = EASE_IN_OUT_CUBIC, loop: bool = False) -> TweenHandle:
+        """Empezar un tween de `start` a `end` en `duration` segundos"""
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.count == self.capacity:
+                self._allocate(self.capacity * 2)
+            slot = self.count
+            self.count += 1
+
+        duration = max(duration, 1e-6)
+        self.start[slot] = start
+        self.span[slot] = end - start
+        self.elapsed[slot] = 0.0
+        self.duration[slot] = duration
+        self.rate[slot] = 1.0 / duration
+        self.table_offset[slot] = easing * EASING_SAMPLES
+        self.loop[slot] = loop
+        self.active[slot] = 1.0
+        self.values[slot] = start
+        self.generation[slot] += 1
+        return TweenHandle(slot, int(self.generation[slot]))
+
+    def fade(self, start: float, end: float, duration: float) -> TweenHandle:
+        """Transición única (paneles, anomalías)"""
+        return self.start_tween(start, end, duration, EASE_IN_OUT_CUBIC)
+
+    def pulse(self, low: float, high: float, period: float) -> TweenHandle:
+        """Pulso continuo entre `low` y `high` (nodos, brillos)"""
+        return self.start_tween(low, high, period, PULSE, loop=True)
+
+    def is_valid(self, handle: TweenHandle) -> bool:
+        """Si el handle sigue apuntando a su tween"""
+        return self.generation[handle.slot] == handle.generation
+
+    def value(self, handle: TweenHandle, default: float = 0.0) -> float:
+        """Valor actual (el final si ya terminó; `default` si la ranura se reutilizó)"""
+        if handle is None or not self.is_valid(handle):
+            return default
+        return float(self.values[handle.slot])
+
+    def is_finished(self, handle: TweenHandle) -> bool:
+        """Si el tween ya terminó o fue cancelado"""
+        return not self.is_valid(handle) or not self.active[handle.slot]
+
+    def cancel(self, handle: TweenHandle):
+        """Detener un tween y liberar su ranura"""
+        if self.is_valid(handle) and self.active[handle.slot]:
+            self.active[handle.slot] = 0.0
+            self.free_slots.append(handle.slot)
+
+    def update(self, delta_time: float):
+        """Avanzar todos los tweens activos"""
+        count = self.count
+        if count == 0:
+            return
+        active = self.active[:count]
+        elapsed = self.elapsed[:count]
+        loop = self.loop[:count]
+
+        elapsed += active * delta_time
+        # Los tweens en bucle vuelven a empezar; el resto se detiene al llegar a 1
+        progress = elapsed * self.rate[:count]
+        laps = np.floor(progress)
+        laps *= loop
+        elapsed -= laps * self.duration[:count]
+        progress -= laps
+        np.minimum(progress, 1.0, out=progress)
+
+        # Consulta a la tabla con interpolación lineal entre muestras
+        position = progress * (EASING_SAMPLES - 1)
+        index = position.astype(np.intp)
+        np.minimum(index, EASING_SAMPLES - 2, out=index)
+        fraction = position - index
+        index += self.table_offset[:count]
+        low = _FLAT_TABLES.take(index)
+        index += 1
+        eased = _FLAT_TABLES.take(index)
+        eased -= low
+        eased *= fraction
+        eased += low
+
+        # Solo cambian los valores de los tweens activos
+        eased *= self.span[:count]
+        eased += self.start[:count]
+        np.copyto(self.values[:count], eased, where=active > 0)
+
+        finished = (progress >= 1.0) & (active > loop)
+        if finished.any():
+            finished_slots = np.flatnonzero(finished)
+            self.active[finished_slots] = 0.0
+            self.free_slots.extend(finished_slots.tolist())